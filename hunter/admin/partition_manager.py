@@ -0,0 +1,501 @@
+# hunter/admin/partition_manager.py
+# ==========================================================
+# Hunter's Command Console - Partition Manager
+# Native-PostgreSQL replacement for pg_partman's run_maintenance:
+#   - pre-creates monthly partitions for cases, case_content and
+#     acquisition_log a few months ahead
+#   - moves rows that already landed in a <parent>_default
+#     partition into the proper monthly partition
+#   - retires acquisition_log partitions past retention into a
+#     daily per-source rollup, archiving them as .csv.gz
+#   - reports partition sizes
+# Runs over the admin connection (DDL needs the table owner).
+# ==========================================================
+
+import gzip
+import os
+import re
+import sys
+from datetime import datetime, timezone
+
+import psycopg2
+
+# --- Pathing Magic ---
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+# --- End Magic ---
+
+from hunter.admin.migration_manager import get_admin_db_connection
+
+SCHEMA = "almanac"
+
+# parent -> (partition key, keyset column for batched copies)
+PARTITIONED_TABLES = {
+	"cases":           ("publication_date", "id"),
+	"case_content":    ("publication_date", "case_id"),
+	"acquisition_log": ("seen_at", "id"),
+}
+# Moved together: case_content (and media_evidence) reference cases with ON DELETE CASCADE.
+LINKED_PARENTS = ("cases", "case_content")
+
+DEFAULT_MONTHS_AHEAD = 3
+DEFAULT_BATCH_SIZE = 10000
+
+_BOUND_RE = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+# --- Catalog Helpers ---
+
+def list_partitions(conn, parent: str) -> list:
+	"""[(name, lower, upper)] for a parent, oldest first; the DEFAULT partition has (None, None)."""
+	with conn.cursor() as cur:
+		cur.execute("""
+			SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+			FROM pg_inherits i
+					 JOIN pg_class c ON c.oid = i.inhrelid
+			WHERE i.inhparent = %s::regclass;
+		""", (f"{SCHEMA}.{parent}",))
+		rows = cur.fetchall()
+	partitions = []
+	for name, expr in rows:
+		match = _BOUND_RE.search(expr or "")
+		if match:
+			partitions.append((name, datetime.fromisoformat(match.group(1)), datetime.fromisoformat(match.group(2))))
+		else:
+			partitions.append((name, None, None))
+	return sorted(partitions, key=lambda p: (p[1] is not None, p[1] or datetime.min.replace(tzinfo=timezone.utc)))
+
+
+def _default_partition(partitions: list):
+	return next((name for name, lower, _ in partitions if lower is None), None)
+
+
+def _add_month(ts: datetime) -> datetime:
+	"""The first of the next month; ts must itself be a first (other days may not exist next month)."""
+	assert ts.day == 1, f"_add_month() needs the first of a month, got {ts:%Y-%m-%d}"
+	return ts.replace(year=ts.year + ts.month // 12, month=ts.month % 12 + 1)
+
+
+def _partition_name(parent: str, lower: datetime) -> str:
+	# Same convention as the existing partitions: <parent>_pYYYYMMDD of the lower bound
+	return f"{parent}_p{lower.astimezone(timezone.utc):%Y%m%d}"
+
+
+def planned_months(conn, months_ahead: int = DEFAULT_MONTHS_AHEAD) -> list:
+	"""
+	Monthly (lower, upper) bounds still missing, continuing the existing chain of
+	bounds (so no gaps or overlaps) until it reaches months_ahead past today.
+	"""
+	# Start from the parent that lags furthest behind; create_month() skips months that already exist.
+	newest = []
+	for parent in PARTITIONED_TABLES:
+		uppers = [upper for _, _, upper in list_partitions(conn, parent) if upper]
+		if uppers:
+			newest.append(max(uppers))
+	if newest:
+		lower = min(newest)
+	else:
+		lower = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+	conn.rollback()
+
+	horizon = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+	for _ in range(months_ahead + 1):
+		horizon = _add_month(horizon)
+
+	months = []
+	while lower < horizon:
+		upper = _add_month(lower)
+		months.append((lower, upper))
+		lower = upper
+	return months
+
+
+def _count_in_default(cur, parent: str, default: str, lower: datetime, upper: datetime) -> int:
+	key = PARTITIONED_TABLES[parent][0]
+	cur.execute(f'SELECT COUNT(*) FROM {SCHEMA}."{default}" WHERE {key} >= %s AND {key} < %s', (lower, upper))
+	return cur.fetchone()[0]
+
+
+def _create_standalone(cur, parent: str, name: str):
+	# Indexes come along so ATTACH can adopt them instead of building new ones
+	cur.execute(f'CREATE TABLE IF NOT EXISTS {SCHEMA}."{name}" (LIKE {SCHEMA}.{parent} '
+	            f'INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES INCLUDING STORAGE)')
+
+
+def _attach(cur, parent: str, name: str, lower: datetime, upper: datetime):
+	cur.execute(f'ALTER TABLE {SCHEMA}.{parent} ATTACH PARTITION {SCHEMA}."{name}" FOR VALUES FROM (%s) TO (%s)',
+	            (lower, upper))
+
+
+# --- Partition Creation ---
+
+def create_month(conn, parent: str, lower: datetime, upper: datetime, batch_size: int = DEFAULT_BATCH_SIZE,
+                 dry_run: bool = False) -> str:
+	"""
+	Creates one monthly partition of `parent`. If the DEFAULT partition already
+	holds rows for that month they are moved into it. Returns a status string.
+	"""
+	partitions = list_partitions(conn, parent)
+	name = _partition_name(parent, lower)
+	if any(p[0] == name for p in partitions):
+		return "exists"
+	default = _default_partition(partitions)
+
+	with conn.cursor() as cur:
+		pending = _count_in_default(cur, parent, default, lower, upper) if default else 0
+	conn.rollback()
+	if dry_run:
+		return f"would create ({pending} rows to move from {default})" if pending else "would create"
+
+	if not pending:
+		with conn.cursor() as cur:
+			cur.execute(f'CREATE TABLE {SCHEMA}."{name}" PARTITION OF {SCHEMA}.{parent} '
+			            f'FOR VALUES FROM (%s) TO (%s)', (lower, upper))
+		conn.commit()
+		return "created"
+
+	if parent in LINKED_PARENTS:
+		raise ValueError(f"{parent} rows for {lower:%Y-%m} must be moved with move_linked_month()")
+	moved = _move_append_only(conn, parent, default, name, lower, upper, batch_size)
+	return f"created, moved {moved} rows from {default}"
+
+
+def _move_append_only(conn, parent: str, default: str, name: str, lower: datetime, upper: datetime,
+                      batch_size: int) -> int:
+	"""
+	For insert-only tables (acquisition_log). Rows are copied into a standalone
+	table in keyset batches, one commit each, while they stay visible in the
+	DEFAULT partition. A final short transaction locks out writers, moves the
+	whole month out of DEFAULT (skipping rows already copied, so a low id that
+	committed after its batch was scanned isn't lost) and attaches the new table.
+	A standalone table left by a crashed run is resumed from its highest id.
+	"""
+	key, pk = PARTITIONED_TABLES[parent]
+	with conn.cursor() as cur:
+		_create_standalone(cur, parent, name)
+		cur.execute(f'SELECT MAX({pk}), COUNT(*) FROM {SCHEMA}."{name}"')
+		last_id, moved = cur.fetchone()
+	conn.commit()
+	if moved:
+		print(f"[PARTITIONS]:   {name}: resuming after {moved} rows copied by an earlier run...")
+
+	while True:
+		with conn.cursor() as cur:
+			cur.execute(f"""
+				WITH batch AS (
+					SELECT * FROM {SCHEMA}."{default}"
+					WHERE {key} >= %s AND {key} < %s AND (%s::bigint IS NULL OR {pk} > %s)
+					ORDER BY {pk}
+					LIMIT %s
+				)
+				INSERT INTO {SCHEMA}."{name}" SELECT * FROM batch
+				ON CONFLICT DO NOTHING
+				RETURNING {pk}
+			""", (lower, upper, last_id, last_id, batch_size))
+			ids = [row[0] for row in cur.fetchall()]
+		conn.commit()
+		if not ids:
+			break
+		moved += len(ids)
+		last_id = max(ids)
+		print(f"[PARTITIONS]:   {name}: copied {moved} rows...")
+
+	try:
+		with conn.cursor() as cur:
+			cur.execute(f"LOCK TABLE {SCHEMA}.{parent} IN SHARE ROW EXCLUSIVE MODE")
+			# Everything deleted is inserted; the primary key (copied by LIKE) skips what's already there
+			cur.execute(f"""
+				WITH gone AS (
+					DELETE FROM {SCHEMA}."{default}"
+					WHERE {key} >= %s AND {key} < %s
+					RETURNING *
+				)
+				INSERT INTO {SCHEMA}."{name}" SELECT * FROM gone
+				ON CONFLICT DO NOTHING
+			""", (lower, upper))
+			moved += cur.rowcount
+			_attach(cur, parent, name, lower, upper)
+		conn.commit()
+	except Exception:
+		conn.rollback()
+		raise
+	return moved
+
+
+def move_linked_month(conn, lower: datetime, upper: datetime, dry_run: bool = False) -> str:
+	"""
+	Creates the cases + case_content partitions for one month when their DEFAULT
+	partitions already hold rows for it. Both tables are mutable and other tables
+	reference cases with ON DELETE CASCADE, so the move is one transaction with
+	referential actions suspended (session_replication_role = replica). That needs
+	a superuser (or, on PostgreSQL 15+, a granted SET privilege on that parameter);
+	without it the transaction rolls back and the month stays in DEFAULT.
+	"""
+	names = {parent: _partition_name(parent, lower) for parent in LINKED_PARENTS}
+	defaults = {parent: _default_partition(list_partitions(conn, parent)) for parent in LINKED_PARENTS}
+	with conn.cursor() as cur:
+		counts = {parent: _count_in_default(cur, parent, defaults[parent], lower, upper) if defaults[parent] else 0
+		          for parent in LINKED_PARENTS}
+	conn.rollback()
+	summary = ", ".join(f"{counts[p]} {p}" for p in LINKED_PARENTS)
+	if dry_run:
+		return f"would create, moving {summary} rows from DEFAULT"
+
+	try:
+		with conn.cursor() as cur:
+			cur.execute("SET LOCAL session_replication_role = replica")
+			for parent in LINKED_PARENTS:
+				key = PARTITIONED_TABLES[parent][0]
+				cur.execute(f"LOCK TABLE {SCHEMA}.{parent} IN SHARE ROW EXCLUSIVE MODE")
+				_create_standalone(cur, parent, names[parent])
+				if defaults[parent]:
+					cur.execute(f"""
+						WITH moved AS (
+							DELETE FROM {SCHEMA}."{defaults[parent]}"
+							WHERE {key} >= %s AND {key} < %s
+							RETURNING *
+						)
+						INSERT INTO {SCHEMA}."{names[parent]}" SELECT * FROM moved
+					""", (lower, upper))
+			# cases first: attaching case_content re-validates its foreign key against cases
+			for parent in LINKED_PARENTS:
+				_attach(cur, parent, names[parent], lower, upper)
+		conn.commit()
+	except psycopg2.errors.InsufficientPrivilege as e:
+		conn.rollback()
+		return f"left in DEFAULT ({summary} rows): {str(e).strip()}"
+	except Exception:
+		conn.rollback()
+		raise
+	return f"created, moved {summary} rows from DEFAULT"
+
+
+def run_maintenance(months_ahead: int = DEFAULT_MONTHS_AHEAD, batch_size: int = DEFAULT_BATCH_SIZE,
+                    dry_run: bool = False) -> bool:
+	"""Creates every missing monthly partition up to months_ahead, draining DEFAULT as it goes."""
+	conn = get_admin_db_connection()
+	if not conn:
+		print("[PARTITIONS FATAL]: Could not connect to database. Halting.")
+		return False
+	try:
+		with conn.cursor() as cur:
+			cur.execute("SET TIME ZONE 'UTC'")
+		conn.commit()
+
+		months = planned_months(conn, months_ahead)
+		if not months:
+			print("[PARTITIONS]: All partitions already exist.")
+		for lower, upper in months:
+			print(f"[PARTITIONS]: {lower:%Y-%m} ({lower.isoformat()} -> {upper.isoformat()})")
+			linked_pending = False
+			for parent in PARTITIONED_TABLES:
+				try:
+					status = create_month(conn, parent, lower, upper, batch_size, dry_run)
+				except ValueError:
+					linked_pending = True
+					continue
+				print(f"  -> {parent}: {status}")
+			if linked_pending:
+				status = move_linked_month(conn, lower, upper, dry_run)
+				print(f"  -> {' + '.join(LINKED_PARENTS)}: {status}")
+		return True
+	except Exception as e:
+		print(f"[PARTITIONS FATAL ERROR]: {e}")
+		conn.rollback()
+		return False
+	finally:
+		conn.close()
+
+
+# --- acquisition_log Retention ---
+
+LOG_PARENT = "acquisition_log"
+LOG_RETENTION_MONTHS = 3
+# Detached partitions are renamed with this suffix until archived, so a half-finished
+# run is recognisable (and never confused with a partition still being built).
+_RETIRED_SUFFIX = "_retired"
+ARCHIVE_DIR = os.path.join(project_root, "log_archives")
+
+# Folds raw log rows into the daily rollup (migration 006). {source} is a relation or CTE name.
+_ROLLUP_SQL = """
+	INSERT INTO {schema}.acquisition_log_daily AS d (day, source_id, lead_count, first_seen_at, last_seen_at)
+	SELECT (seen_at AT TIME ZONE 'UTC')::date, COALESCE(source_id, 0), COUNT(*), MIN(seen_at), MAX(seen_at)
+	FROM {source}
+	GROUP BY 1, 2
+	ORDER BY 1, 2
+	ON CONFLICT (day, source_id) DO UPDATE
+		SET lead_count    = d.lead_count + EXCLUDED.lead_count,
+			first_seen_at = LEAST(d.first_seen_at, EXCLUDED.first_seen_at),
+			last_seen_at  = GREATEST(d.last_seen_at, EXCLUDED.last_seen_at)
+"""
+
+
+def _sub_months(ts: datetime, months: int) -> datetime:
+	index = ts.year * 12 + ts.month - 1 - months
+	return ts.replace(year=index // 12, month=index % 12 + 1, day=min(ts.day, 28))
+
+
+def _retired_log_tables(conn) -> list:
+	"""Tables detached by an earlier run whose archive/drop step did not finish."""
+	with conn.cursor() as cur:
+		cur.execute("""
+			SELECT c.relname
+			FROM pg_class c
+					 JOIN pg_namespace n ON n.oid = c.relnamespace
+			WHERE n.nspname = %s AND c.relkind = 'r' AND c.relname LIKE %s
+			ORDER BY c.relname;
+		""", (SCHEMA, f"{LOG_PARENT}\\_p%{_RETIRED_SUFFIX}"))
+		names = [row[0] for row in cur.fetchall()]
+	conn.rollback()
+	return names
+
+
+def _export_gzip(cur, query: str, path: str, params=None):
+	"""COPY ... TO STDOUT as gzipped CSV, written to a temp file and renamed once fsynced."""
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	tmp_path = path + ".tmp"
+	copy_sql = cur.mogrify(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", params).decode()
+	# fsync through the writable handle: Windows' FlushFileBuffers refuses a read-only one
+	with open(tmp_path, "wb") as raw:
+		with gzip.GzipFile(fileobj=raw, mode="wb") as f:
+			cur.copy_expert(copy_sql, f)
+		raw.flush()
+		os.fsync(raw.fileno())
+	os.replace(tmp_path, path)
+
+
+def _dispose_detached(conn, name: str, mode: str, archive_dir: str) -> str:
+	"""Archives (if asked) and drops a table that has already been rolled up and detached."""
+	if mode == "archive":
+		path = os.path.join(archive_dir, f"{name.removesuffix(_RETIRED_SUFFIX)}.csv.gz")
+		with conn.cursor() as cur:
+			_export_gzip(cur, f'SELECT * FROM {SCHEMA}."{name}" ORDER BY id', path)
+		conn.rollback()
+	with conn.cursor() as cur:
+		cur.execute(f'DROP TABLE {SCHEMA}."{name}"')
+	conn.commit()
+	return f"archived to {os.path.basename(path)} and dropped" if mode == "archive" else "dropped"
+
+
+def retire_log_partition(conn, name: str, mode: str = "archive", archive_dir: str = ARCHIVE_DIR) -> str:
+	"""
+	Rolls one acquisition_log partition into acquisition_log_daily and detaches it
+	in the same transaction, so no sighting is ever counted in both places. The
+	detached table (renamed <name>_retired) is then archived as
+	<archive_dir>/<name>.csv.gz (mode="archive") and dropped. If the archive step fails the table is left detached; the next
+	run picks it up again without rolling it up twice.
+	"""
+	try:
+		with conn.cursor() as cur:
+			cur.execute(_ROLLUP_SQL.format(schema=SCHEMA, source=f'{SCHEMA}."{name}"'))
+			days = cur.rowcount
+			cur.execute(f'ALTER TABLE {SCHEMA}.{LOG_PARENT} DETACH PARTITION {SCHEMA}."{name}"')
+			cur.execute(f'ALTER TABLE {SCHEMA}."{name}" RENAME TO "{name}{_RETIRED_SUFFIX}"')
+		conn.commit()
+	except Exception:
+		conn.rollback()
+		raise
+	retired = f"{name}{_RETIRED_SUFFIX}"
+	return f"rolled up ({days} day/source rows), detached, " + _dispose_detached(conn, retired, mode, archive_dir)
+
+
+def _retire_default_rows(conn, default: str, cutoff: datetime, mode: str, archive_dir: str) -> str:
+	"""Rolls up and deletes DEFAULT-partition log rows older than cutoff, in one transaction."""
+	where = "seen_at < %s"
+	try:
+		with conn.cursor() as cur:
+			cur.execute(f"LOCK TABLE {SCHEMA}.\"{default}\" IN SHARE ROW EXCLUSIVE MODE")
+			cur.execute(f'SELECT COUNT(*) FROM {SCHEMA}."{default}" WHERE {where}', (cutoff,))
+			count = cur.fetchone()[0]
+			if not count:
+				conn.rollback()
+				return "nothing to retire"
+			if mode == "archive":
+				path = os.path.join(archive_dir, f"{default}-before-{cutoff:%Y%m%d}.csv.gz")
+				_export_gzip(cur, f'SELECT * FROM {SCHEMA}."{default}" WHERE {where} ORDER BY id', path, (cutoff,))
+			cur.execute(f"""
+				WITH gone AS (
+					DELETE FROM {SCHEMA}."{default}" WHERE {where}
+					RETURNING source_id, seen_at
+				)
+			""" + _ROLLUP_SQL.format(schema=SCHEMA, source="gone"), (cutoff,))
+		conn.commit()
+	except Exception:
+		conn.rollback()
+		raise
+	return f"rolled up and removed {count} rows" + (" (archived)" if mode == "archive" else "")
+
+
+def apply_retention(retain_months: int = LOG_RETENTION_MONTHS, mode: str = "archive",
+                    archive_dir: str = ARCHIVE_DIR, dry_run: bool = False) -> bool:
+	"""
+	Keeps raw acquisition_log rows for retain_months. Every monthly partition
+	that ends before the cutoff is rolled up, detached and then archived or
+	dropped (mode "archive" / "drop"); stale rows in DEFAULT get the same treatment.
+	"""
+	if mode not in ("archive", "drop"):
+		raise ValueError(f"Unsupported retention mode: {mode!r}")
+	conn = get_admin_db_connection()
+	if not conn:
+		print("[RETENTION FATAL]: Could not connect to database. Halting.")
+		return False
+	try:
+		with conn.cursor() as cur:
+			cur.execute("SET TIME ZONE 'UTC'")
+		conn.commit()
+
+		cutoff = _sub_months(datetime.now(timezone.utc), retain_months)
+		print(f"[RETENTION]: Keeping raw {LOG_PARENT} rows seen since {cutoff:%Y-%m-%d} ({mode} mode).")
+
+		for name in _retired_log_tables(conn):
+			if dry_run:
+				print(f"  -> {name}: would {mode} leftover detached table")
+				continue
+			print(f"  -> {name}: leftover from an earlier run, " + _dispose_detached(conn, name, mode, archive_dir))
+
+		partitions = list_partitions(conn, LOG_PARENT)
+		conn.rollback()
+		expired = [(name, upper) for name, lower, upper in partitions if upper is not None and upper <= cutoff]
+		if not expired:
+			print("[RETENTION]: No partitions past retention.")
+		for name, upper in expired:
+			if dry_run:
+				print(f"  -> {name}: would roll up, detach and {mode}")
+				continue
+			print(f"  -> {name}: " + retire_log_partition(conn, name, mode, archive_dir))
+
+		default = _default_partition(partitions)
+		if default and not dry_run:
+			print(f"  -> {default}: " + _retire_default_rows(conn, default, cutoff, mode, archive_dir))
+		return True
+	except Exception as e:
+		print(f"[RETENTION FATAL ERROR]: {e}")
+		conn.rollback()
+		return False
+	finally:
+		conn.close()
+
+
+# --- Reporting ---
+
+def partition_report(conn=None) -> list:
+	"""[(parent, partition, lower, upper, estimated rows, total bytes)] for every managed parent."""
+	own_conn = conn is None
+	if own_conn:
+		conn = get_admin_db_connection()
+		if not conn:
+			return []
+	try:
+		report = []
+		with conn.cursor() as cur:
+			for parent in PARTITIONED_TABLES:
+				for name, lower, upper in list_partitions(conn, parent):
+					cur.execute("SELECT c.reltuples::bigint, pg_total_relation_size(c.oid) "
+					            "FROM pg_class c WHERE c.oid = %s::regclass", (f'{SCHEMA}."{name}"',))
+					rows, size = cur.fetchone()
+					report.append((parent, name, lower, upper, max(rows, 0), size))
+		conn.rollback()
+		return report
+	finally:
+		if own_conn:
+			conn.close()
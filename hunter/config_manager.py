@@ -87,6 +87,21 @@ def get_logging_config():
 	return {}
 
 
+def get_dispatcher_config():
+	"""Reads the [Dispatcher] settings (mode = threaded | async, async_workers, batch sizes, *_timeout_seconds)."""
+	return dict(_config["Dispatcher"]) if "Dispatcher" in _config else {}
+
+
+def get_rate_limit_config():
+	"""Reads the [RateLimits] settings (global_requests_per_second, global_burst)."""
+	return dict(_config["RateLimits"]) if "RateLimits" in _config else {}
+
+
+def get_scheduler_config():
+	"""Reads the [Scheduler] settings (enabled = run inside the app, default_interval_minutes)."""
+	return dict(_config["Scheduler"]) if "Scheduler" in _config else {}
+
+
 def get_gnews_io_credentials():
 	"""Reads the GNews.io credentials from .env"""
 	api_key = os.getenv('GNEWS_API_KEY')
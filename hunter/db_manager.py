@@ -8,43 +8,233 @@
 # - Admin & Source Utilities
 # ==========================================================
 
+import dataclasses
 import logging
 import os
+import threading
+import time
+import traceback
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, Iterator
 
 import psycopg2
+import psycopg2.extensions
 from psycopg2.extras import register_uuid
 from psycopg2 import pool
 
 from hunter import config_manager
-from hunter.models import LeadData, METADATA_CLASS_MAP, METADATA_EXTRA_FIELDS, Asset, SourceConfig
+from hunter.utils.jsonl_writer import BufferedJSONLWriter
+from hunter.utils.url_canonicalizer import url_hash, raw_url_hash
+from hunter.models import LeadData, LazyMetadata, get_metadata_plan, Asset, SourceConfig, TriageHeader, \
+	StagedLeadHit, CaseSummary, AssetSummary
 
 logger = logging.getLogger("DB Manager")
 
 # --- Thread-Safe Connection Pool ---
+# Sized from config ([PostgreSQL] pool_min / pool_max), then grown by the dispatcher
+# to cover every domain's max_concurrent_requests (see ensure_pool_capacity).
+POOL_MIN_CONN = 1
+POOL_MAX_CONN = 10
+POOL_HEADROOM = 4  # GUI, filing clerk, triage stream, admin calls
+POOL_MAX_CEILING = 64
+POOL_CHECKOUT_TIMEOUT = 30.0  # seconds to wait for a free connection before giving up
+POOL_VALIDATE_IDLE_AFTER = 60.0  # ping connections that sat idle longer than this
+POOL_LEAK_THRESHOLD = 120.0  # connections held longer than this are reported as leaks
+POOL_TRACK_STACKS = True
+
 _pool = None
+_pool_init_lock = threading.Lock()
 
 
-def _get_pool():
-	global _pool
-	if _pool is None:
+class InstrumentedPool:
+	"""
+	ThreadedConnectionPool wrapper. Instead of failing fast when exhausted it waits
+	(up to POOL_CHECKOUT_TIMEOUT), and it keeps the numbers the raw pool doesn't:
+	checkout wait time, in-use count, broken connections discarded on checkout,
+	and the checkout stack of every connection currently held, for leak hunting.
+	"""
+
+	def __init__(self, minconn: int, maxconn: int, dsn: str, **kwargs):
+		self._pool = psycopg2.pool.ThreadedConnectionPool(minconn, maxconn, dsn, **kwargs)
+		self.maxconn = maxconn
+		self._cond = threading.Condition()
+		self._in_use = 0
+		# id(conn) -> (checked out at, checkout stack or None)
+		self._checked_out: Dict[int, Tuple[float, Optional[traceback.StackSummary]]] = {}
+		self._last_released: Dict[int, float] = {}
+		self._stats = {'checkouts': 0, 'waits': 0, 'wait_total': 0.0, 'wait_max': 0.0,
+		               'timeouts': 0, 'broken': 0, 'late_releases': 0}
+
+	def getconn(self, timeout: float = POOL_CHECKOUT_TIMEOUT):
+		start = time.monotonic()
+		with self._cond:
+			if self._in_use >= self.maxconn:
+				self._stats['waits'] += 1
+				self._log_leaks()
+			while self._in_use >= self.maxconn:
+				remaining = start + timeout - time.monotonic()
+				if remaining <= 0:
+					self._stats['timeouts'] += 1
+					raise psycopg2.pool.PoolError(
+							f"Connection pool exhausted: {self._in_use}/{self.maxconn} in use after {timeout:.0f}s")
+				self._cond.wait(remaining)
+			self._in_use += 1
+
 		try:
-			conn_str = config_manager.get_db_connection_string()
-			# Min 1, Max 10 connections. Adjust as needed for your snow-day load.
-			_pool = psycopg2.pool.ThreadedConnectionPool(1, 10, conn_str, options="-c search_path=almanac,public")
-			register_uuid()
-			logger.info("Database Connection Pool initialized.")
-		except Exception as e:
-			logger.critical(f"Failed to initialize Connection Pool: {e}")
+			conn = self._checkout_valid()
+		except Exception:
+			self._free_slot()
 			raise
+
+		waited = time.monotonic() - start
+		stack = traceback.StackSummary.from_list(traceback.extract_stack(limit=12)[:-2]) if POOL_TRACK_STACKS else None
+		with self._cond:
+			self._checked_out[id(conn)] = (time.monotonic(), stack)
+			self._stats['checkouts'] += 1
+			self._stats['wait_total'] += waited
+			self._stats['wait_max'] = max(self._stats['wait_max'], waited)
+		return conn
+
+	def putconn(self, conn, close: bool = False):
+		with self._cond:
+			record = self._checked_out.pop(id(conn), None)
+		if record is None:
+			logger.warning("Released a connection that wasn't checked out from this pool.")
+			self._pool.putconn(conn, close=close)
+			return
+
+		held = time.monotonic() - record[0]
+		if held > POOL_LEAK_THRESHOLD:
+			with self._cond:
+				self._stats['late_releases'] += 1
+			logger.warning(f"Connection held for {held:.0f}s before release. Checked out at:\n"
+			               f"{_format_stack(record[1])}")
+		with self._cond:
+			self._last_released[id(conn)] = time.monotonic()
+		try:
+			self._pool.putconn(conn, close=close or conn.closed)
+		finally:
+			self._free_slot()
+
+	def _free_slot(self):
+		with self._cond:
+			self._in_use -= 1
+			self._cond.notify()
+
+	def _checkout_valid(self):
+		"""Pulls a connection from the raw pool, discarding broken ones."""
+		for _ in range(self.maxconn + 1):
+			conn = self._pool.getconn()
+			if self._is_healthy(conn):
+				return conn
+			with self._cond:
+				self._stats['broken'] += 1
+			logger.warning("Discarding broken pooled connection.")
+			with self._cond:
+				self._last_released.pop(id(conn), None)
+			self._pool.putconn(conn, close=True)
+		raise psycopg2.OperationalError("Could not obtain a healthy database connection.")
+
+	def _is_healthy(self, conn) -> bool:
+		"""Free local checks first; only connections idle for a while get a SELECT 1."""
+		if conn.closed or conn.info.transaction_status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+			return False
+		with self._cond:
+			last_released = self._last_released.get(id(conn))
+		if last_released is None or time.monotonic() - last_released < POOL_VALIDATE_IDLE_AFTER:
+			return True
+		try:
+			with conn.cursor() as cur:
+				cur.execute("SELECT 1")
+			conn.rollback()
+			return True
+		except psycopg2.Error:
+			return False
+
+	def ensure_capacity(self, maxconn: int):
+		"""Raises maxconn (never lowers it). Waiting checkouts are woken up."""
+		with self._cond:
+			if maxconn > self.maxconn:
+				logger.info(f"Growing connection pool from {self.maxconn} to {maxconn}.")
+				self.maxconn = maxconn
+				self._pool.maxconn = maxconn
+				self._cond.notify_all()
+
+	def find_leaks(self, older_than: float = POOL_LEAK_THRESHOLD) -> List[Tuple[float, str]]:
+		"""(seconds held, checkout stack) for every connection held longer than older_than."""
+		now = time.monotonic()
+		with self._cond:
+			held = list(self._checked_out.values())
+		return sorted(((now - at, _format_stack(stack)) for at, stack in held if now - at > older_than),
+		              reverse=True)
+
+	def _log_leaks(self):
+		for seconds, stack in self.find_leaks():
+			logger.warning(f"Possible connection leak: held for {seconds:.0f}s. Checked out at:\n{stack}")
+
+	def stats(self) -> Dict:
+		with self._cond:
+			stats = dict(self._stats)
+			stats['in_use'] = self._in_use
+			stats['maxconn'] = self.maxconn
+		stats['avg_wait_ms'] = stats['wait_total'] / stats['checkouts'] * 1000 if stats['checkouts'] else 0.0
+		stats['max_wait_ms'] = stats.pop('wait_max') * 1000
+		stats.pop('wait_total')
+		stats['leaked'] = len(self.find_leaks())
+		return stats
+
+	def closeall(self):
+		self._pool.closeall()
+
+
+def _format_stack(stack: Optional[traceback.StackSummary]) -> str:
+	if stack is None:
+		return "  (stack tracking disabled; set db_manager.POOL_TRACK_STACKS = True)"
+	return ''.join(stack.format())
+
+
+def _pool_limits() -> Tuple[int, int]:
+	creds = config_manager.get_pgsql_credentials() or {}
+	minconn = int(creds.get('pool_min', POOL_MIN_CONN))
+	maxconn = int(creds.get('pool_max', POOL_MAX_CONN))
+	return minconn, max(minconn, maxconn)
+
+
+def _get_pool() -> InstrumentedPool:
+	global _pool
+	if _pool is None:
+		with _pool_init_lock:
+			if _pool is None:
+				try:
+					conn_str = config_manager.get_db_connection_string()
+					minconn, maxconn = _pool_limits()
+					_pool = InstrumentedPool(minconn, maxconn, conn_str, options="-c search_path=almanac,public")
+					register_uuid()
+					logger.info(f"Database Connection Pool initialized ({minconn}-{maxconn} connections).")
+				except Exception as e:
+					logger.critical(f"Failed to initialize Connection Pool: {e}")
+					raise
 	return _pool
 
 
+def ensure_pool_capacity(concurrent_workers: int):
+	"""Sizes the pool for this many simultaneous DB users plus POOL_HEADROOM, capped at POOL_MAX_CEILING."""
+	_get_pool().ensure_capacity(min(POOL_MAX_CEILING, concurrent_workers + POOL_HEADROOM))
+
+
+def get_pool_stats() -> Dict:
+	"""Checkout counts, wait times, in-use/max, broken and leaked connections."""
+	return _get_pool().stats()
+
+
 def get_conn():
-	"""Returns a connection from the pool. Remember to release it!"""
-	return _get_pool().getconn()
+	"""Returns a connection from the pool. Remember to release it (or use `with connection():`)!"""
+	conn = _get_pool().getconn()
+	if USE_PREPARED_STATEMENTS:
+		_ensure_prepared(conn)
+	return conn
 
 
 def release_conn(conn):
@@ -52,16 +242,164 @@ def release_conn(conn):
 	_get_pool().putconn(conn)
 
 
+@contextmanager
+def connection():
+	"""
+	Checks out a pooled connection and always gives it back:
+
+		with db_manager.connection() as conn:
+			...
+			conn.commit()
+
+	An exception escaping the block rolls the transaction back.
+	"""
+	conn = get_conn()
+	try:
+		yield conn
+	except BaseException:
+		if not conn.closed:
+			conn.rollback()
+		raise
+	finally:
+		release_conn(conn)
+
+
+# --- Prepared-Statement Registry ---
+# Hot statements are PREPAREd once per pooled connection (on checkout) and then
+# run with EXECUTE, so PostgreSQL skips parse/plan on every call. Statements are
+# written with %s placeholders; the PREPARE form is derived from them.
+# name -> (parameter types, SQL text)
+PREPARED_STATEMENTS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+	'router_upsert':        (('integer', 'text', 'bytea', 'timestamptz'), """
+		INSERT INTO acquisition_router
+			(lead_uuid, source_id, item_url, url_hash, publication_date, last_seen_at, status)
+		VALUES (gen_random_uuid(), %s, %s, %s, %s, NOW(), 'NEW')
+		ON CONFLICT (url_hash) DO UPDATE SET last_seen_at = NOW()
+		RETURNING lead_uuid
+	"""),
+	'log_insert':           (('uuid', 'integer'), """
+		INSERT INTO acquisition_log (lead_uuid, source_id, seen_at) VALUES (%s, %s, NOW())
+	"""),
+	'staging_upsert':       (('uuid', 'text', 'text', 'text', 'jsonb'), """
+		INSERT INTO case_data_staging (uuid, title, full_text, full_html, metadata)
+		VALUES (%s, %s, %s, %s, %s)
+		ON CONFLICT (uuid) DO UPDATE SET
+			title = EXCLUDED.title,
+			full_text = EXCLUDED.full_text,
+			full_html = EXCLUDED.full_html,
+			metadata = EXCLUDED.metadata
+	"""),
+	'source_state_success': (('timestamptz', 'timestamptz', 'text', 'integer'), """
+		UPDATE sources
+		SET last_checked_date = %s, last_success_date = %s,
+			consecutive_failures = 0,
+			last_known_item_id = COALESCE(%s, last_known_item_id)
+		WHERE id = %s
+	"""),
+	'source_state_failure': (('integer',), """
+		UPDATE sources
+		SET last_checked_date = NOW(), last_failure_date = NOW(),
+			consecutive_failures = COALESCE(consecutive_failures, 0) + 1
+		WHERE id = %s
+	"""),
+	'lead_by_uuid':         (('uuid',), """
+		SELECT cds.title, cds.full_text, cds.full_html, cds.metadata,
+			   ar.lead_uuid, ar.item_url, ar.publication_date, s.source_name
+		FROM almanac.case_data_staging cds
+				 JOIN almanac.acquisition_router ar ON cds.uuid = ar.lead_uuid
+				 JOIN almanac.sources s ON ar.source_id = s.id
+		WHERE ar.lead_uuid = %s
+	"""),
+}
+USE_PREPARED_STATEMENTS = True
+
+# id(conn) -> backend pid the registry was prepared on. A reconnect (new pid) re-prepares.
+_prepared_conns: Dict[int, int] = {}
+_prepared_lock = threading.Lock()
+
+
+def _to_positional(sql: str) -> str:
+	"""Rewrites %s placeholders as $1, $2, ... for PREPARE."""
+	parts = sql.split('%s')
+	return ''.join(part + (f"${i}" if i < len(parts) else '') for i, part in enumerate(parts, 1))
+
+
+def _is_prepared(conn) -> bool:
+	try:
+		return not conn.closed and _prepared_conns.get(id(conn)) == conn.info.backend_pid
+	except psycopg2.Error:
+		return False
+
+
+def _ensure_prepared(conn):
+	"""PREPAREs the registry on a freshly checked-out connection, once per server session."""
+	if _is_prepared(conn):
+		return
+	try:
+		with conn.cursor() as cur:
+			cur.execute("DEALLOCATE ALL")
+			for name, (arg_types, sql) in PREPARED_STATEMENTS.items():
+				cur.execute(f"PREPARE {name} ({', '.join(arg_types)}) AS {_to_positional(sql)}")
+		conn.commit()
+		with _prepared_lock:
+			_prepared_conns[id(conn)] = conn.info.backend_pid
+	except psycopg2.Error as e:
+		# Not fatal: execute_prepared() falls back to plain SQL on this connection.
+		conn.rollback()
+		logger.warning(f"Could not prepare statements on pooled connection: {e}")
+
+
+def execute_prepared(cur, name: str, params: tuple):
+	"""Runs a registered statement via EXECUTE, or as plain SQL if this connection isn't prepared."""
+	arg_types, sql = PREPARED_STATEMENTS[name]
+	if USE_PREPARED_STATEMENTS and _is_prepared(cur.connection):
+		cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(arg_types))})", params)
+	else:
+		cur.execute(sql, params)
+
 # Alias for legacy compatibility in diagnostic scripts
 get_db_connection = get_conn
 
 
+# --- Process-Wide Source Registry Cache ---
+# source_name -> (source_id, expires_at). Primed by get_domains_with_sources so
+# filing never has to query `sources` by name on the hot path.
+# The cache is per process and nothing invalidates it from outside: edits made
+# elsewhere (tools/source_manager.py, psql) are seen once entries expire, i.e.
+# within SOURCE_CACHE_TTL, or sooner for sources the next hunt re-primes.
+SOURCE_CACHE_TTL = 300  # seconds
+_source_cache: Dict[str, Tuple[int, float]] = {}
+_source_cache_lock = threading.Lock()
+_source_cache_stats = {'hits': 0, 'misses': 0}
+
+
+def _cache_source_ids(mapping: Dict[str, int]):
+	expires_at = time.monotonic() + SOURCE_CACHE_TTL
+	with _source_cache_lock:
+		for name, source_id in mapping.items():
+			_source_cache[name] = (source_id, expires_at)
+
+
+def invalidate_source_cache(source_name: Optional[str] = None):
+	"""Drops one cached source (or all of them) from this process's cache. Call after editing the sources table here."""
+	with _source_cache_lock:
+		if source_name is None:
+			_source_cache.clear()
+		else:
+			_source_cache.pop(source_name, None)
+
+
+def get_source_cache_stats() -> Dict[str, int]:
+	"""Returns hit/miss counters and current size of the source registry cache."""
+	with _source_cache_lock:
+		return {**_source_cache_stats, 'size': len(_source_cache)}
+
+
 def check_database_connection() -> bool:
 	try:
-		conn = get_conn()
-		with conn.cursor() as cur:
-			cur.execute("SELECT 1")
-		release_conn(conn)
+		with connection() as conn:
+			with conn.cursor() as cur:
+				cur.execute("SELECT 1")
 		return True
 	except Exception:
 		return False
@@ -80,35 +418,19 @@ def file_new_lead(lead: LeadData, source_id: int) -> Optional[uuid.UUID]:
 	try:
 		with conn.cursor() as cur:
 			# 1. Router Upsert
-			router_sql = """
-				INSERT INTO acquisition_router 
-					(lead_uuid, source_id, item_url, publication_date, last_seen_at, status)
-				VALUES (gen_random_uuid(), %s, %s, %s, NOW(), 'NEW')
-				ON CONFLICT (item_url) DO UPDATE SET last_seen_at = NOW()
-				RETURNING lead_uuid;
-			"""
-			cur.execute(router_sql, (source_id, lead.url, lead.publication_date))
+			execute_prepared(cur, 'router_upsert',
+			                 (source_id, lead.url, url_hash(lead.url), lead.publication_date))
 			result = cur.fetchone()
 			if not result:
 				raise ValueError("Router failed to return a UUID.")
 			lead_uuid = result[0]
 
 			# 2. Log Entry (Synced UUID)
-			cur.execute("INSERT INTO acquisition_log (lead_uuid, source_id, seen_at) VALUES (%s, %s, NOW())",
-			            (lead_uuid, source_id))
+			execute_prepared(cur, 'log_insert', (lead_uuid, source_id))
 
 			# 3. Staging Data (Synced UUID)
-			staging_sql = """
-				INSERT INTO case_data_staging (uuid, title, full_text, full_html, metadata)
-				VALUES (%s, %s, %s, %s, %s)
-				ON CONFLICT (uuid) DO UPDATE SET 
-					title = EXCLUDED.title,
-					full_text = EXCLUDED.full_text,
-					full_html = EXCLUDED.full_html,
-					metadata = EXCLUDED.metadata;
-			"""
-			meta_json = psycopg2.extras.Json(lead.metadata) if lead.metadata else None
-			cur.execute(staging_sql, (lead_uuid, lead.title, lead.text, lead.html, meta_json))
+			meta_json = _metadata_json(lead.metadata)
+			execute_prepared(cur, 'staging_upsert', (lead_uuid, lead.title, lead.text, lead.html, meta_json))
 
 		conn.commit()
 		return lead_uuid
@@ -120,123 +442,214 @@ def file_new_lead(lead: LeadData, source_id: int) -> Optional[uuid.UUID]:
 		release_conn(conn)
 
 
-def process_triage(results: dict):
+def file_leads_bulk(leads: List[LeadData]) -> Dict[str, Optional[uuid.UUID]]:
+	"""
+	Set-based version of file_new_lead for a whole batch.
+	Router upsert, log insert and staging upsert each go out as one multi-row
+	statement inside a single transaction. Returns {url: lead_uuid or None} for
+	every input URL; spellings that share a url_hash all get that lead's uuid.
+	Leads from a source that isn't in `sources` are not filed (None).
+	If the batch transaction fails, falls back to per-lead filing so one bad
+	lead can't sink the others.
+	"""
+	if not leads:
+		return {}
+
+	hashes = {lead.url: url_hash(lead.url) for lead in leads}
+	results = dict.fromkeys(hashes)
+
+	# Source ids come from the registry cache, not a per-batch query
+	source_ids = {name: get_source_id(name) for name in {lead.source_name for lead in leads}}
+	unknown = sorted(name for name, source_id in source_ids.items() if source_id is None)
+	if unknown:
+		logger.error(f"Not filing leads from unknown sources: {', '.join(map(str, unknown))}")
+
+	# A multi-row ON CONFLICT DO UPDATE can't touch the same row twice, so file one lead per hash
+	by_hash = {}
+	for lead in leads:
+		if source_ids[lead.source_name] is not None:
+			by_hash.setdefault(hashes[lead.url], lead)
+	unique_leads = list(by_hash.values())
+	if not unique_leads:
+		return results
+
 	conn = get_conn()
 	try:
-		if results['CASE']:
-			_promote_cases(results['CASE'])
-		if results['NOT_CASE']:
-			_export_for_training(conn, results['NOT_CASE'])  # Write to file first
-			_mark_ignored(conn, results['NOT_CASE'])
-			_delete_from_staging(conn, results['NOT_CASE'])
-		if results['SKIP']:
-			_mark_ignored(conn, results['SKIP'])
-			_delete_from_staging(conn, results['SKIP'])
+		with conn.cursor() as cur:
+			# 1. Router Upsert
+			router_sql = """
+				INSERT INTO acquisition_router
+					(lead_uuid, source_id, item_url, url_hash, publication_date, last_seen_at, status)
+				VALUES %s
+				ON CONFLICT (url_hash) DO UPDATE SET last_seen_at = NOW()
+				RETURNING lead_uuid, url_hash, source_id;
+			"""
+			router_rows = [(source_ids[lead.source_name], lead.url, hashes[lead.url], lead.publication_date)
+			               for lead in unique_leads]
+			returned = psycopg2.extras.execute_values(
+					cur, router_sql, router_rows,
+					template="(gen_random_uuid(), %s, %s, %s, %s, NOW(), 'NEW')",
+					page_size=len(router_rows), fetch=True
+			)
+			# Map back through the hash: a conflicting row may be stored under a different spelling.
+			uuid_by_hash = {bytes(row[1]): row[0] for row in returned}
+
+			# 2. Log Entries (Synced UUIDs)
+			psycopg2.extras.execute_values(
+					cur, "INSERT INTO acquisition_log (lead_uuid, source_id, seen_at) VALUES %s",
+					[(row[0], row[2]) for row in returned],
+					template="(%s, %s, NOW())", page_size=len(returned)
+			)
+
+			# 3. Staging Data (Synced UUIDs)
+			staging_sql = """
+				INSERT INTO case_data_staging (uuid, title, full_text, full_html, metadata)
+				VALUES %s
+				ON CONFLICT (uuid) DO UPDATE SET
+					title = EXCLUDED.title,
+					full_text = EXCLUDED.full_text,
+					full_html = EXCLUDED.full_html,
+					metadata = EXCLUDED.metadata;
+			"""
+			staging_rows = [
+				(uuid_by_hash[hashes[lead.url]], lead.title, lead.text, lead.html,
+				 _metadata_json(lead.metadata))
+				for lead in unique_leads if hashes[lead.url] in uuid_by_hash
+			]
+			psycopg2.extras.execute_values(cur, staging_sql, staging_rows, page_size=len(staging_rows))
+
 		conn.commit()
-	except:
+		filed = True
+	except Exception as e:
 		conn.rollback()
-		raise
+		filed = False
+		logger.warning(f"Bulk filing of {len(unique_leads)} leads failed, falling back to per-lead filing: {e}")
 	finally:
 		release_conn(conn)
 
+	if not filed:
+		uuid_by_hash = {hashes[lead.url]: file_new_lead(lead, source_ids[lead.source_name]) for lead in unique_leads}
+	results.update((url, uuid_by_hash[h]) for url, h in hashes.items() if h in uuid_by_hash)
+	return results
 
-def _delete_from_staging(conn, leads):
-	SQL_SKIP_CASES = """
-	WITH ids AS (
-		SELECT unnest(%s::uuid[]) AS uuid
-	)
-	DELETE FROM case_data_staging AS cds
-	USING ids
-	WHERE cds.uuid = ids.uuid;
-	"""
-	with conn.cursor() as cur:
-		cur.execute(SQL_SKIP_CASES, (leads,))
 
+# Not-a-case leads are appended here as JSONL for ML training, one shard per day.
+TRAINING_EXPORT_PATH = os.path.join(os.path.dirname(config_manager.CONFIG_FILE), "data", "training_data",
+                                    "not_a_case.jsonl")
+TRAINING_EXPORT_ROTATE = "daily"
+TRAINING_EXPORT_COMPRESS = False
 
-def _mark_ignored(conn, leads):
-	SQL_UPDATE_ROUTER = """
-	WITH ids AS (
-		SELECT unnest(%s::uuid[]) AS uuid
-	)
-	UPDATE acquisition_router ar
-	SET status = 'IGNORED'
-	FROM ids
-	WHERE ar.lead_uuid = ids.uuid;
-	"""
-	with conn.cursor() as cur:
-		cur.execute(SQL_UPDATE_ROUTER, (leads,))
+_training_writer = None
+_training_writer_lock = threading.Lock()
 
 
-def _mark_promoted(conn, leads):
-	SQL_UPDATE_ROUTER = """
-	WITH ids AS (
-		SELECT unnest(%s::uuid[]) AS uuid
-	)
-	UPDATE acquisition_router ar
-	SET status = 'PROMOTED'
-	FROM ids
-	WHERE ar.lead_uuid = ids.uuid;
-	"""
-	with conn.cursor() as cur:
-		cur.execute(SQL_UPDATE_ROUTER, (leads,))
+def get_training_writer() -> BufferedJSONLWriter:
+	"""Lazily starts the background writer behind the training export, resubmitting what a crash left queued."""
+	global _training_writer
+	with _training_writer_lock:
+		if _training_writer is None:
+			_training_writer = BufferedJSONLWriter(TRAINING_EXPORT_PATH, rotate=TRAINING_EXPORT_ROTATE,
+			                                       compress=TRAINING_EXPORT_COMPRESS,
+			                                       on_written=_dequeue_training_exports)
+			_requeue_training_exports(_training_writer)
+		return _training_writer
 
 
-def _export_for_training(conn, uuids):
-	"""Dump not-a-case leads to JSON/CSV for ML training"""
-	import json
-	sql = """
-        SELECT cds.uuid, cds.title, cds.full_text, cds.metadata
-        FROM case_data_staging cds
-        WHERE cds.uuid = ANY(%s::uuid[])
-    """
-	with conn.cursor() as cur:
-		cur.execute(sql, (uuids,))
-		rows = cur.fetchall()
-
-	# Append to training file
-	with open('data/training_data/not_a_case.jsonl', 'a') as f:
-		for row in rows:
-			f.write(json.dumps({
-				'uuid':     str(row[0]),
-				'title':    row[1],
-				'text':     row[2],
-				'metadata': row[3],
-				'label':    'not_a_case'
-			}) + '\n')
-
-
-def _promote_cases(uuids: List[str]):
-	SQL_PROMOTE_CASES = """
-	WITH ids AS (
-		SELECT unnest(%s::uuid[]) AS uuid
-	),
-	inserted AS (
-		INSERT INTO almanac.cases (
-			lead_uuid,
-			public_uuid,
-			title,
-			url,
-			publication_date,
-			status,
-			source_id,
-			source_name
-		)
-		SELECT
-			cds.uuid,
-			gen_random_uuid(),
-			cds.title,
-			ar.item_url,
-			ar.publication_date,
-			'TRIAGED',
-			ar.source_id,
-			s.source_name
-		FROM almanac.case_data_staging AS cds
-		JOIN ids ON cds.uuid = ids.uuid
-		JOIN almanac.acquisition_router ar ON ar.lead_uuid = cds.uuid
-		JOIN almanac.sources s ON s.id = ar.source_id
-		ON CONFLICT (url, publication_date) DO NOTHING
-		RETURNING id AS case_id, lead_uuid, publication_date
+def _requeue_training_exports(writer: BufferedJSONLWriter):
+	"""Resubmits committed export records that never reached the JSONL file (they may be written twice)."""
+	conn = get_conn()
+	try:
+		with conn.cursor() as cur:
+			# Only leads whose triage committed as not-a-case; anything else must never become a training label
+			cur.execute("""
+				SELECT q.lead_uuid, q.record
+				FROM almanac.training_export_queue q
+						 JOIN almanac.acquisition_router ar ON ar.lead_uuid = q.lead_uuid
+				WHERE ar.status = 'IGNORED'
+				ORDER BY q.queued_at;
+			""")
+			rows = cur.fetchall()
+		conn.rollback()
+	except psycopg2.Error as e:
+		logger.error(f"Database error in _requeue_training_exports: {e}")
+		conn.rollback()
+		return
+	finally:
+		release_conn(conn)
+	if rows:
+		logger.info(f"Re-exporting {len(rows)} training records left unflushed by an earlier run.")
+		writer.submit([record for _, record in rows], [str(lead_uuid) for lead_uuid, _ in rows])
+
+
+def _dequeue_training_exports(lead_uuids: list):
+	"""on_written callback: the records are fsynced into the export, so the queue can let them go."""
+	conn = get_conn()
+	try:
+		with conn.cursor() as cur:
+			cur.execute("DELETE FROM almanac.training_export_queue WHERE lead_uuid = ANY(%s::uuid[])", (lead_uuids,))
+		conn.commit()
+	except psycopg2.Error as e:
+		logger.error(f"Database error in _dequeue_training_exports: {e}")
+		conn.rollback()
+	finally:
+		release_conn(conn)
+
+
+def close_training_writer():
+	"""Flushes pending training records to disk. Call on shutdown."""
+	global _training_writer
+	with _training_writer_lock:
+		if _training_writer is not None:
+			_training_writer.close()
+			_training_writer = None
+
+
+# The whole triage decision in one statement. All sub-statements see the same
+# snapshot, so the staging rows are still readable for promotion and export
+# even though the same statement deletes them. Not-a-case records are kept in
+# training_export_queue (migration 011) until the JSONL writer has them on disk.
+SQL_PROCESS_TRIAGE = """
+WITH case_ids AS (
+	SELECT unnest(%(case)s::uuid[]) AS uuid
+),
+not_case_ids AS (
+	SELECT unnest(%(not_case)s::uuid[]) AS uuid
+),
+all_ids AS (
+	SELECT uuid FROM case_ids
+	UNION
+	SELECT uuid FROM not_case_ids
+	UNION
+	SELECT unnest(%(skip)s::uuid[])
+),
+promoted AS (
+	INSERT INTO almanac.cases (
+		lead_uuid,
+		public_uuid,
+		title,
+		url,
+		publication_date,
+		status,
+		source_id,
+		source_name
 	)
+	SELECT
+		cds.uuid,
+		gen_random_uuid(),
+		cds.title,
+		ar.item_url,
+		ar.publication_date,
+		'TRIAGED',
+		ar.source_id,
+		s.source_name
+	FROM almanac.case_data_staging AS cds
+	JOIN case_ids ON cds.uuid = case_ids.uuid
+	JOIN almanac.acquisition_router ar ON ar.lead_uuid = cds.uuid
+	JOIN almanac.sources s ON s.id = ar.source_id
+	ON CONFLICT (url, publication_date) DO NOTHING
+	RETURNING id AS case_id, lead_uuid, publication_date
+),
+promoted_content AS (
 	INSERT INTO almanac.case_content (
 		case_id,
 		lead_uuid,
@@ -245,50 +658,118 @@ def _promote_cases(uuids: List[str]):
 		full_html
 	)
 	SELECT
-		i.case_id,
-		i.lead_uuid,
-		i.publication_date,
+		p.case_id,
+		p.lead_uuid,
+		p.publication_date,
 		cds.full_text,
 		cds.full_html
-	FROM inserted i
-	JOIN almanac.case_data_staging cds ON cds.uuid = i.lead_uuid
-	RETURNING case_id, lead_uuid, publication_date;
-	"""
+	FROM promoted p
+	JOIN almanac.case_data_staging cds ON cds.uuid = p.lead_uuid
+	RETURNING case_id
+),
+marked AS (
+	UPDATE almanac.acquisition_router ar
+	SET status = CASE WHEN ar.lead_uuid IN (SELECT uuid FROM case_ids)
+	                  THEN 'PROMOTED'::almanac.lead_status
+	                  ELSE 'IGNORED'::almanac.lead_status END
+	FROM all_ids
+	WHERE ar.lead_uuid = all_ids.uuid
+	RETURNING ar.lead_uuid
+),
+exported AS (
+	INSERT INTO almanac.training_export_queue (lead_uuid, record)
+	SELECT
+		cds.uuid,
+		jsonb_build_object(
+			'uuid', cds.uuid,
+			'title', cds.title,
+			'text', cds.full_text,
+			'metadata', cds.metadata,
+			'label', 'not_a_case'
+		)
+	FROM almanac.case_data_staging cds
+	JOIN not_case_ids ON cds.uuid = not_case_ids.uuid
+	ON CONFLICT (lead_uuid) DO NOTHING
+	RETURNING lead_uuid, record
+),
+deleted AS (
+	DELETE FROM almanac.case_data_staging AS cds
+	USING all_ids
+	WHERE cds.uuid = all_ids.uuid
+	RETURNING cds.uuid
+)
+SELECT lead_uuid, record FROM exported;
+"""
 
-	conn = get_conn()
-	try:
-		with conn.cursor() as cur:
 
-			# 1. Insert into cases + case_content (atomic pair)
-			cur.execute(SQL_PROMOTE_CASES, (uuids,))
-			inserted_rows = cur.fetchall()  # [(case_id, lead_uuid, publication_date), ...]
+# Callbacks run with the lead uuids a committed process_triage() removed from staging.
+_triage_listeners = []
 
-			# 2. Delete from staging (cds)
-			_delete_from_staging(conn, uuids)
 
-			# 3. Update acquisition_router
-			_mark_promoted(conn, uuids)
+def add_triage_listener(callback):
+	"""Registers callback(lead_uuids); e.g. the dossier cache drops entries for filed leads."""
+	if callback not in _triage_listeners:
+		_triage_listeners.append(callback)
 
-		conn.commit()
-		return inserted_rows
 
-	except Exception as e:
+def process_triage(results: dict):
+	"""
+	Applies a batch of triage decisions ({'CASE': [...], 'NOT_CASE': [...], 'SKIP': [...]})
+	in one round trip and one transaction: promote cases, mark the router,
+	delete from staging, and return the not-a-case rows for the training export.
+	"""
+	params = {
+		'case':     results.get('CASE') or [],
+		'not_case': results.get('NOT_CASE') or [],
+		'skip':     results.get('SKIP') or [],
+	}
+	if not any(params.values()):
+		return
+
+	# Started first, so its crash recovery can't pick up (and double) this batch's queue rows
+	writer = get_training_writer()
+	conn = get_conn()
+	try:
+		with conn.cursor() as cur:
+			cur.execute(SQL_PROCESS_TRIAGE, params)
+			export_rows = cur.fetchall()
+		conn.commit()
+	except:
 		conn.rollback()
-		logger.error(f"Error promoting cases: {e}")
 		raise
-
 	finally:
 		release_conn(conn)
 
+	# Committed, so durable in training_export_queue; the file is written off-thread
+	writer.submit([record for _, record in export_rows], [str(lead_uuid) for lead_uuid, _ in export_rows])
+
+	removed = [lead_uuid for ids in params.values() for lead_uuid in ids]
+	for callback in list(_triage_listeners):
+		try:
+			callback(removed)
+		except Exception as e:
+			logger.warning(f"Triage listener {callback!r} failed: {e}")
+
+
 def check_for_existing_leads_by_url(urls: List[str]) -> List[str]:
-	"""Checks the router for existing URLs to prevent duplicate processing."""
+	"""
+	Checks the router for existing URLs to prevent duplicate processing.
+	Matches on the canonical url_hash and returns the caller's spelling of each hit.
+	Rows tools/backfill_url_hash.py hasn't reached (or couldn't re-hash, as
+	duplicates) still carry the hash of their raw item_url, so that's matched too.
+	"""
 	if not urls:
 		return []
+	urls_by_hash = {}
+	for url in urls:
+		for h in {url_hash(url), raw_url_hash(url)}:
+			urls_by_hash.setdefault(h, []).append(url)
 	conn = get_conn()
 	try:
 		with conn.cursor() as cur:
-			cur.execute("SELECT item_url FROM acquisition_router WHERE item_url = ANY(%s)", (urls,))
-			return [row[0] for row in cur.fetchall()]
+			cur.execute("SELECT url_hash FROM acquisition_router WHERE url_hash = ANY(%s::bytea[])",
+			            ([psycopg2.Binary(h) for h in urls_by_hash],))
+			return list(dict.fromkeys(url for row in cur.fetchall() for url in urls_by_hash.get(bytes(row[0]), [])))
 	except Exception as e:
 		logger.error(f"Error checking existing leads: {e}")
 		return []
@@ -296,6 +777,31 @@ def check_for_existing_leads_by_url(urls: List[str]) -> List[str]:
 		release_conn(conn)
 
 
+def iter_router_urls(since: Optional[datetime] = None, page_size: int = 10000) -> Iterator[List[str]]:
+	"""
+	Streams every known item_url from the router in pages (server-side cursor).
+	With `since`, only URLs first seen at or after that time. Used to warm the
+	filing clerk's URL filter.
+	"""
+	conn = get_conn()
+	try:
+		with conn.cursor(name=f"router_urls_{uuid.uuid4().hex[:8]}") as cur:
+			cur.itersize = page_size
+			if since:
+				cur.execute("SELECT item_url FROM acquisition_router WHERE item_url IS NOT NULL AND first_seen_at >= %s",
+				            (since,))
+			else:
+				cur.execute("SELECT item_url FROM acquisition_router WHERE item_url IS NOT NULL")
+			while True:
+				rows = cur.fetchmany(page_size)
+				if not rows:
+					break
+				yield [row[0] for row in rows]
+	finally:
+		conn.rollback()
+		release_conn(conn)
+
+
 # ==========================================================
 # 2. Retrieval & Rehydration (The Foreman's Domain)
 # ==========================================================
@@ -343,20 +849,268 @@ def get_unprocessed_leads() -> List[LeadData]:
 	return leads
 
 
-def get_lead_by_uuid(lead_uuid: str) -> Optional[LeadData]:
-	"""Rehydrates a single lead by UUID."""
+def iter_triage_headers(page_size: int = 500) -> Iterator[List[TriageHeader]]:
+	"""
+	Streams unprocessed leads as pages of lightweight TriageHeaders.
+	Uses a named (server-side) cursor, so only one page is ever held in memory
+	and full_text/full_html never leave the database. The pooled connection is
+	held until the generator is exhausted or closed.
+	"""
 	conn = get_conn()
 	sql = """
-		  SELECT cds.title, cds.full_text, cds.full_html, cds.metadata,
-				 ar.lead_uuid, ar.item_url, ar.publication_date, s.source_name
+		  SELECT ar.lead_uuid, cds.title, ar.item_url, s.source_name, ar.publication_date
 		  FROM almanac.case_data_staging cds
 				   JOIN almanac.acquisition_router ar ON cds.uuid = ar.lead_uuid
 				   JOIN almanac.sources s ON ar.source_id = s.id
-		  WHERE ar.lead_uuid = %s;
+		  WHERE ar.status = 'NEW'
+		  ORDER BY ar.publication_date DESC;
+	"""
+	try:
+		with conn.cursor(name=f"triage_headers_{uuid.uuid4().hex[:8]}") as cur:
+			cur.itersize = page_size
+			cur.execute(sql)
+			while True:
+				rows = cur.fetchmany(page_size)
+				if not rows:
+					break
+				yield [TriageHeader(lead_uuid=row[0], title=row[1], url=row[2],
+				                    source_name=row[3], publication_date=row[4]) for row in rows]
+	except Exception as e:
+		logger.error(f"Database error in iter_triage_headers: {e}")
+	finally:
+		# Named cursors live inside a transaction; end it before the connection goes back.
+		conn.rollback()
+		release_conn(conn)
+
+
+def get_triage_page(after_cursor: Optional[Tuple[datetime, uuid.UUID]] = None, limit: int = 200,
+                    source_filter: Optional[List[str]] = None
+                    ) -> Tuple[List[TriageHeader], Optional[Tuple[datetime, uuid.UUID]]]:
+	"""
+	Keyset-paginated triage query (newest first), backed by the partial
+	indexes from migration 003. Pass the returned cursor back as after_cursor
+	to get the next page; a None cursor means there are no more pages.
+	source_filter is an optional list of source names.
+	"""
+	# Must match the index expression in 003_triage_keyset_index.sql exactly.
+	sort_key = "COALESCE(ar.publication_date, '-infinity'::timestamptz)"
+	where = ["ar.status = 'NEW'"]
+	params = []
+
+	if source_filter:
+		source_ids = [sid for sid in (get_source_id(name) for name in source_filter) if sid is not None]
+		if not source_ids:
+			return [], None
+		where.append("ar.source_id = ANY(%s)")
+		params.append(source_ids)
+
+	if after_cursor:
+		where.append(f"({sort_key}, ar.lead_uuid) < (%s, %s)")
+		params.extend(after_cursor)
+
+	sql = f"""
+		  SELECT ar.lead_uuid, cds.title, ar.item_url, s.source_name, ar.publication_date,
+				 {sort_key} AS sort_key
+		  FROM almanac.acquisition_router ar
+				   JOIN almanac.case_data_staging cds ON cds.uuid = ar.lead_uuid
+				   JOIN almanac.sources s ON ar.source_id = s.id
+		  WHERE {' AND '.join(where)}
+		  ORDER BY {sort_key} DESC, ar.lead_uuid DESC
+		  LIMIT %s;
+	"""
+	params.append(limit)
+
+	conn = get_conn()
+	try:
+		with conn.cursor() as cur:
+			cur.execute(sql, params)
+			rows = cur.fetchall()
+	except Exception as e:
+		logger.error(f"Database error in get_triage_page: {e}")
+		return [], None
+	finally:
+		release_conn(conn)
+
+	headers = [TriageHeader(lead_uuid=row[0], title=row[1], url=row[2],
+	                        source_name=row[3], publication_date=row[4]) for row in rows]
+	next_cursor = (rows[-1][5], rows[-1][0]) if len(rows) == limit else None
+	return headers, next_cursor
+
+
+def get_triage_summary(status: str = 'NEW') -> List[Tuple[str, int]]:
+	"""
+	(source_name, lead count) for every source with leads in `status`, from the
+	trigger-maintained triage_summary table (migration 005). One tiny query,
+	regardless of backlog size.
+	"""
+	sql = """
+		  SELECT s.source_name, ts.lead_count
+		  FROM almanac.triage_summary ts
+				   JOIN almanac.sources s ON s.id = ts.source_id
+		  WHERE ts.status = %s AND ts.lead_count > 0
+		  ORDER BY s.source_name;
+	"""
+	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				cur.execute(sql, (status,))
+				return [(row[0], row[1]) for row in cur.fetchall()]
+	except Exception as e:
+		logger.error(f"Database error in get_triage_summary: {e}")
+		return []
+
+
+def refresh_triage_summary() -> int:
+	"""
+	Rebuilds triage_summary from acquisition_router. Only needed if the counters
+	are suspected to have drifted (e.g. triggers disabled during a bulk load);
+	briefly blocks filing while it recounts. Returns the number of counter rows.
+	"""
+	with connection() as conn:
+		with conn.cursor() as cur:
+			cur.execute("SELECT almanac.refresh_triage_summary();")
+			rows = cur.fetchone()[0]
+		conn.commit()
+	logger.info(f"Triage summary rebuilt ({rows} counters).")
+	return rows
+
+
+def get_source_activity(since: datetime, source_name: Optional[str] = None) -> List[Tuple]:
+	"""
+	(day, source_name, sightings, first_seen_at, last_seen_at) per UTC day and
+	source since `since`, newest first. Days whose raw partitions were retired
+	come from acquisition_log_daily (migration 006); the rest are aggregated
+	from acquisition_log, where the seen_at bound prunes to recent partitions.
+	Both sides start at the UTC day `since` falls on (naive means UTC), so
+	that day is counted whole whichever table it's read from.
+	"""
+	if since.tzinfo is not None:
+		since = since.astimezone(timezone.utc)
+	since_day = since.date()
+	since_start = datetime(since_day.year, since_day.month, since_day.day, tzinfo=timezone.utc)
+	sql = """
+		  WITH activity AS (
+			  SELECT day, source_id, lead_count, first_seen_at, last_seen_at
+			  FROM almanac.acquisition_log_daily
+			  WHERE day >= %(since_day)s
+			  UNION ALL
+			  SELECT (seen_at AT TIME ZONE 'UTC')::date, COALESCE(source_id, 0), COUNT(*), MIN(seen_at), MAX(seen_at)
+			  FROM almanac.acquisition_log
+			  WHERE seen_at >= %(since_start)s
+			  GROUP BY 1, 2
+		  )
+		  SELECT a.day, s.source_name, SUM(a.lead_count)::bigint, MIN(a.first_seen_at), MAX(a.last_seen_at)
+		  FROM activity a
+				   LEFT JOIN almanac.sources s ON s.id = a.source_id
+		  WHERE %(source_name)s::text IS NULL OR s.source_name = %(source_name)s
+		  GROUP BY a.day, s.source_name
+		  ORDER BY a.day DESC, s.source_name;
+	"""
+	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				cur.execute(sql, {'since_day': since_day, 'since_start': since_start, 'source_name': source_name})
+				return cur.fetchall()
+	except Exception as e:
+		logger.error(f"Database error in get_source_activity: {e}")
+		return []
+
+
+# Snippet markers. The triage desk can't style text inside a tree row, so matches are bracketed.
+SEARCH_HIGHLIGHT_START = "«"
+SEARCH_HIGHLIGHT_STOP = "»"
+SEARCH_HEADLINE_OPTIONS = (f"StartSel={SEARCH_HIGHLIGHT_START}, StopSel={SEARCH_HIGHLIGHT_STOP}, "
+                           "MaxWords=20, MinWords=8, MaxFragments=2, FragmentDelimiter=\" … \"")
+
+
+def search_staged_leads(query: str, mode: str = 'fts', limit: int = 50,
+                        status: Optional[str] = 'NEW') -> List[StagedLeadHit]:
 	"""
+	Ranked search over case_data_staging.
+	  mode='fts':     websearch syntax ("quoted phrase", -exclude, or) against the
+	                  generated fts_vector (GIN). Ranked by ts_rank_cd; snippets
+	                  come from ts_headline, computed for the returned rows only.
+	  mode='trigram': typo-tolerant match of title / full_text via the pg_trgm
+	                  indexes (word similarity), ranked by the better of the two.
+	status limits hits to leads whose router status matches (None for all).
+	"""
+	query = (query or "").strip()
+	if not query:
+		return []
+	if mode not in ('fts', 'trigram'):
+		raise ValueError(f"Unknown search mode: {mode!r}")
+
+	params = {'query': query, 'limit': limit, 'status': status, 'headline': SEARCH_HEADLINE_OPTIONS}
+	if mode == 'fts':
+		sql = """
+			WITH q AS (
+				SELECT websearch_to_tsquery('english', %(query)s) AS tsq
+			),
+			hits AS (
+				SELECT cds.uuid, ts_rank_cd(cds.fts_vector, q.tsq) AS rank
+				FROM almanac.case_data_staging cds
+						 CROSS JOIN q
+						 JOIN almanac.acquisition_router ar ON ar.lead_uuid = cds.uuid
+				WHERE cds.fts_vector @@ q.tsq
+				  AND (%(status)s::almanac.lead_status IS NULL OR ar.status = %(status)s::almanac.lead_status)
+				ORDER BY rank DESC
+				LIMIT %(limit)s
+			)
+			SELECT ar.lead_uuid, cds.title, ar.item_url, s.source_name, ar.publication_date, hits.rank,
+				   ts_headline('english', COALESCE(cds.full_text, cds.title, ''), q.tsq, %(headline)s)
+			FROM hits
+					 CROSS JOIN q
+					 JOIN almanac.case_data_staging cds ON cds.uuid = hits.uuid
+					 JOIN almanac.acquisition_router ar ON ar.lead_uuid = hits.uuid
+					 JOIN almanac.sources s ON s.id = ar.source_id
+			ORDER BY hits.rank DESC;
+		"""
+	else:
+		sql = """
+			WITH hits AS (
+				SELECT cds.uuid,
+					   GREATEST(word_similarity(%(query)s, cds.title),
+								word_similarity(%(query)s, cds.full_text)) AS rank
+				FROM almanac.case_data_staging cds
+						 JOIN almanac.acquisition_router ar ON ar.lead_uuid = cds.uuid
+				WHERE (%(query)s <%% cds.title OR %(query)s <%% cds.full_text)
+				  AND (%(status)s::almanac.lead_status IS NULL OR ar.status = %(status)s::almanac.lead_status)
+				ORDER BY rank DESC
+				LIMIT %(limit)s
+			)
+			SELECT ar.lead_uuid, cds.title, ar.item_url, s.source_name, ar.publication_date, hits.rank,
+				   CASE WHEN strpos(lower(cds.full_text), lower(%(query)s)) > 0
+							THEN '…' || substr(cds.full_text,
+											   GREATEST(1, strpos(lower(cds.full_text), lower(%(query)s)) - 80),
+											   160 + length(%(query)s)) || '…'
+						ELSE left(cds.full_text, 160) END
+			FROM hits
+					 JOIN almanac.case_data_staging cds ON cds.uuid = hits.uuid
+					 JOIN almanac.acquisition_router ar ON ar.lead_uuid = hits.uuid
+					 JOIN almanac.sources s ON s.id = ar.source_id
+			ORDER BY hits.rank DESC;
+		"""
+
+	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				cur.execute(sql, params)
+				rows = cur.fetchall()
+	except Exception as e:
+		logger.error(f"Database error in search_staged_leads ({mode}): {e}")
+		return []
+
+	return [StagedLeadHit(lead_uuid=row[0], title=row[1], url=row[2], source_name=row[3],
+	                      publication_date=row[4], rank=float(row[5] or 0.0), snippet=row[6] or "")
+	        for row in rows]
+
+
+def get_lead_by_uuid(lead_uuid: str) -> Optional[LeadData]:
+	"""Rehydrates a single lead by UUID."""
+	conn = get_conn()
 	try:
 		with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
-			cur.execute(sql, (lead_uuid,))
+			execute_prepared(cur, 'lead_by_uuid', (lead_uuid,))
 			row = cur.fetchone()
 			if not row:
 				return None
@@ -402,28 +1156,25 @@ def get_staged_lead_details(lead_uuid: uuid.UUID) -> Optional[Dict]:
 		release_conn(conn)
 
 
-def _rehydrate_metadata(source_name: str, raw_metadata: dict) -> dict:
-	"""Internal helper to map raw JSONB to source-specific dataclass structures."""
+def _rehydrate_metadata(source_name: str, raw_metadata: dict):
+	"""
+	Wraps raw JSONB metadata in a LazyMetadata bound to the source's compiled field
+	plan (models.get_metadata_plan); the plan only runs when the metadata is read.
+	Sources without a blueprint get their raw dict back.
+	"""
 	if not raw_metadata:
 		return {}
-
-	MetadataClass = METADATA_CLASS_MAP.get(source_name)
-	if not MetadataClass:
+	plan = get_metadata_plan(source_name)
+	if plan is None:
 		return raw_metadata
+	return LazyMetadata(plan, raw_metadata)
 
-	extra_fields = METADATA_EXTRA_FIELDS.get(source_name, [])
-	class_data = {k: v for k, v in raw_metadata.items() if k not in extra_fields}
-	extra_data = {k: v for k, v in raw_metadata.items() if k in extra_fields}
 
-	try:
-		# Attempt to instantiate the validated dataclass
-		obj = MetadataClass(**class_data)
-		merged = obj.__dict__
-		merged.update(extra_data)
-		return merged
-	except Exception as e:
-		logger.warning(f"Metadata rehydration failed for {source_name}: {e}")
-		return raw_metadata
+def _metadata_json(metadata):
+	"""JSONB adapter for lead metadata; LazyMetadata isn't a dict, so it is materialized first."""
+	if not metadata:
+		return None
+	return psycopg2.extras.Json(metadata.to_dict() if isinstance(metadata, LazyMetadata) else metadata)
 
 
 # ==========================================================
@@ -431,15 +1182,27 @@ def _rehydrate_metadata(source_name: str, raw_metadata: dict) -> dict:
 # ==========================================================
 
 def get_source_id(source_name: str) -> Optional[int]:
+	"""Resolves a source name to its id, served from the source registry cache when fresh."""
+	with _source_cache_lock:
+		cached = _source_cache.get(source_name)
+		if cached and cached[1] > time.monotonic():
+			_source_cache_stats['hits'] += 1
+			return cached[0]
+		_source_cache_stats['misses'] += 1
+
 	conn = get_conn()
 	try:
 		with conn.cursor() as cur:
 			cur.execute("SELECT id FROM sources WHERE source_name = %s", (source_name,))
 			result = cur.fetchone()
-			return result[0] if result else None
 	finally:
 		release_conn(conn)
 
+	if not result:
+		return None
+	_cache_source_ids({source_name: result[0]})
+	return result[0]
+
 
 def get_domains_with_sources(purpose='lead_generation') -> Dict:
 	conn = get_conn()
@@ -449,6 +1212,12 @@ def get_domains_with_sources(purpose='lead_generation') -> Dict:
                                            sd.domain_name,
                                            sd.agent_type,
                                            sd.max_concurrent_requests,
+                                           sd.requests_per_minute,
+                                           sd.burst,
+                                           sd.daily_quota,
+                                           CASE WHEN sd.quota_day = (NOW() AT TIME ZONE 'UTC')::date
+                                                    THEN sd.quota_used
+                                                ELSE 0 END AS quota_used,
                                            s.id  AS source_id,
                                            s.source_name,
                                            s.target,
@@ -461,7 +1230,10 @@ def get_domains_with_sources(purpose='lead_generation') -> Dict:
                                            s.last_failure_date,
                                            s.last_known_item_id,
                                            s.next_release_date,
-                                           s.purpose
+                                           s.purpose,
+                                           s.poll_interval,
+                                           s.next_due_at,
+                                           s.hit_rate
                                     FROM source_domains sd
                                              JOIN sources s ON s.domain_id = sd.id
                                     WHERE sd.has_standard_foreman = TRUE
@@ -478,10 +1250,14 @@ def get_domains_with_sources(purpose='lead_generation') -> Dict:
 			dname = row['domain_name']
 			if dname not in domains:
 				domains[dname] = {
-					'domain_id':      row['domain_id'],
-					'agent_type':     row['agent_type'],
-					'max_concurrent': row['max_concurrent_requests'],
-					'sources':        []
+					'domain_id':           row['domain_id'],
+					'agent_type':          row['agent_type'],
+					'max_concurrent':      row['max_concurrent_requests'],
+					'requests_per_minute': row['requests_per_minute'],
+					'burst':               row['burst'],
+					'daily_quota':         row['daily_quota'],
+					'quota_used':          row['quota_used'],
+					'sources':             []
 				}
 			domains[dname]['sources'].append(SourceConfig(
 					id=row['source_id'],
@@ -499,8 +1275,12 @@ def get_domains_with_sources(purpose='lead_generation') -> Dict:
 					strategy=row['strategy'],
 					keywords=row['keywords'],
 					next_release_date=row['next_release_date'],
+					poll_interval=row['poll_interval'],
+					next_due_at=row['next_due_at'],
+					hit_rate=row['hit_rate'],
 			))
 
+		_cache_source_ids({row['source_name']: row['source_id'] for row in rows})
 		return domains
 	finally:
 		release_conn(conn)
@@ -511,17 +1291,10 @@ def update_source_state(source_id: int, success: bool, new_bookmark=None):
 	try:
 		with conn.cursor() as cur:
 			if success:
-				sql = """
-					UPDATE sources
-					SET last_checked_date = %s, last_success_date = %s,
-						consecutive_failures = 0,
-						last_known_item_id = COALESCE(%s, last_known_item_id)
-					WHERE id = %s;
-				"""
-				cur.execute(sql, (datetime.now(timezone.utc), datetime.now(timezone.utc), new_bookmark, source_id))
+				now = datetime.now(timezone.utc)
+				execute_prepared(cur, 'source_state_success', (now, now, new_bookmark, source_id))
 			else:
-				cur.execute("UPDATE sources SET last_checked_date = NOW(), last_failure_date = NOW() WHERE id = %s",
-				            (source_id,))
+				execute_prepared(cur, 'source_state_failure', (source_id,))
 		conn.commit()
 	except Exception as e:
 		conn.rollback()
@@ -530,6 +1303,112 @@ def update_source_state(source_id: int, success: bool, new_bookmark=None):
 		release_conn(conn)
 
 
+def update_source_states_bulk(states: Dict[int, Tuple[bool, Optional[str]]]) -> bool:
+	"""
+	Set-based update_source_state for a whole dispatch cycle: {source_id: (success, new_bookmark)}
+	goes out as one UPDATE ... FROM (VALUES ...) stamped with a single NOW().
+	Returns False (nothing written) if the statement failed.
+	"""
+	if not states:
+		return True
+	sql = """
+		UPDATE sources AS s
+		SET last_checked_date = NOW(),
+			last_success_date = CASE WHEN v.success THEN NOW() ELSE s.last_success_date END,
+			last_failure_date = CASE WHEN v.success THEN s.last_failure_date ELSE NOW() END,
+			consecutive_failures = CASE WHEN v.success THEN 0 ELSE COALESCE(s.consecutive_failures, 0) + 1 END,
+			last_known_item_id = CASE WHEN v.success THEN COALESCE(v.bookmark, s.last_known_item_id)
+								 ELSE s.last_known_item_id END
+		FROM (VALUES %s) AS v(id, success, bookmark)
+		WHERE s.id = v.id;
+	"""
+	rows = [(source_id, success, None if bookmark is None else str(bookmark))
+	        for source_id, (success, bookmark) in states.items()]
+	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				psycopg2.extras.execute_values(cur, sql, rows, template="(%s::integer, %s::boolean, %s::text)",
+				                               page_size=len(rows))
+			conn.commit()
+		return True
+	except Exception as e:
+		logger.error(f"Failed to update state for {len(rows)} sources: {e}")
+		return False
+
+
+def record_quota_usage(usage: Dict[int, Tuple[int, bool]]) -> bool:
+	"""
+	Adds a hunt's daily_quota usage, {domain_id: (requests, spent)}, to today's count
+	on source_domains; a spent quota is recorded as all of daily_quota used.
+	"""
+	if not usage:
+		return True
+	sql = """
+		UPDATE source_domains AS sd
+		SET quota_used = GREATEST(CASE WHEN sd.quota_day = (NOW() AT TIME ZONE 'UTC')::date
+										THEN sd.quota_used + v.requests
+									ELSE v.requests END,
+								  CASE WHEN v.spent THEN sd.daily_quota ELSE 0 END),
+			quota_day = (NOW() AT TIME ZONE 'UTC')::date
+		FROM (VALUES %s) AS v(id, requests, spent)
+		WHERE sd.id = v.id;
+	"""
+	rows = [(domain_id, used, spent) for domain_id, (used, spent) in usage.items()]
+	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				psycopg2.extras.execute_values(cur, sql, rows, template="(%s::integer, %s::integer, %s::boolean)",
+				                               page_size=len(rows))
+			conn.commit()
+		return True
+	except Exception as e:
+		logger.error(f"Failed to record quota usage for {len(rows)} domains: {e}")
+		return False
+
+
+def get_source_yields(since: datetime, source_ids: List[int]) -> Dict[int, int]:
+	"""New leads filed per source since `since` (acquisition_log rows; the seen_at bound prunes partitions)."""
+	if not source_ids:
+		return {}
+	sql = """
+		SELECT source_id, COUNT(*)
+		FROM almanac.acquisition_log
+		WHERE seen_at >= %s AND source_id = ANY(%s)
+		GROUP BY source_id;
+	"""
+	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				cur.execute(sql, (since, list(source_ids)))
+				return dict(cur.fetchall())
+	except Exception as e:
+		logger.error(f"Database error in get_source_yields: {e}")
+		return {}
+
+
+def update_source_schedules_bulk(schedules: Dict[int, Tuple[datetime, float]]) -> bool:
+	"""Writes the scheduler's {source_id: (next_due_at, hit_rate)} in one statement."""
+	if not schedules:
+		return True
+	sql = """
+		UPDATE sources AS s
+		SET next_due_at = v.next_due_at, hit_rate = v.hit_rate
+		FROM (VALUES %s) AS v(id, next_due_at, hit_rate)
+		WHERE s.id = v.id;
+	"""
+	rows = [(source_id, next_due_at, hit_rate) for source_id, (next_due_at, hit_rate) in schedules.items()]
+	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				psycopg2.extras.execute_values(cur, sql, rows, template="(%s::integer, %s::timestamptz, %s::real)",
+				                               page_size=len(rows))
+			conn.commit()
+		return True
+	except Exception as e:
+		logger.error(f"Failed to update schedule for {len(rows)} sources: {e}")
+		return False
+
+
 def get_required_foremen() -> List[str]:
 	conn = get_conn()
 	try:
@@ -630,50 +1509,283 @@ def get_all_cases() -> List[dict]:
 		release_conn(conn)
 
 
+def _case_search_filters(query: Optional[str] = None, date_from: Optional[datetime] = None,
+                         date_to: Optional[datetime] = None, statuses: Optional[List[str]] = None,
+                         categories: Optional[List[str]] = None) -> Tuple[str, List[str], list]:
+	"""
+	The FROM clause (with the content join when there's a query), the WHERE
+	conditions and their parameters, in that order, shared by search_cases and
+	get_case_facets. Date bounds are applied to cases AND case_content
+	separately, as literals, so the planner prunes partitions of both tables at
+	plan time (it won't infer a range on one side of the join from the other).
+	"""
+	where, params = [], []
+	content_where = []
+	if date_from is not None:
+		where.append("c.publication_date >= %s")
+		content_where.append("cc.publication_date >= %s")
+		params.append(date_from)
+	if date_to is not None:
+		where.append("c.publication_date < %s")
+		content_where.append("cc.publication_date < %s")
+		params.append(date_to)
+	content_params = list(params)
+	if statuses:
+		where.append("c.status = ANY(%s::almanac.case_status[])")
+		params.append(list(statuses))
+	if categories:
+		where.append("c.category = ANY(%s)")
+		params.append(list(categories))
+
+	join = ""
+	if query:
+		# Only cases whose content matches
+		join = ("JOIN almanac.case_content cc ON cc.case_id = c.id AND cc.publication_date = c.publication_date "
+		        + "".join(f"AND {cond} " for cond in content_where))
+		where.append("cc.search_vector @@ websearch_to_tsquery('english', %s)")
+		# join bounds come first, then the WHERE params
+		params = content_params + params + [query]
+	return f"FROM almanac.cases c {join}", where, params
+
+
+def _where_clause(conditions: List[str]) -> str:
+	return ('WHERE ' + ' AND '.join(conditions)) if conditions else ''
+
+
+def _case_search_sql(query: Optional[str] = None, date_from: Optional[datetime] = None,
+                     date_to: Optional[datetime] = None, statuses: Optional[List[str]] = None,
+                     categories: Optional[List[str]] = None, after_cursor: Optional[tuple] = None,
+                     limit: int = 50) -> Tuple[str, list]:
+	"""Builds the search_cases statement: _case_search_filters plus ranking, keyset cursor and LIMIT."""
+	from_sql, where, params = _case_search_filters(query, date_from, date_to, statuses, categories)
+	if query:
+		# Ranked, best first
+		rank = "ts_rank_cd(cc.search_vector, websearch_to_tsquery('english', %s))"
+		select_rank = f"{rank} AS rank"
+		order = "rank DESC, c.id DESC"
+		params = [query] + params  # the SELECT-list rank parameter comes first
+		if after_cursor:
+			where.append(f"({rank}, c.id) < (%s::real, %s)")
+			params.extend([query, after_cursor[0], after_cursor[1]])
+	else:
+		select_rank = "NULL::real AS rank"
+		order = "c.publication_date DESC, c.id DESC"
+		if after_cursor:
+			where.append("(c.publication_date, c.id) < (%s, %s)")
+			params.extend(after_cursor)
+
+	sql = f"""
+		  SELECT c.id, c.public_uuid, c.title, c.url, c.source_name, c.publication_date,
+				 c.status::text, c.category, {select_rank}
+		  {from_sql}
+		  {_where_clause(where)}
+		  ORDER BY {order}
+		  LIMIT %s;
+	"""
+	params.append(limit)
+	return sql, params
+
+
+def search_cases(query: Optional[str] = None, date_from: Optional[datetime] = None,
+                 date_to: Optional[datetime] = None, statuses: Optional[List[str]] = None,
+                 categories: Optional[List[str]] = None, after_cursor: Optional[tuple] = None,
+                 limit: int = 50) -> Tuple[List[CaseSummary], Optional[tuple]]:
+	"""
+	Case search engine over promoted cases.
+	  query:      websearch syntax against case_content.search_vector (ranked);
+	              None lists newest first.
+	  date_from/date_to: half-open publication_date range; prunes partitions.
+	  statuses/categories: facet filters (see get_case_facets for counts).
+	Keyset-paginated: pass the returned cursor back as after_cursor; None
+	means there are no more pages. Returns CaseSummary rows, never content.
+	"""
+	sql, params = _case_search_sql(query, date_from, date_to, statuses, categories, after_cursor, limit)
+	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				cur.execute(sql, params)
+				rows = cur.fetchall()
+	except Exception as e:
+		logger.error(f"Database error in search_cases: {e}")
+		return [], None
+
+	cases = [CaseSummary(id=row[0], public_uuid=row[1], title=row[2], url=row[3], source_name=row[4],
+	                     publication_date=row[5], status=row[6], category=row[7], rank=row[8]) for row in rows]
+	next_cursor = None
+	if len(rows) == limit:
+		last = cases[-1]
+		next_cursor = (last.rank, last.id) if query else (last.publication_date, last.id)
+	return cases, next_cursor
+
+
+def get_case_facets(query: Optional[str] = None, date_from: Optional[datetime] = None,
+                    date_to: Optional[datetime] = None) -> Dict[str, Dict[str, int]]:
+	"""Case counts by status and by category for the same query/date range as search_cases."""
+	# The search's own FROM/WHERE (and so its partition pruning), without ranking and paging
+	from_sql, where, params = _case_search_filters(query, date_from, date_to)
+	body = f"{from_sql} {_where_clause(where)}"
+	facet_sql = f"""
+		  SELECT 'status' AS facet, c.status::text AS value, COUNT(*) {body} GROUP BY c.status
+		  UNION ALL
+		  SELECT 'category', COALESCE(c.category, '(none)'), COUNT(*) {body} GROUP BY c.category;
+	"""
+	facets = {'status': {}, 'category': {}}
+	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				cur.execute(facet_sql, params + params)
+				for facet, value, count in cur.fetchall():
+					facets[facet][value] = count
+	except Exception as e:
+		logger.error(f"Database error in get_case_facets: {e}")
+	return facets
+
+
+def explain_search_cases(**filters) -> dict:
+	"""EXPLAIN (FORMAT JSON) plan of search_cases for the given filters, for pruning checks."""
+	sql, params = _case_search_sql(**filters)
+	with connection() as conn:
+		with conn.cursor() as cur:
+			cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+			plan = cur.fetchone()[0]
+	return plan[0]['Plan']
+
+
 # ==========================================================
 # 5. Asset Management
 # ==========================================================
 
-def save_asset(asset: Asset) -> Optional[str]:
+_ASSET_COLUMNS = ("file_path", "file_type", "mime_type", "file_size", "content_hash",
+                  "source_type", "source_uuid", "original_url",
+                  "related_cases", "related_investigations",
+                  "is_enhanced", "notes", "metadata")
+
+# Content-addressed: a hash that is already stored returns the existing row, with the
+# new case/investigation links merged in. Legacy rows (NULL hash) never conflict.
+SQL_SAVE_ASSETS = f"""
+	INSERT INTO almanac.assets AS a ({", ".join(_ASSET_COLUMNS)})
+	VALUES %s
+	ON CONFLICT (content_hash) DO UPDATE
+		SET related_cases          = ARRAY(SELECT DISTINCT u FROM unnest(a.related_cases || EXCLUDED.related_cases) u),
+			related_investigations = ARRAY(SELECT DISTINCT u FROM unnest(a.related_investigations
+			                                                          || EXCLUDED.related_investigations) u)
+	RETURNING a.file_path, a.content_hash, a.asset_id;
+"""
+_ASSET_TEMPLATE = "(%s, %s, %s, %s, %s::bytea, %s, %s, %s, %s::uuid[], %s::uuid[], %s, %s, %s)"
+
+
+def _asset_row(asset: Asset) -> tuple:
+	return (asset.file_path, asset.file_type, asset.mime_type, asset.file_size,
+	        psycopg2.Binary(asset.content_hash) if asset.content_hash else None,
+	        asset.source_type, asset.source_uuid, asset.original_url,
+	        asset.related_cases or [], asset.related_investigations or [],
+	        psycopg2.extras.Json(asset.is_enhanced) if asset.is_enhanced else None, asset.notes,
+	        psycopg2.extras.Json(asset.metadata) if asset.metadata else None)
+
+
+def _merge_duplicate_assets(assets: List[Asset]) -> List[Asset]:
+	"""
+	Folds assets with the same content_hash into one row (ON CONFLICT can't touch
+	a row twice in one statement). The first occurrence wins, links are unioned.
+	"""
+	merged: Dict[bytes, Asset] = {}
+	rows = []
+	for asset in assets:
+		if not asset.content_hash:
+			rows.append(asset)
+			continue
+		first = merged.get(asset.content_hash)
+		if first is None:
+			# A copy, so merging links never mutates the caller's Asset
+			merged[asset.content_hash] = first = dataclasses.replace(asset)
+			rows.append(first)
+			continue
+		first.related_cases = list(dict.fromkeys(first.related_cases + asset.related_cases))
+		first.related_investigations = list(dict.fromkeys(first.related_investigations +
+		                                                  asset.related_investigations))
+	return rows
+
+
+def save_assets(assets: List[Asset]) -> List[Optional[str]]:
+	"""
+	Inserts a batch of assets in one statement and returns their asset_ids in input
+	order (None for all of them if the batch failed). Assets whose content_hash is
+	already stored resolve to the existing row.
+	"""
+	if not assets:
+		return []
+	rows = _merge_duplicate_assets(assets)
 	conn = get_conn()
 	try:
 		with conn.cursor() as cur:
-			sql = """
-				  INSERT INTO almanac.assets (file_path, file_type, mime_type, file_size,
-											  source_type, source_uuid, original_url,
-											  related_cases, related_investigations,
-											  is_enhanced, notes, metadata)
-				  VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-				  RETURNING asset_id;
-			"""
-			cur.execute(sql, (
-				asset.file_path, asset.file_type, asset.mime_type, asset.file_size,
-				asset.source_type, asset.source_uuid, asset.original_url,
-				asset.related_cases, asset.related_investigations,
-				asset.is_enhanced, asset.notes,
-				psycopg2.extras.Json(asset.metadata) if asset.metadata else None
-			))
-			asset_id = cur.fetchone()[0]
+			returned = psycopg2.extras.execute_values(
+					cur, SQL_SAVE_ASSETS, [_asset_row(a) for a in rows],
+					template=_ASSET_TEMPLATE, page_size=len(rows), fetch=True)
 		conn.commit()
-		return str(asset_id)
 	except Exception as e:
 		conn.rollback()
-		logger.error(f"Failed to save asset: {e}")
-		return None
+		logger.error(f"Failed to save {len(assets)} asset(s): {e}")
+		return [None] * len(assets)
 	finally:
 		release_conn(conn)
 
+	# A hash hit may return a row stored under another path (e.g. a backfilled legacy file)
+	ids = {}
+	for file_path, content_hash, asset_id in returned:
+		ids[bytes(content_hash) if content_hash else file_path] = str(asset_id)
+	return [ids.get(asset.content_hash or asset.file_path) for asset in assets]
 
-def get_assets_for_case(case_uuid: str) -> List[Asset]:
-	conn = get_conn()
+
+def save_asset(asset: Asset) -> Optional[str]:
+	return save_assets([asset])[0]
+
+
+def get_asset_summaries_for_case(case_uuid: str, limit: Optional[int] = None) -> List[AssetSummary]:
+	"""
+	Lightweight listing of a case's assets, newest link first, via the
+	asset_case_links primary key (migration 008). metadata / is_enhanced are not
+	read; load a single asset with get_asset() when it is opened.
+	"""
+	sql = """
+		  SELECT a.asset_id, a.file_path, a.file_type, a.mime_type, a.file_size,
+				 a.created_at, a.original_url, l.linked_at
+		  FROM almanac.asset_case_links l
+				   JOIN almanac.assets a ON a.asset_id = l.asset_id
+		  WHERE l.case_uuid = %s
+		  ORDER BY l.linked_at DESC, a.asset_id
+		  LIMIT %s;
+	"""
 	try:
+		with connection() as conn:
+			with conn.cursor() as cur:
+				cur.execute(sql, (case_uuid, limit))
+				return [AssetSummary(*row) for row in cur.fetchall()]
+	except Exception as e:
+		logger.error(f"Database error in get_asset_summaries_for_case: {e}")
+		return []
+
+
+def get_asset(asset_id: str) -> Optional[Asset]:
+	"""One asset with its full metadata."""
+	with connection() as conn:
 		with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-			cur.execute("SELECT * FROM almanac.assets WHERE %s = ANY(related_cases) ORDER BY created_at DESC",
-			            (case_uuid,))
-			rows = cur.fetchall()
-			return [_row_to_asset(row) for row in rows]
-	finally:
-		release_conn(conn)
+			cur.execute("SELECT * FROM almanac.assets WHERE asset_id = %s", (asset_id,))
+			row = cur.fetchone()
+	return _row_to_asset(row) if row else None
+
+
+def get_assets_for_case(case_uuid: str) -> List[Asset]:
+	"""Full assets (metadata included) linked to a case. Prefer get_asset_summaries_for_case for listings."""
+	with connection() as conn:
+		with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+			cur.execute("""
+				SELECT a.*
+				FROM almanac.asset_case_links l
+						 JOIN almanac.assets a ON a.asset_id = l.asset_id
+				WHERE l.case_uuid = %s
+				ORDER BY a.created_at DESC
+			""", (case_uuid,))
+			return [_row_to_asset(row) for row in cur.fetchall()]
 
 
 def _row_to_asset(row) -> Asset:
@@ -683,6 +1795,7 @@ def _row_to_asset(row) -> Asset:
 			file_type=row['file_type'],
 			mime_type=row['mime_type'],
 			file_size=row['file_size'],
+			content_hash=bytes(row['content_hash']) if row.get('content_hash') else None,
 			created_at=row['created_at'],
 			source_type=row['source_type'],
 			source_uuid=row['source_uuid'] if row['source_uuid'] else None,
@@ -739,11 +1852,10 @@ def get_all_tasks() -> List[Dict]:
 
 
 def remove_from_cds(uuid):
-	conn = get_conn()
 	try:
-		with conn.cursor() as cur:
-			cur.execute("DELETE FROM case_data_staging WHERE uuid = %s", (uuid,))
-		conn.commit()
+		with connection() as conn:
+			with conn.cursor() as cur:
+				cur.execute("DELETE FROM case_data_staging WHERE uuid = %s", (uuid,))
+			conn.commit()
 	except Exception as e:
-		conn.rollback()
 		logger.error(f"Failed to remove from case_data_staging for {uuid}: {e}")
@@ -2,19 +2,40 @@
 # Hunter's Command Console - Dispatcher (v4.1 - State Fixed)
 # ==========================================================
 
+import asyncio
+import atexit
+import copy
 import importlib
 import logging
 import threading
 import inspect
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
 
 # --- Our Tools ---
-from hunter import db_manager
+from hunter import db_manager, rate_limiter
 from hunter.filing_clerk import FilingClerk
+from hunter.utils.stream_pipeline import PipelineStopped, ReturnValue, iter_batches, run_pipeline
 
 logger = logging.getLogger("Dispatcher")
 
+# Streaming agents (hunt_stream) are translated and filed in micro-batches of this many leads...
+FILING_BATCH_SIZE = 100
+# ...with at most this many translated batches waiting on the filing stage per source.
+STREAM_PENDING_BATCHES = 4
+
+# Deadlines, in seconds ([Dispatcher] source_timeout_seconds etc.; 0 = none). A source's
+# clock starts when it starts running, a domain's when the hunt does; the hunt has none by default.
+SOURCE_TIMEOUT = 120
+DOMAIN_TIMEOUT = 900
+# How often running sources are checked against their tokens.
+DEADLINE_POLL_SECONDS = 1.0
+
 
 def _build_foreman_map():
 	"""Dynamically builds the foreman map."""
@@ -50,21 +71,220 @@ def _build_foreman_map():
 	return foreman_map
 
 
+class HuntCancelled(Exception):
+	"""A source was stopped by its CancelToken: Cancel was pressed or a deadline passed."""
+
+
+class LeadFilingError(Exception):
+	"""The filing clerk couldn't file some of a source's leads, so its bookmark must not move."""
+
+
+class CancelToken:
+	"""
+	Cooperative cancellation with an optional deadline. Tokens form a tree
+	(hunt -> domain -> source); cancelling a token, or its deadline passing,
+	cancels every token below it. An agent blocked in a network call can't be
+	interrupted, so the dispatcher polls `cancelled` and abandons whatever is
+	still running; `abandoned` tells that worker, if it ever returns, that its
+	result is no longer wanted.
+	"""
+
+	def __init__(self, timeout: Optional[float] = None, parent: Optional['CancelToken'] = None, clock=time.monotonic):
+		self.parent = parent
+		self.clock = clock
+		self.timeout = None
+		self.deadline = None
+		self.abandoned = False
+		self._reason = None
+		self.start_deadline(timeout)
+
+	def child(self, timeout: Optional[float] = None) -> 'CancelToken':
+		return CancelToken(timeout, parent=self, clock=self.clock)
+
+	def start_deadline(self, timeout: Optional[float]):
+		"""Starts (or restarts) this token's clock; a falsy timeout means no deadline."""
+		if timeout:
+			self.timeout = timeout
+			self.deadline = self.clock() + timeout
+
+	def cancel(self, reason: str = "cancelled"):
+		if self._reason is None:
+			self._reason = reason
+
+	def abandon(self):
+		self.abandoned = True
+		self.cancel("abandoned")
+
+	@property
+	def reason(self) -> Optional[str]:
+		"""Why this token is cancelled, or None if it isn't."""
+		if self._reason is not None:
+			return self._reason
+		if self.deadline is not None and self.clock() >= self.deadline:
+			return f"timed out after {self.timeout:g}s"
+		return self.parent.reason if self.parent is not None else None
+
+	@property
+	def cancelled(self) -> bool:
+		return self.reason is not None
+
+
+@dataclass
+class DomainProgress:
+	total: int
+	done: int = 0
+	failed: int = 0
+	abandoned: int = 0  # stopped mid-hunt by a deadline or Cancel
+	skipped: int = 0  # never started
+
+	@property
+	def finished(self) -> int:
+		return self.done + self.failed + self.abandoned + self.skipped
+
+
+@dataclass
+class HuntProgress:
+	"""What progress listeners receive: a snapshot of the hunt, per domain."""
+	domains: dict = field(default_factory=dict)  # domain name -> DomainProgress
+	complete: bool = False
+	cancelled: Optional[str] = None  # why the hunt stopped early, if it did
+
+	def summary(self) -> str:
+		parts = []
+		for name, domain in self.domains.items():
+			part = f"{name} {domain.finished}/{domain.total}"
+			extras = [f"{count} {label}" for label, count in (('failed', domain.failed),
+			                                                   ('abandoned', domain.abandoned),
+			                                                   ('skipped', domain.skipped)) if count]
+			parts.append(f"{part} ({', '.join(extras)})" if extras else part)
+		text = " | ".join(parts)
+		if self.cancelled:
+			text = f"Stopped ({self.cancelled}): {text}"
+		return text
+
+
+# Live accumulators, flushed by one exit hook; a weak set so finished dispatchers aren't kept alive.
+_accumulators = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_accumulators():
+	for accumulator in list(_accumulators):
+		accumulator.flush()
+
+
+class SourceStateAccumulator:
+	"""
+	Collects per-source outcomes (success/failure + bookmark) during a hunt so they
+	can be written in one statement per domain instead of one transaction per source.
+	Whatever is still pending at interpreter exit is flushed by an atexit hook.
+	"""
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._pending = {}  # source_id -> (success, bookmark)
+		_accumulators.add(self)
+
+	def record_success(self, source_id: int, bookmark=None, token=None) -> bool:
+		"""Refused (False) once `token` is abandoned: that source is already recorded as failed."""
+		with self._lock:
+			if token is not None and token.abandoned:
+				return False
+			self._pending[source_id] = (True, bookmark)
+			return True
+
+	def record_failure(self, source_id: int):
+		with self._lock:
+			self._pending[source_id] = (False, None)
+
+	def record_abandoned(self, source_id: int, token):
+		"""
+		Abandons `token` and records the failure in one step, so a worker still
+		finishing can't slip a record_success (and a new bookmark) in after it.
+		"""
+		with self._lock:
+			token.abandon()
+			self._pending[source_id] = (False, None)
+
+	def flush(self, source_ids=None):
+		"""Writes pending states (all, or only the given sources). Falls back to per-source updates."""
+		with self._lock:
+			if source_ids is None:
+				batch, self._pending = self._pending, {}
+			else:
+				batch = {sid: self._pending.pop(sid) for sid in source_ids if sid in self._pending}
+		if not batch:
+			return
+		if db_manager.update_source_states_bulk(batch):
+			logger.debug(f"Flushed state for {len(batch)} sources.")
+			return
+
+		# One bad row shouldn't cost every source its bookmark
+		logger.warning(f"Bulk source-state flush failed; writing {len(batch)} sources one by one.")
+		for source_id, (success, bookmark) in batch.items():
+			db_manager.update_source_state(source_id, success=success, new_bookmark=bookmark)
+
+
 class Dispatcher:
 	def __init__(self, config):
 		self.all_threads_done = None
 		self.config = config
+		self.filing_batch_size, self.stream_pending_batches = self._stream_settings(config)
 		self.filing_clerk = FilingClerk()
+		self.source_states = SourceStateAccumulator()
 		self.active_threads = {}
 		self.foreman_map = _build_foreman_map()
+		self._init_hunt_control(config)
+
+	def _init_hunt_control(self, config):
+		self.source_timeout, self.domain_timeout, self.hunt_timeout = self._deadline_settings(config)
+		self.hunt_token = None
+		self.skipped_sources = set()  # ids never started in the last hunt (cancelled first)
+		self.deferred_sources = {}  # id -> seconds until its domain's rate limit lets it hunt again
+		self.progress = HuntProgress()
+		self._progress_lock = threading.Lock()
+		self._progress_listeners = []
+
+	def add_progress_listener(self, callback):
+		"""
+		Registers callback(HuntProgress), called from hunt threads at the start of a
+		hunt, as each source finishes, and once with complete=True at the end.
+		Callbacks run under the progress lock, so they should only hand off (e.g. tk's after()).
+		"""
+		if callback not in self._progress_listeners:
+			self._progress_listeners.append(callback)
+
+	def cancel(self, reason: str = "cancelled by user"):
+		"""Stops the running hunt: queued sources are skipped and running ones abandoned within a poll."""
+		if self.hunt_token is not None and not self.hunt_token.cancelled:
+			logger.warning(f"Hunt {reason}.")
+			self.hunt_token.cancel(reason)
 
-	def dispatch(self):
-		"""Dispatch all active domains. Gets its own data."""
-		domains = db_manager.get_domains_with_sources()
+	def new_hunt_token(self) -> CancelToken:
+		"""
+		The token for the next hunt, made before any of its pre-hunt work (reading
+		sources, sizing the pool, warming the URL filter) so cancel() reaches it
+		from the start. dispatch() makes one unless it's handed one.
+		"""
+		self.hunt_token = CancelToken(self.hunt_timeout)
+		return self.hunt_token
+
+	def dispatch(self, domains=None, hunt_token=None):
+		"""Dispatch all active domains. Gets its own data unless domains are passed in."""
+		hunt_token = hunt_token or self.new_hunt_token()
+		if domains is None:
+			domains = db_manager.get_domains_with_sources()
 
 		if not domains:
 			logger.info("No active domains/sources found.")
-			return threading.Event()  # Already "done"
+			done = threading.Event()
+			done.set()
+			return done
+
+		# Every domain's workers may hold a connection at the same time
+		self._before_hunt(sum(info['max_concurrent'] or 1 for info in domains.values()))
+		rate_limiter.configure_domains(domains)
+		self._start_progress(domains)
 
 		threads = []
 		self.all_threads_done = threading.Event()
@@ -73,11 +293,12 @@ class Dispatcher:
 			foreman_name = f"{domain_info['agent_type']}_foreman"
 			if foreman_name not in self.foreman_map:
 				logger.error(f"No foreman found for '{foreman_name}', skipping domain '{domain_name}'")
+				self._skip_sources(domain_name, domain_info['sources'])
 				continue
 
 			thread = threading.Thread(
 					target=self._dispatch_domain,
-					args=(domain_name, domain_info),
+					args=(domain_name, domain_info, hunt_token),
 					name=f"domain-{domain_name}"
 			)
 			self.active_threads[domain_name] = thread
@@ -87,14 +308,102 @@ class Dispatcher:
 		def wait_for_all():
 			for t in threads:
 				t.join()
+			self._after_hunt()
+			self._finish_progress(hunt_token)
 			self.all_threads_done.set()
 
 		watcher = threading.Thread(target=wait_for_all)
 		watcher.start()
 		return self.all_threads_done
 
-	def _dispatch_domain(self, domain_name, domain_info):
-		"""Handle all sources for a single domain, threaded."""
+	def _before_hunt(self, concurrent_connections: int):
+		db_manager.ensure_pool_capacity(concurrent_connections)
+		# Catch the URL filter up with anything filed since the last hunt
+		self.filing_clerk.warm_url_filter()
+
+	def _after_hunt(self):
+		# Domains flush as they finish; this catches anything a crashed domain left behind.
+		self.source_states.flush()
+		logger.debug(f"Source cache stats: {db_manager.get_source_cache_stats()}")
+		logger.debug(f"Connection pool stats: {db_manager.get_pool_stats()}")
+		logger.debug(f"Rate limiter stats: {rate_limiter.get_limiter_stats()}")
+		db_manager.record_quota_usage(rate_limiter.take_quota_usage())
+		logger.info(f"URL filter stats: {self.filing_clerk.url_filter_stats()}")
+		self.filing_clerk.save_url_filter()
+
+	# --- Progress ---
+
+	def _start_progress(self, domains):
+		self.skipped_sources = set()
+		self.deferred_sources = {}
+		with self._progress_lock:
+			self.progress = HuntProgress({name: DomainProgress(len(info['sources'])) for name, info in domains.items()})
+			self._notify_progress()
+
+	def _record_progress(self, domain_name, outcome: str, count: int = 1):
+		"""Counts `count` sources of a domain as done, failed, abandoned or skipped."""
+		with self._progress_lock:
+			domain = self.progress.domains.get(domain_name)
+			if domain is None:
+				return
+			setattr(domain, outcome, getattr(domain, outcome) + count)
+			self._notify_progress()
+
+	def _skip_sources(self, domain_name, sources):
+		self.skipped_sources.update(source.id for source in sources)
+		self._record_progress(domain_name, 'skipped', len(sources))
+
+	def _defer_source(self, domain_name, source, e: rate_limiter.RateLimitExceeded):
+		"""A spent quota or long pause isn't the source's fault: no failure, no backoff, bookmark untouched."""
+		self.deferred_sources[source.id] = e.retry_in
+		self._record_progress(domain_name, 'skipped')
+		logger.info(f"Source '{source.source_name}' deferred: {e}")
+
+	def _finish_progress(self, hunt_token: CancelToken):
+		with self._progress_lock:
+			self.progress.complete = True
+			self.progress.cancelled = hunt_token.reason
+			logger.info(f"Hunt finished: {self.progress.summary()}")
+			self._notify_progress()
+
+	def _notify_progress(self):
+		snapshot = copy.deepcopy(self.progress)
+		for callback in list(self._progress_listeners):
+			try:
+				callback(snapshot)
+			except Exception as e:
+				logger.warning(f"Progress listener {callback!r} failed: {e}")
+
+	# --- Settings ---
+
+	@staticmethod
+	def _deadline_settings(config):
+		"""(source, domain, hunt) timeouts in seconds; None where unset or 0."""
+		settings = config.get_dispatcher_config() if config else {}
+		timeouts = (('source_timeout_seconds', SOURCE_TIMEOUT), ('domain_timeout_seconds', DOMAIN_TIMEOUT),
+		            ('hunt_timeout_seconds', None))
+		return tuple(float(settings.get(key, default) or 0) or None for key, default in timeouts)
+
+	@staticmethod
+	def _stream_settings(config):
+		settings = config.get_dispatcher_config() if config else {}
+		return (int(settings.get('filing_batch_size', FILING_BATCH_SIZE)),
+		        int(settings.get('stream_pending_batches', STREAM_PENDING_BATCHES)))
+
+	@staticmethod
+	def _load_agent(agent_type):
+		return importlib.import_module(f"search_agents.{agent_type}_agent")
+
+	def _dispatch_domain(self, domain_name, domain_info, hunt_token=None):
+		"""
+		Handle all sources for a single domain, threaded. Each source gets a child
+		of the domain's token; every DEADLINE_POLL_SECONDS the running ones are
+		checked, and a source whose deadline has passed (or whose hunt was
+		cancelled) is abandoned: recorded as a failure and left to finish, or
+		not, on a thread nobody waits for. Sources are submitted as slots free
+		up, and an abandoned source gives its slot back (the pool has room for
+		the threads they keep), so one hung call can't hold up the rest.
+		"""
 		agent_type = domain_info['agent_type']
 		sources = domain_info['sources']
 		max_concurrent = domain_info['max_concurrent']
@@ -102,32 +411,153 @@ class Dispatcher:
 		credentials = self._get_credentials(agent_type)
 
 		try:
-			agent_module = importlib.import_module(f"search_agents.{agent_type}_agent")
+			agent_module = self._load_agent(agent_type)
 		except ImportError as e:
 			logger.critical(f"Failed to import agent for '{agent_type}': {e}")
+			self._skip_sources(domain_name, sources)
 			return
 
-		with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-			futures = {
-				executor.submit(self._process_source, source, agent_module, foreman_handler, credentials): source
-				for source in sources
-			}
-			for future in as_completed(futures):
-				source = futures[future]
-				try:
-					future.result()
-				except Exception as e:
-					logger.error(f"Source '{source.source_name}' failed: {e}")
+		domain_token = (hunt_token or CancelToken()).child(self.domain_timeout)
+		slots = max_concurrent or 1
+		# Threads are only made on demand: at most `slots` plus one per abandoned source
+		executor = ThreadPoolExecutor(max_workers=slots + len(sources), thread_name_prefix=f"domain-{domain_name}")
+		queued = deque((source, domain_token.child()) for source in sources)
+		futures = {}  # running: future -> (source, token)
+		try:
+			while queued or futures:
+				while queued and len(futures) < slots:
+					source, token = queued.popleft()
+					if token.cancelled:
+						# Never started, so its state is untouched and it's simply hunted next time
+						self._skip_sources(domain_name, [source])
+						continue
+					future = executor.submit(self._run_source, source, token, agent_module, foreman_handler,
+					                         credentials)
+					futures[future] = (source, token)
+				if not futures:
+					continue
+
+				done, _ = wait(futures, timeout=DEADLINE_POLL_SECONDS, return_when=FIRST_COMPLETED)
+				for future in done:
+					source, token = futures.pop(future)
+					try:
+						self._record_progress(domain_name, 'done' if future.result() else 'skipped')
+					except rate_limiter.RateLimitExceeded as e:
+						self._defer_source(domain_name, source, e)
+					except HuntCancelled as e:
+						# A streaming source stopped between batches; what it already filed stays filed
+						self.source_states.record_failure(source.id)
+						self._record_progress(domain_name, 'abandoned')
+						logger.warning(f"Source '{source.source_name}' stopped: {e}")
+					except Exception as e:
+						self.source_states.record_failure(source.id)
+						self._record_progress(domain_name, 'failed')
+						logger.error(f"Source '{source.source_name}' failed: {e}")
+				for future in self._drop_cancelled(domain_name, futures):
+					del futures[future]
+		finally:
+			# Don't wait on abandoned workers
+			executor.shutdown(wait=False, cancel_futures=True)
+			# Partial results are flushed even if the domain itself blew up
+			self.source_states.flush([source.id for source in sources])
 
 		logger.info(f"Domain '{domain_name}' complete. Processed {len(sources)} sources.")
 
-	def _process_source(self, source, agent_module, foreman_handler, credentials):
+	def _drop_cancelled(self, domain_name, futures) -> set:
+		"""Of the submitted futures, skips the not-yet-started and abandons the running ones whose token is cancelled."""
+		dropped = set()
+		for future, (source, token) in futures.items():
+			reason = token.reason
+			if reason is None:
+				continue
+			if future.cancel():
+				self._skip_sources(domain_name, [source])
+			elif future.done():
+				continue  # finished just now; collected by the next wait()
+			else:
+				self.source_states.record_abandoned(source.id, token)
+				self._record_progress(domain_name, 'abandoned')
+				logger.warning(f"Abandoning source '{source.source_name}': {reason}.")
+			dropped.add(future)
+		return dropped
+
+	def _run_source(self, source, token, agent_module, foreman_handler, credentials) -> bool:
+		"""Worker entry point: starts the source's deadline and processes it. False if cancelled before it started."""
+		if token.cancelled:
+			self.skipped_sources.add(source.id)
+			return False
+		token.start_deadline(self.source_timeout)
+		self._process_source(source, agent_module, foreman_handler, credentials, token)
+		return True
+
+	def _process_source(self, source, agent_module, foreman_handler, credentials, token=None):
 		"""Process a single source - agent → foreman → filing."""
+		if hasattr(agent_module, 'hunt_stream'):
+			self._stream_source(source, agent_module, foreman_handler, credentials, token)
+			return
 		# 1. Hunt
 		raw_leads, bookmark = agent_module.hunt(source, credentials)
+		if token is not None and token.abandoned:
+			# Already recorded as a failure and counted; the hunt has moved on without it
+			logger.warning(f"Source '{source.source_name}' returned after it was abandoned; "
+			               f"dropping {len(raw_leads or [])} leads.")
+			return
+		self._file_hunt_result(source, raw_leads, bookmark, foreman_handler, token)
+
+	def _stream_source(self, source, agent_module, foreman_handler, credentials, token=None):
+		"""
+		agent → foreman → filing as a pipeline, for agents that define
+		`hunt_stream(source, credentials)`: a generator that yields raw items and
+		`return`s the new bookmark. Items are translated a micro-batch at a time
+		on a producer thread and filed on this one as each batch is ready, so the
+		first leads reach staging before the agent is done and memory holds a few
+		batches rather than the whole hunt. The bookmark is only recorded once
+		everything has been filed; an agent failure part-way, or a batch the
+		clerk couldn't file (LeadFilingError), leaves it untouched.
+		A cancelled `token` stops the stream between batches with HuntCancelled,
+		keeping what was filed but not the bookmark.
+		"""
+		stream = ReturnValue(agent_module.hunt_stream(source, credentials))
+		batches = self._translated_batches(source, stream, foreman_handler)
+		stop = (lambda: token.cancelled) if token is not None else None
+		def file_batch(leads):
+			if not self.filing_clerk.file_leads(leads):
+				raise LeadFilingError(f"Source '{source.source_name}': a batch of {len(leads)} leads wasn't filed.")
 
+		try:
+			filed = run_pipeline(batches, file_batch, self.stream_pending_batches, stop)
+		except PipelineStopped as e:
+			raise HuntCancelled(f"{token.reason}; {e}") from e
+
+		if not self.source_states.record_success(source.id, stream.value, token):
+			logger.warning(f"Source '{source.source_name}' finished streaming after it was abandoned; "
+			               f"{filed} leads filed, bookmark not advanced.")
+			return
+		logger.info(f"Source '{source.source_name}' done. Streamed {filed} leads. Bookmark: {stream.value}")
+
+	def _translated_batches(self, source, raw_items, foreman_handler):
+		"""Micro-batches of LeadData. Foremen with translate_iter translate item by item; others per batch."""
+		if inspect.isclass(foreman_handler):
+			foreman_instance = foreman_handler(source)
+			if hasattr(foreman_instance, 'translate_iter'):
+				yield from iter_batches(foreman_instance.translate_iter(raw_items), self.filing_batch_size)
+				return
+			translate = foreman_instance.translate_leads
+		else:
+			def translate(raw_batch):
+				return foreman_handler.translate(raw_batch, source.source_name)
+		for raw_batch in iter_batches(raw_items, self.filing_batch_size):
+			yield translate(raw_batch)
+
+	def _file_hunt_result(self, source, raw_leads, bookmark, foreman_handler, token=None):
+		"""
+		Translate → file → record state, for one source's hunt result. If `token`
+		is abandoned meanwhile (a deadline or Cancel while filing), the failure
+		already recorded stands and the bookmark stays put; leads the clerk
+		couldn't file raise LeadFilingError, which the caller records as a failure.
+		"""
 		if not raw_leads:
-			db_manager.update_source_state(source.id, success=True)
+			self.source_states.record_success(source.id, token=token)
 			logger.info(f"Agent for '{source.source_name}' returned no new leads.")
 			return
 
@@ -139,14 +569,22 @@ class Dispatcher:
 			processed_leads = foreman_handler.translate(raw_leads, source.source_name)
 
 		if not processed_leads:
-			db_manager.update_source_state(source.id, success=True)
+			self.source_states.record_success(source.id, token=token)
 			return
 
 		# 3. File
-		self.filing_clerk.file_leads(processed_leads)
+		if token is not None and token.abandoned:
+			logger.warning(f"Source '{source.source_name}' was abandoned before filing; "
+			               f"dropping {len(processed_leads)} leads.")
+			return
+		if not self.filing_clerk.file_leads(processed_leads):
+			# Keep the old bookmark so the next hunt sees these leads again (filed ones dedup)
+			raise LeadFilingError(f"Source '{source.source_name}': not every lead was filed.")
 
-		# 4. Update state
-		db_manager.update_source_state(source.id, success=True, new_bookmark=bookmark)
+		# 4. Update state (written in bulk when the domain finishes)
+		if not self.source_states.record_success(source.id, bookmark, token):
+			logger.warning(f"Source '{source.source_name}' was abandoned while filing; bookmark not advanced.")
+			return
 		logger.info(f"Source '{source.source_name}' done. Bookmark: {bookmark}")
 
 	def _get_credentials(self, agent_type):
@@ -157,3 +595,172 @@ class Dispatcher:
 				return self.config.get_gnews_io_credentials()
 			case _:
 				return None
+
+
+# Threads shared by every blocking agent (PRAW, requests) in an AsyncDispatcher hunt.
+ASYNC_EXECUTOR_WORKERS = 8
+# Hunt results waiting to be filed; a full queue makes agents wait instead of piling up leads.
+FILING_QUEUE_SIZE = 64
+
+
+class AsyncDispatcher(Dispatcher):
+	"""
+	Runs a whole hunt on one asyncio event loop in one background thread.
+
+	Agents that define `async def hunt_async(source, credentials)` run natively on
+	the loop; plain `hunt()` agents run in a single shared, bounded executor, and
+	`hunt_stream()` agents run their whole streaming pipeline there.
+	max_concurrent_requests is enforced per domain with a semaphore, and each
+	source's await is bounded by its token (see CancelToken). Each result
+	is queued for filing the moment its source finishes, and one filing thread
+	drains the queue, so hundreds of sources cost a handful of threads instead
+	of a thread pool per domain.
+
+	dispatch() returns a threading.Event, the same contract as Dispatcher.
+	"""
+
+	def __init__(self, config, executor_workers: int = ASYNC_EXECUTOR_WORKERS):
+		super().__init__(config)
+		self.executor_workers = executor_workers
+
+	def dispatch(self, domains=None, hunt_token=None):
+		hunt_token = hunt_token or self.new_hunt_token()
+		if domains is None:
+			domains = db_manager.get_domains_with_sources()
+
+		self.all_threads_done = threading.Event()
+		if not domains:
+			logger.info("No active domains/sources found.")
+			self.all_threads_done.set()
+			return self.all_threads_done
+
+		# Only the executor's blocking agents and the filing thread hold connections
+		self._before_hunt(self.executor_workers + 1)
+		rate_limiter.configure_domains(domains)
+		self._start_progress(domains)
+
+		thread = threading.Thread(target=self._run_loop, args=(domains, hunt_token), name="async-dispatcher",
+		                          daemon=True)
+		self.active_threads = {'async-dispatcher': thread}
+		thread.start()
+		return self.all_threads_done
+
+	def _run_loop(self, domains, hunt_token):
+		try:
+			asyncio.run(self._hunt_all(domains, hunt_token))
+		except Exception as e:
+			logger.error(f"Async hunt aborted: {e}")
+		finally:
+			self._after_hunt()
+			self._finish_progress(hunt_token)
+			self.all_threads_done.set()
+
+	async def _hunt_all(self, domains, hunt_token):
+		# executor_workers slots gate the executor; an abandoned agent gives its slot back but keeps its
+		# thread, so the pool may grow by one thread per abandoned source (threads are only made on demand)
+		executor_slots = asyncio.Semaphore(self.executor_workers)
+		source_count = sum(len(info['sources']) for info in domains.values())
+		hunt_executor = ThreadPoolExecutor(max_workers=self.executor_workers + source_count, thread_name_prefix="hunt")
+		filing_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="filing")
+		filing_queue = asyncio.Queue(maxsize=FILING_QUEUE_SIZE)
+		filer = asyncio.create_task(self._filing_worker(filing_queue, filing_executor))
+		try:
+			hunts = []
+			for domain_name, domain_info in domains.items():
+				agent_type = domain_info['agent_type']
+				foreman_name = f"{agent_type}_foreman"
+				if foreman_name not in self.foreman_map:
+					logger.error(f"No foreman found for '{foreman_name}', skipping domain '{domain_name}'")
+					self._skip_sources(domain_name, domain_info['sources'])
+					continue
+				try:
+					agent_module = self._load_agent(agent_type)
+				except ImportError as e:
+					logger.critical(f"Failed to import agent for '{agent_type}': {e}")
+					self._skip_sources(domain_name, domain_info['sources'])
+					continue
+
+				semaphore = asyncio.Semaphore(domain_info['max_concurrent'] or 1)
+				credentials = self._get_credentials(agent_type)
+				domain_token = hunt_token.child(self.domain_timeout)
+				for source in domain_info['sources']:
+					hunts.append(self._hunt_source(domain_name, source, domain_token.child(), agent_module,
+					                               self.foreman_map[foreman_name], credentials, semaphore,
+					                               hunt_executor, executor_slots, filing_queue))
+
+			await asyncio.gather(*hunts)
+			await filing_queue.join()
+			logger.info(f"Async hunt complete. Processed {len(hunts)} sources.")
+		finally:
+			filer.cancel()
+			# Abandoned agents may still be blocked in a call; nobody waits for them
+			hunt_executor.shutdown(wait=False, cancel_futures=True)
+			filing_executor.shutdown(wait=True)
+
+	async def _hunt_source(self, domain_name, source, token, agent_module, foreman_handler, credentials, semaphore,
+	                       executor, executor_slots, filing_queue):
+		hunt_async = getattr(agent_module, 'hunt_async', None)
+		streaming = hasattr(agent_module, 'hunt_stream')
+		async with semaphore:
+			if token.cancelled:
+				self._skip_sources(domain_name, [source])
+				return
+			try:
+				if not streaming and hunt_async is not None and inspect.iscoroutinefunction(hunt_async):
+					token.start_deadline(self.source_timeout)
+					result = await self._await_with_token(hunt_async(source, credentials), token)
+				else:
+					if streaming:
+						# Streaming agents pipeline straight into filing on their executor thread
+						call = (self._stream_source, source, agent_module, foreman_handler, credentials, token)
+					else:
+						call = (agent_module.hunt, source, credentials)
+					async with executor_slots:
+						token.start_deadline(self.source_timeout)
+						loop = asyncio.get_running_loop()
+						result = await self._await_with_token(loop.run_in_executor(executor, *call), token)
+				if streaming:
+					self._record_progress(domain_name, 'done')
+					return
+				raw_leads, bookmark = result
+			except rate_limiter.RateLimitExceeded as e:
+				self._defer_source(domain_name, source, e)
+				return
+			except HuntCancelled as e:
+				self.source_states.record_abandoned(source.id, token)
+				self._record_progress(domain_name, 'abandoned')
+				logger.warning(f"Abandoning source '{source.source_name}': {e}.")
+				return
+			except Exception as e:
+				self.source_states.record_failure(source.id)
+				self._record_progress(domain_name, 'failed')
+				logger.error(f"Source '{source.source_name}' failed: {e}")
+				return
+		await filing_queue.put((domain_name, source, raw_leads, bookmark, foreman_handler))
+
+	@staticmethod
+	async def _await_with_token(awaitable, token):
+		"""Awaits `awaitable`, cancelling it and raising HuntCancelled once `token` is cancelled."""
+		task = asyncio.ensure_future(awaitable)
+		while True:
+			done, _ = await asyncio.wait({task}, timeout=DEADLINE_POLL_SECONDS)
+			if done:
+				return task.result()
+			if (reason := token.reason) is not None:
+				task.cancel()
+				raise HuntCancelled(reason)
+
+	async def _filing_worker(self, filing_queue, filing_executor):
+		loop = asyncio.get_running_loop()
+		while True:
+			domain_name, source, raw_leads, bookmark, foreman_handler = await filing_queue.get()
+			try:
+				await loop.run_in_executor(filing_executor, self._file_hunt_result,
+				                           source, raw_leads, bookmark, foreman_handler)
+				self._record_progress(domain_name, 'done')
+			except Exception as e:
+				self.source_states.record_failure(source.id)
+				self._record_progress(domain_name, 'failed')
+				logger.error(f"Filing for source '{source.source_name}' failed: {e}")
+			finally:
+				filing_queue.task_done()
@@ -0,0 +1,127 @@
+# ==========================================================
+# Hunter's Command Console - Dossier Cache
+# Keeps recently viewed (and prefetched) lead bodies, rehydrated
+# metadata and sanitized HTML in a byte-bounded LRU, so flipping
+# back and forth between leads on the triage desk doesn't
+# re-query the database or re-run the sanitizer.
+#
+# Entries are dropped when process_triage() files their leads.
+# Prefetch runs on one background thread; a new prefetch request
+# replaces whatever was still queued from the previous selection.
+# ==========================================================
+
+import logging
+import queue
+import sys
+import threading
+import uuid
+from typing import Iterable, Optional
+
+from hunter import db_manager
+from hunter.html_parsers import html_sanitizer
+from hunter.utils.lru_cache import ByteLRUCache
+
+logger = logging.getLogger("Dossier Cache")
+
+DOSSIER_CACHE_BYTES = 64 * 1024 * 1024
+PREFETCH_COUNT = 5
+
+_ERROR_HTML = "<html><body><h2>Error</h2><p>Could not retrieve lead details from the database.</p></body></html>"
+
+
+class Dossier:
+	"""Everything the dossier viewer needs for one lead."""
+
+	__slots__ = ("details", "raw_html", "styled_html", "size")
+
+	def __init__(self, details: Optional[dict], raw_html: str, styled_html: Optional[str]):
+		self.details = details
+		self.raw_html = raw_html
+		self.styled_html = styled_html
+		self.size = _estimate_size(details, raw_html, styled_html)
+
+
+def _estimate_size(details: Optional[dict], raw_html: str, styled_html: Optional[str]) -> int:
+	"""Approximate bytes held; the bodies dominate, so metadata is only counted shallowly."""
+	size = sys.getsizeof(raw_html) + sys.getsizeof(styled_html or "")
+	for value in (details or {}).values():
+		size += sys.getsizeof(value)
+	return size
+
+
+def build_dossier(lead_uuid: uuid.UUID, title: str) -> Dossier:
+	"""Fetches and sanitizes one lead. A failed fetch yields an error page (and is not cached)."""
+	details = db_manager.get_staged_lead_details(lead_uuid)
+	if details:
+		# Prioritize HTML, but fall back to plain text if HTML is missing
+		raw_html = details.get("full_html")
+		if not raw_html:
+			plain_text = details.get("full_text") or "No content available for this lead."
+			raw_html = f"<p>{plain_text}</p>"
+	else:
+		logger.error(f"Could not find details for lead {lead_uuid}.")
+		raw_html = _ERROR_HTML
+	return Dossier(details, raw_html, html_sanitizer.sanitize_and_style(raw_html, title))
+
+
+class DossierCache:
+	"""
+	  dossier = cache.get(lead_uuid, title)        # cached, or built now
+	  cache.prefetch([(lead_uuid, title), ...])    # warm the next few leads off-thread
+	"""
+
+	def __init__(self, max_bytes: int = DOSSIER_CACHE_BYTES):
+		self._cache = ByteLRUCache(max_bytes, sizeof=lambda dossier: dossier.size)
+		self._queue = queue.Queue()
+		self._generation = 0
+		self._gen_lock = threading.Lock()
+		self._thread = threading.Thread(target=self._prefetch_worker, name="dossier-prefetch", daemon=True)
+		self._thread.start()
+		db_manager.add_triage_listener(self.invalidate)
+
+	def get(self, lead_uuid: uuid.UUID, title: str) -> Dossier:
+		dossier = self._cache.get(lead_uuid)
+		if dossier is None:
+			dossier = build_dossier(lead_uuid, title)
+			if dossier.details:
+				self._cache.put(lead_uuid, dossier)
+		return dossier
+
+	def prefetch(self, leads: Iterable[tuple]):
+		"""Queues (lead_uuid, title) pairs for background loading, superseding earlier requests."""
+		with self._gen_lock:
+			self._generation += 1
+			generation = self._generation
+		for lead_uuid, title in leads:
+			if lead_uuid not in self._cache:
+				self._queue.put((generation, lead_uuid, title))
+
+	def invalidate(self, lead_uuids: Iterable[uuid.UUID]):
+		dropped = self._cache.invalidate(lead_uuids)
+		if dropped:
+			logger.debug(f"Dropped {dropped} cached dossier(s) for filed leads.")
+
+	def clear(self):
+		self._cache.clear()
+
+	def stats(self) -> dict:
+		return self._cache.stats()
+
+	def close(self):
+		self._queue.put(None)
+
+	def _prefetch_worker(self):
+		while True:
+			item = self._queue.get()
+			if item is None:
+				return
+			generation, lead_uuid, title = item
+			if generation != self._generation or lead_uuid in self._cache:
+				continue  # The selection moved on, or it's already warm
+			try:
+				dossier = build_dossier(lead_uuid, title)
+			except Exception as e:
+				logger.warning(f"Prefetch failed for lead {lead_uuid}: {e}")
+				continue
+			if dossier.details:
+				self._cache.put(lead_uuid, dossier)
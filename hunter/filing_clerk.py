@@ -1,54 +1,189 @@
 # ==========================================================
-# Hunter's Command Console - Filing Clerk (v3 - Lean)
+# Hunter's Command Console - Filing Clerk (v4 - Batched)
 # ==========================================================
 
 import logging
+import os
+import threading
+from datetime import datetime, timezone, timedelta
+
 from hunter.models import LeadData
 from hunter import db_manager
+from hunter.utils import path_utils
+from hunter.utils.bloom_filter import BloomFilter
+from hunter.utils.url_canonicalizer import canonicalize_url
 
 logger = logging.getLogger("Filing Clerk")
 
+# --- URL Pre-Dedup Filter ---
+URL_FILTER_PATH = os.path.join(path_utils.get_project_root(), "data", "url_bloom.bin")
+URL_FILTER_CAPACITY = 500_000
+URL_FILTER_ERROR_RATE = 0.01
+# Bump whenever the spelling of filter keys changes; a filter saved with another format is rebuilt.
+# 1: canonicalize_url() keys.
+URL_FILTER_KEY_FORMAT = 1
+# Re-read this much router history on every warm-up to cover clock skew with PostgreSQL.
+URL_FILTER_WARM_OVERLAP = timedelta(minutes=5)
+
 
 class FilingClerk:
 	"""
 	The master librarian. No longer carries a database connection;
 	it delegates all storage operations to the db_manager.
+
+	Keeps an in-process Bloom filter of every item_url in acquisition_router.
+	URLs the filter has never seen are definitely new and skip the database
+	duplicate check; only "maybe seen" URLs are sent to PostgreSQL.
 	"""
 
 	def __init__(self):
+		self.url_filter = None
+		self._url_filter_ready = False
+		self._stats_lock = threading.Lock()
+		self._filter_stats = {'checked': 0, 'definitely_new': 0, 'maybe_seen': 0, 'confirmed_seen': 0}
 		logger.info("Filing Clerk is on duty.")
 
-	def file_leads(self, leads: list[LeadData]):
-		if not leads:
+	# --- URL Filter Lifecycle ---
+
+	def warm_url_filter(self):
+		"""
+		Loads the URL filter from disk (or builds it) and catches up with any
+		router rows added since it was last warmed. Cheap after the first call.
+		"""
+		try:
+			if self.url_filter is None:
+				self.url_filter = self._load_url_filter()
+
+			since = None
+			if self.url_filter.watermark:
+				since = datetime.fromtimestamp(self.url_filter.watermark, tz=timezone.utc) - URL_FILTER_WARM_OVERLAP
+
+			started_at = datetime.now(timezone.utc)
+			added = 0
+			for page in db_manager.iter_router_urls(since=since):
+				# item_url is stored as fetched; the filter is keyed by canonical URL.
+				self.url_filter.update(canonicalize_url(url) for url in page)
+				added += len(page)
+			self.url_filter.watermark = started_at.timestamp()
+			self._url_filter_ready = True
+			logger.info(f"URL filter warmed ({'full build' if since is None else 'delta'}: {added} URLs, "
+			            f"{len(self.url_filter)} total).")
+			if self._replace_if_saturated():
+				# The replacement is twice the size, so this full build doesn't recurse again.
+				self.warm_url_filter()
+		except Exception as e:
+			# Without a trustworthy filter every URL goes to the database, as before.
+			self._url_filter_ready = False
+			logger.error(f"Failed to warm URL filter, falling back to database dedup: {e}")
+
+	def save_url_filter(self):
+		if not self._url_filter_ready:
 			return
+		try:
+			self.url_filter.save(URL_FILTER_PATH)
+		except OSError as e:
+			logger.warning(f"Could not persist URL filter to {URL_FILTER_PATH}: {e}")
+
+	def url_filter_stats(self) -> dict:
+		"""
+		Pre-dedup instrumentation. observed_fp_rate is the share of truly new
+		URLs the filter still sent to the database ("maybe seen" but not found).
+		"""
+		with self._stats_lock:
+			stats = dict(self._filter_stats)
+		false_positives = stats['maybe_seen'] - stats['confirmed_seen']
+		truly_new = stats['definitely_new'] + false_positives
+		stats['false_positives'] = false_positives
+		stats['observed_fp_rate'] = false_positives / truly_new if truly_new else 0.0
+		stats['estimated_fp_rate'] = self.url_filter.estimated_fp_rate() if self.url_filter else None
+		stats['filter_size'] = len(self.url_filter) if self.url_filter else 0
+		return stats
+
+	@staticmethod
+	def _new_url_filter(capacity: int | None = None) -> BloomFilter:
+		bloom = BloomFilter(capacity or URL_FILTER_CAPACITY, URL_FILTER_ERROR_RATE)
+		bloom.key_format = URL_FILTER_KEY_FORMAT
+		return bloom
+
+	@classmethod
+	def _load_url_filter(cls) -> BloomFilter:
+		if os.path.exists(URL_FILTER_PATH):
+			try:
+				bloom = BloomFilter.load(URL_FILTER_PATH)
+				if bloom.key_format != URL_FILTER_KEY_FORMAT:
+					logger.info(f"URL filter uses key format {bloom.key_format}, expected {URL_FILTER_KEY_FORMAT}; rebuilding.")
+				elif not bloom.is_saturated:
+					return bloom
+				else:
+					# Over capacity, the FP rate climbs fast; rebuild from scratch at double the size.
+					logger.info(f"URL filter saturated ({len(bloom)} URLs), rebuilding larger.")
+					return cls._new_url_filter(max(URL_FILTER_CAPACITY, len(bloom) * 2))
+			except (OSError, ValueError) as e:
+				logger.warning(f"Discarding unreadable URL filter: {e}")
+		return cls._new_url_filter()
+
+	def _replace_if_saturated(self) -> bool:
+		"""
+		Swaps a saturated filter for an empty one twice the size. Until the
+		next warm_url_filter() fills it, every URL goes to the database.
+		"""
+		bloom = self.url_filter
+		if bloom is None or not bloom.is_saturated:
+			return False
+		logger.info(f"URL filter saturated ({len(bloom)} URLs), rebuilding larger.")
+		self._url_filter_ready = False
+		self.url_filter = self._new_url_filter(max(URL_FILTER_CAPACITY, len(bloom) * 2))
+		return True
+
+	# --- Filing ---
+
+	def file_leads(self, leads: list[LeadData]) -> bool:
+		"""Files the new leads among `leads`. False if any of them couldn't be filed (errors are logged, not raised)."""
+		if not leads:
+			return True
+
+		# 1. Deduplication check (only "maybe seen" URLs cost a database round trip)
+		lead_urls = list(dict.fromkeys(lead.url for lead in leads))
+		if self._url_filter_ready:
+			# The filter is keyed by canonical URL; leads keep the URL as fetched
+			maybe_seen = [url for url in lead_urls if canonicalize_url(url) in self.url_filter]
+		else:
+			maybe_seen = lead_urls
+		existing_urls = set(db_manager.check_for_existing_leads_by_url(maybe_seen)) if maybe_seen else set()
 
-		# 1. Deduplication check
-		lead_urls = [lead.url for lead in leads]
-		existing_urls = db_manager.check_for_existing_leads_by_url(lead_urls)
+		if self._url_filter_ready:
+			with self._stats_lock:
+				self._filter_stats['checked'] += len(lead_urls)
+				self._filter_stats['definitely_new'] += len(lead_urls) - len(maybe_seen)
+				self._filter_stats['maybe_seen'] += len(maybe_seen)
+				self._filter_stats['confirmed_seen'] += len(existing_urls)
 
 		new_leads_to_file = [l for l in leads if l.url not in existing_urls]
 
 		if not new_leads_to_file:
 			logger.info("All leads were duplicates or no new leads to file.")
-			return
+			return True
+
+		# 2. Batched Filing (Router, Log, and Staging for the whole batch in one transaction)
+		try:
+			filed = db_manager.file_leads_bulk(new_leads_to_file)
+		except Exception as e:
+			logger.error(f"Error filing batch of {len(new_leads_to_file)} leads: {e}", exc_info=True)
+			return False
 
-		# 2. Sequential Filing
 		filed_count = 0
 		for lead in new_leads_to_file:
-			try:
-				source_id = db_manager.get_source_id(lead.source_name)
-
-				# file_new_lead now handles Router, Log, and Staging in one transaction
-				lead_uuid = db_manager.file_new_lead(lead, source_id)
-
-				if lead_uuid:
-					lead.lead_uuid = lead_uuid
-					logger.info(f"Filed new lead {lead.lead_uuid}: {lead.title}")
-					filed_count += 1
-				else:
-					logger.warning(f"Failed to file lead (Manager returned None): {lead.title}")
+			lead_uuid = filed.get(lead.url)
+			if lead_uuid:
+				lead.lead_uuid = lead_uuid
+				logger.info(f"Filed new lead {lead.lead_uuid}: {lead.title}")
+				filed_count += 1
+			else:
+				logger.warning(f"Failed to file lead (Manager returned None): {lead.title}")
 
-			except Exception as e:
-				logger.error(f"Error filing lead '{lead.title}': {e}", exc_info=True)
+		if self.url_filter is not None:
+			self.url_filter.update(canonicalize_url(url) for url, lead_uuid in filed.items() if lead_uuid)
+			self._replace_if_saturated()
 
 		logger.info(f"Filing complete. {filed_count}/{len(new_leads_to_file)} new leads added.")
+		return filed_count == len(new_leads_to_file)
@@ -5,9 +5,12 @@
 
 import logging
 from datetime import datetime, timezone
+from dataclasses import asdict
+from typing import Iterable, Iterator
 
 # Import our new, standardized data contracts
 from hunter.models import LeadData, GNewsMetadata
+from hunter.utils.url_canonicalizer import strip_tracking_params
 
 logger = logging.getLogger("GNewsIO Foreman")
 logger.addHandler(logging.NullHandler())
@@ -38,7 +41,15 @@ class GNewsIOForeman:
 		Returns:
 			A list of validated LeadData objects, ready for the dispatcher.
 		"""
-		processed_leads = []
+		processed_leads = list(self.translate_iter(raw_articles))
+		logger.info(f"Successfully translated {len(processed_leads)} articles into LeadData objects.")
+		return processed_leads
+
+	def translate_iter(self, raw_articles: Iterable[dict]) -> Iterator[LeadData]:
+		"""
+		Lazy translate_leads for the streaming pipeline: each article is
+		translated only when the next lead is asked for.
+		"""
 		for article in raw_articles:
 			try:
 				# The translation process is now a formal object creation.
@@ -47,16 +58,13 @@ class GNewsIOForeman:
 				# at the source.
 				lead = self._translate_single_article(article)
 				if lead:
-					processed_leads.append(lead)
+					yield lead
 			except (ValueError, TypeError, KeyError) as e:
 				# Catching potential errors during translation (e.g., bad date format)
 				# or validation errors from the LeadData.__post_init__
 				logger.error(f"Failed to translate article '{article.get('title')}'. Reason: {e}")
 				continue  # Skip this lead and move to the next
 
-		logger.info(f"Successfully translated {len(processed_leads)} articles into LeadData objects.")
-		return processed_leads
-
 	def _translate_single_article(self, article_data: dict) -> LeadData | None:
 		"""
 		Forge a single raw article dictionary into a LeadData object.
@@ -87,13 +95,13 @@ class GNewsIOForeman:
 		# The .get() method is used for optional fields to avoid KeyErrors.
 		lead = LeadData(
 				title=article_data['title'],
-				url=article_data['url'],
+				url=strip_tracking_params(article_data['url']),
 				source_name=self.source_name,  # Use the high-level source name
 				publication_date=publication_date,
 				text=article_data.get('content'),
 				image_url=article_data.get('image'),
 				# Pack the forged metadata object into the 'metadata' field.
-				metadata=gnews_metadata.__dict__
+				metadata=asdict(gnews_metadata)
 		)
 
 		return lead
@@ -6,9 +6,11 @@
 import logging
 from datetime import datetime, timezone
 from dataclasses import asdict
+from typing import Iterable, Iterator
 
 # Import our new, standardized data contracts
 from hunter.models import LeadData, RedditMetadata, RedditMedia
+from hunter.utils.url_canonicalizer import strip_tracking_params
 
 logger = logging.getLogger('Reddit Foreman')
 
@@ -31,20 +33,25 @@ class RedditForeman:
 		Takes a list of raw post dictionaries from the Reddit agent
 		and translates them into a list of standardized LeadData objects.
 		"""
-		processed_leads = []
+		processed_leads = list(self.translate_iter(raw_posts))
+		logger.info(f"Successfully translated {len(processed_leads)} Reddit posts into LeadData objects.")
+		return processed_leads
+
+	def translate_iter(self, raw_posts: Iterable[dict]) -> Iterator[LeadData]:
+		"""
+		Lazy translate_leads for the streaming pipeline: each post is translated
+		only when the next lead is asked for.
+		"""
 		for post in raw_posts:
 			try:
 				# The translation process is now a formal object creation.
 				lead = self._translate_single_post(post)
 				if lead:
-					processed_leads.append(lead)
+					yield lead
 			except (ValueError, TypeError, KeyError) as e:
 				logger.error(f"Failed to translate Reddit post '{post.get('title')}'. Reason: {e}")
 				continue  # Skip this lead and move to the next
 
-		logger.info(f"Successfully translated {len(processed_leads)} Reddit posts into LeadData objects.")
-		return processed_leads
-
 	def _translate_single_post(self, post_data: dict) -> LeadData | None:
 		"""
 		Forge a single raw post dictionary into a LeadData object.
@@ -59,7 +66,7 @@ class RedditForeman:
 				is_self=post_data.get('is_self')
 		)
 
-		metadata_asdict = reddit_metadata.__dict__
+		metadata_asdict = asdict(reddit_metadata)
 
 		if (flair := post_data.get('flair')) is not None:
 			metadata_asdict['flair'] = flair
@@ -71,7 +78,7 @@ class RedditForeman:
 					duration=post_data.get('media_duration'),
 					type=post_data.get('media_type')
 			)
-			metadata_asdict['media'] = reddit_media.__dict__
+			metadata_asdict['media'] = asdict(reddit_media)
 
 		# Step 2: Parse the publication date. Reddit provides a UTC timestamp.
 		try:
@@ -85,7 +92,7 @@ class RedditForeman:
 		# Step 3: Forge the final, validated LeadData object.
 		lead = LeadData(
 				title=post_data['title'],
-				url=post_data['url'],
+				url=strip_tracking_params(post_data['url']),
 				source_name=self.source_name,
 				publication_date=publication_date,
 				text=post_data.get('selftext'),
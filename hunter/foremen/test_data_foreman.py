@@ -7,6 +7,7 @@ import random
 import logging
 from datetime import datetime, timezone, timedelta
 from search_agents import test_data_agent
+from hunter.utils.url_canonicalizer import strip_tracking_params
 
 # Get a logger for this module
 logger = logging.getLogger("Test Foreman")
@@ -61,7 +62,7 @@ def _translate_lead(raw_lead, source_id, source_name):
 
 		standardized_report = {
 			"title":            raw_lead.get('title', 'Untitled Test Lead'),
-			"url":              raw_lead.get('url', ''),
+			"url":              strip_tracking_params(raw_lead.get('url', '')),
 			"publication_date": publication_date,
 			"text_content":     raw_lead.get('text', ''),
 			"html_content":     raw_lead.get('html'),
@@ -15,7 +15,7 @@ import os
 import re
 import time
 import textwrap
-from datetime import datetime
+from datetime import datetime, timedelta
 from PIL import Image
 import tkinterweb
 from functools import partial
@@ -25,10 +25,12 @@ from tkinter import ttk, messagebox, Menu
 from hunter import config_manager
 from hunter import db_manager
 from hunter.custom_widgets.tooltip import TkToolTip
-from hunter.html_parsers import html_sanitizer, link_extractor
+from hunter.html_parsers import link_extractor
 from hunter.utils import logger_setup
-from hunter.dispatcher import Dispatcher
-from hunter.models import LeadData
+from hunter.dispatcher import Dispatcher, AsyncDispatcher, ASYNC_EXECUTOR_WORKERS
+from hunter.scheduler import HuntScheduler, DEFAULT_INTERVAL
+from hunter.dossier_cache import DossierCache, PREFETCH_COUNT
+from hunter.models import LeadData, TriageHeader, StagedLeadHit
 
 log_queue = logger_setup.setup_logging()
 
@@ -71,6 +73,7 @@ SUCCESS_COLOR = GUI_CONFIG.get("success_color", "#6BFFB8")
 WARNING_COLOR = GUI_CONFIG.get("warning_color", "#FFD700")
 TIMESTAMP_COLOR = GUI_CONFIG.get("timestamp_color", "gray70")
 LINK_VISITED_COLOR = GUI_CONFIG.get("link_visited_color", "#B2A2D4")
+TRIAGE_PAGE_SIZE = int(GUI_CONFIG.get("triage_page_size", 200))
 
 
 def _is_scrolled_to_bottom(textbox):
@@ -115,9 +118,14 @@ class HunterApp(ctk.CTk):
 			return
 
 		self.dispatcher = None
+		self.scheduler = None
 		self.config = config_manager  # Assuming module-level access
 
 		self.tree_tooltip = None
+		self._triage_generation = 0
+		self._triage_groups = {}  # group item id -> source_name
+		self._triage_loaded = set()
+		self.dossier_cache = DossierCache()
 
 		if not self._init_db_and_components():
 			self.after(100, self.destroy)
@@ -155,10 +163,24 @@ class HunterApp(ctk.CTk):
 
 		# 2. Initialize Dispatcher (No connection passed!)
 		try:
-			self.dispatcher = Dispatcher(self.config)
+			dispatcher_config = self.config.get_dispatcher_config()
+			if dispatcher_config.get('mode', 'threaded').lower() == 'async':
+				workers = int(dispatcher_config.get('async_workers', ASYNC_EXECUTOR_WORKERS))
+				self.dispatcher = AsyncDispatcher(self.config, executor_workers=workers)
+			else:
+				self.dispatcher = Dispatcher(self.config)
 		except Exception as e:
 			logger.critical(f"FATAL: Components failed: {e}")
 			return False
+		self.dispatcher.add_progress_listener(self._on_hunt_progress)
+
+		# 3. Optional background scheduler; manual hunts then go through it
+		scheduler_config = self.config.get_scheduler_config()
+		if scheduler_config.get('enabled', 'false').lower() in ('true', 'yes', '1'):
+			minutes = scheduler_config.get('default_interval_minutes')
+			default_interval = timedelta(minutes=float(minutes)) if minutes else DEFAULT_INTERVAL
+			self.scheduler = HuntScheduler(self.dispatcher, default_interval=default_interval)
+			self.scheduler.start()
 		return True
 
 	def build_triage_desk(self):
@@ -174,6 +196,18 @@ class HunterApp(ctk.CTk):
 		                           font=self.bold_font, text_color=TEXT_COLOR)
 		title_label.grid(row=0, column=0, padx=10, pady=10, sticky="w")
 
+		# Search box: Enter searches staged leads, an empty search restores the grouped desk
+		search_frame = ctk.CTkFrame(self.left_frame, fg_color="transparent")
+		search_frame.grid(row=0, column=0, columnspan=2, padx=10, pady=10, sticky="e")
+		self.search_entry = ctk.CTkEntry(search_frame, placeholder_text="Search leads...", width=240,
+		                                 font=self.main_font)
+		self.search_entry.pack(side="left", padx=(0, 5))
+		self.search_entry.bind('<Return>', self.run_triage_search)
+		self.search_entry.bind('<Escape>', self.clear_triage_search)
+		self.search_mode = ctk.CTkSegmentedButton(search_frame, values=["Words", "Fuzzy"], font=self.main_font)
+		self.search_mode.set("Words")
+		self.search_mode.pack(side="left")
+
 		# Style the Treeview to match dark theme
 		style = ttk.Style()
 		style.theme_use('default')
@@ -234,10 +268,16 @@ class HunterApp(ctk.CTk):
 		                                    command=self.confirm_triage_action, font=self.button_font)
 		self.confirm_button.grid(row=0, column=1, sticky="ew", padx=(5, 0))
 
+		# Live per-domain progress, pushed by the dispatcher
+		self.hunt_progress_label = ctk.CTkLabel(self.bottom_frame, text="", font=self.main_font, anchor="w",
+		                                        justify="left", wraplength=400)
+		self.hunt_progress_label.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(5, 0))
+
 		# Bind events for tooltips and clicks
 		self.triage_tree.bind('<Motion>', self.show_tree_tooltip)
 		self.triage_tree.bind('<Leave>', self.hide_tree_tooltip)
 		self.triage_tree.bind('<Double-1>', self.on_tree_double_click)
+		self.triage_tree.bind('<<TreeviewOpen>>', self.on_triage_group_open)
 
 		# Store lead data by tree item id
 		self.tree_lead_data = {}
@@ -293,6 +333,8 @@ class HunterApp(ctk.CTk):
 
 			# Wrap text to approx 60 chars to prevent extremely wide tooltips
 			display_text = textwrap.fill(lead.title, width=60)
+			if isinstance(lead, StagedLeadHit) and lead.snippet:
+				display_text += "\n\n" + textwrap.fill(" ".join(lead.snippet.split()), width=60)
 
 			# Create tooltip once if it doesn't exist
 			if not self.tree_tooltip:
@@ -328,6 +370,19 @@ class HunterApp(ctk.CTk):
 		if item_id and item_id in self.tree_lead_data:
 			lead = self.tree_lead_data[item_id]
 			self.display_lead_detail(lead)
+			self._prefetch_below(item_id)
+
+	def _prefetch_below(self, item_id, count: int = PREFETCH_COUNT):
+		"""Warms the dossier cache with the next few leads under item_id, in tree order."""
+		upcoming = []
+		next_id = self.triage_tree.next(item_id)
+		while next_id and len(upcoming) < count:
+			lead = self.tree_lead_data.get(next_id)
+			if lead is not None:
+				upcoming.append((lead.lead_uuid, lead.title))
+			next_id = self.triage_tree.next(next_id)
+		if upcoming:
+			self.dossier_cache.prefetch(upcoming)
 
 	def build_dossier_viewer(self):
 		self.tab_view = ctk.CTkTabview(self.right_frame, fg_color=DARK_BG)
@@ -350,29 +405,49 @@ class HunterApp(ctk.CTk):
 		self.log_textbox.configure(state="disabled")
 
 	def start_hunt(self):
-		"""Initiates a hunt in a background thread."""
+		"""Initiates a hunt in a background thread; the button cancels it until it finishes."""
 		logger.info("[APP]: Hunter dispatch requested...")
-		self.search_button.configure(state="disabled", text="Hunting...")
+		self.search_button.configure(text="Cancel Hunt", command=self.cancel_hunt)
 
-		# Dispatch handles its own data now
-		self.hunt_event = self.dispatcher.dispatch()
-		self.after(1000, self._check_hunt_status)
-
-	def _check_hunt_status(self):
-		if not self.hunt_event.is_set():
-			self.after(1000, self._check_hunt_status)
+		# Dispatch handles its own data now; a running scheduler must own every hunt
+		if self.scheduler:
+			self.hunt_event = self.scheduler.hunt_now()
 		else:
-			logger.info("[APP]: All hunt threads completed.")
-			self.search_button.configure(state="normal", text="Search for New Cases")
-			self.refresh_triage_list()
+			self.hunt_event = self.dispatcher.dispatch()
+		threading.Thread(target=self._wait_for_hunt, args=(self.hunt_event,), daemon=True).start()
+
+	def cancel_hunt(self):
+		logger.info("[APP]: Hunt cancel requested...")
+		self.search_button.configure(state="disabled", text="Cancelling...")
+		if self.scheduler:
+			self.scheduler.cancel()
+		else:
+			self.dispatcher.cancel()
+
+	def _wait_for_hunt(self, hunt_event):
+		hunt_event.wait()
+		self.after(0, self._on_hunt_finished)
+
+	def _on_hunt_finished(self):
+		logger.info("[APP]: All hunt threads completed.")
+		self.search_button.configure(state="normal", text="Search for New Cases", command=self.start_hunt)
+		self.refresh_triage_list()
+
+	def _on_hunt_progress(self, progress):
+		# Called from hunt threads; hand over to the Tk loop
+		self.after(0, self._show_hunt_progress, progress)
+
+	def _show_hunt_progress(self, progress):
+		self.hunt_progress_label.configure(text=progress.summary())
 
 	def refresh_triage_list(self):
 		"""
-		Fetches the latest untriaged leads from the database and populates the Treeview.
+		Reloads the triage desk from the database. Source groups and their counts
+		come from the trigger-maintained triage summary in one small query; a
+		group's leads are only fetched (keyset-paged, newest first) when it is
+		expanded, so the first screen costs the same no matter how large the
+		backlog is.
 		"""
-		import time
-		from collections import defaultdict
-
 		logger.info("[APP]: Refreshing Triage list from database...")
 		start_time = time.perf_counter()
 
@@ -380,51 +455,115 @@ class HunterApp(ctk.CTk):
 		for item in self.triage_tree.get_children():
 			self.triage_tree.delete(item)
 		self.tree_lead_data = {}
-		clear_time = time.perf_counter()
-
-		# Fetch leads from database (returns list[LeadData])
-		leads = db_manager.get_unprocessed_leads()
-		fetch_time = time.perf_counter()
-
-		if not leads:
-			logger.info("[APP]: No leads found for triage.")
-			return
+		self._triage_groups = {}
+		self._triage_loaded = set()
 
-		# Group leads by source_name
-		grouped_leads = defaultdict(list)
-		for lead in leads:
-			grouped_leads[lead.source_name].append(lead)
+		# A newer refresh supersedes any paging still in flight
+		self._triage_generation += 1
 
-		# Populate tree with grouped leads
-		for source_name, source_leads in grouped_leads.items():
-			# Insert parent (source group)
+		summary = db_manager.get_triage_summary()
+		for source_name, count in summary:
 			parent_id = self.triage_tree.insert(
 					'', 'end',
-					text=f"{source_name} ({len(source_leads)} new leads)",
+					text=f"{source_name} ({count} new leads)",
 					values=('', '', ''),
 					tags=('source_group',)
 			)
+			# Placeholder child so the group shows an expand arrow before it's loaded
+			self.triage_tree.insert(parent_id, 'end', text="Loading...", tags=('placeholder',))
+			self._triage_groups[parent_id] = source_name
 
-			# Insert children (individual leads)
-			for lead in source_leads:
-				# Format publication date
-				pub_date = lead.publication_date.strftime('%Y-%m-%d') if lead.publication_date else 'Unknown'
+		if not summary:
+			logger.info("[APP]: No leads found for triage.")
+			return
+		logger.info(f"[APP]: Triage desk shows {sum(count for _, count in summary)} leads in "
+		            f"{len(summary)} sources ({time.perf_counter() - start_time:.3f}s).")
 
-				# Truncate long titles
-				title = lead.title
-				display_title = title[:80] + '...' if len(title) > 80 else title
+	def run_triage_search(self, event=None):
+		"""Replaces the desk with ranked search hits for the search box text."""
+		query = self.search_entry.get().strip()
+		if not query:
+			self.refresh_triage_list()
+			return
 
-				lead_id = self.triage_tree.insert(
-						parent_id, 'end',
-						text=display_title,
-						values=(source_name, pub_date, ''),
-						tags=('lead_item',)
-				)
+		mode = 'trigram' if self.search_mode.get() == "Fuzzy" else 'fts'
+		start_time = time.perf_counter()
+		hits = db_manager.search_staged_leads(query, mode=mode, limit=TRIAGE_PAGE_SIZE)
+		elapsed = time.perf_counter() - start_time
 
-				# Store full lead data object
-				self.tree_lead_data[lead_id] = lead
+		for item in self.triage_tree.get_children():
+			self.triage_tree.delete(item)
+		self.tree_lead_data = {}
+		self._triage_groups = {}
+		self._triage_loaded = set()
+		self._triage_generation += 1
+
+		parent_id = self.triage_tree.insert(
+				'', 'end',
+				text=f"Search: {query} ({len(hits)} matches)",
+				values=('', '', ''),
+				tags=('source_group',),
+				open=True
+		)
+		for hit in hits:
+			pub_date = hit.publication_date.strftime('%Y-%m-%d') if hit.publication_date else 'Unknown'
+			display_title = hit.title[:80] + '...' if len(hit.title) > 80 else hit.title
+			lead_id = self.triage_tree.insert(
+					parent_id, 'end',
+					text=display_title,
+					values=(hit.source_name, pub_date, ''),
+					tags=('lead_item',)
+			)
+			self.tree_lead_data[lead_id] = hit
+
+		logger.info(f"[APP]: Search '{query}' ({mode}) found {len(hits)} leads in {elapsed * 1000:.0f} ms.")
+
+	def clear_triage_search(self, event=None):
+		self.search_entry.delete(0, 'end')
+		self.refresh_triage_list()
+
+	def on_triage_group_open(self, event=None):
+		"""Loads a source group's leads the first time it is expanded."""
+		parent_id = self.triage_tree.focus()
+		if parent_id not in self._triage_groups or parent_id in self._triage_loaded:
+			return
+		self._triage_loaded.add(parent_id)
+		self.triage_tree.delete(*self.triage_tree.get_children(parent_id))
+		self._load_triage_page(self._triage_generation, parent_id, None, time.perf_counter())
+
+	def _load_triage_page(self, generation, parent_id, after_cursor, start_time):
+		"""Fetches one keyset page of a source group into the tree and schedules the next."""
+		if generation != self._triage_generation:
+			return
+
+		source_name = self._triage_groups[parent_id]
+		headers, next_cursor = db_manager.get_triage_page(after_cursor, limit=TRIAGE_PAGE_SIZE,
+		                                                  source_filter=[source_name])
+
+		for header in headers:
+			# Format publication date
+			pub_date = header.publication_date.strftime('%Y-%m-%d') if header.publication_date else 'Unknown'
+
+			# Truncate long titles
+			title = header.title
+			display_title = title[:80] + '...' if len(title) > 80 else title
+
+			lead_id = self.triage_tree.insert(
+					parent_id, 'end',
+					text=display_title,
+					values=(source_name, pub_date, ''),
+					tags=('lead_item',)
+			)
 
-		logger.info(f"[APP]: Triage list updated with {len(leads)} leads.")
+			# Store the header; the full lead is fetched on demand
+			self.tree_lead_data[lead_id] = header
+
+		if next_cursor:
+			self.after_idle(self._load_triage_page, generation, parent_id, next_cursor, start_time)
+			return
+
+		logger.info(f"[APP]: Loaded {len(self.triage_tree.get_children(parent_id))} leads for '{source_name}' "
+		            f"in {time.perf_counter() - start_time:.2f}s.")
 
 	def _toggle_source_group(self, header, content_frame, leads):
 		header_label = header.winfo_children()[0]
@@ -494,7 +633,7 @@ class HunterApp(ctk.CTk):
 		logger.info(f"[APP]: Processed {processed_count} leads. Refreshing list...")
 		self.refresh_triage_list()
 
-	def display_lead_detail(self, lead_data: LeadData):
+	def display_lead_detail(self, lead_data: LeadData | TriageHeader):
 		for widget in self.detail_frame.winfo_children(): widget.destroy()
 		self.detail_frame.grid_rowconfigure(0, weight=3)
 		self.detail_frame.grid_rowconfigure(1, weight=1)
@@ -503,21 +642,13 @@ class HunterApp(ctk.CTk):
 		top_pane.grid(row=0, column=0, sticky="nsew")
 
 		lead_uuid = lead_data.lead_uuid
-		details_dict = db_manager.get_staged_lead_details(lead_uuid)
-
-		if details_dict:
-			# Prioritize HTML, but fall back to plain text if HTML is missing
-			raw_html = details_dict.get("full_html")
-			if not raw_html:
-				# If no HTML, wrap the plain text in simple paragraph tags
-				plain_text = details_dict.get("full_text", "No content available for this lead.")
-				raw_html = f"<p>{plain_text}</p>"
-		else:
-			# If the database call fails, create a simple error message
-			logger.error(f"[APP ERROR]: Could not find details for lead {lead_uuid}.")
-			raw_html = "<html><body><h2>Error</h2><p>Could not retrieve lead details from the database.</p></body></html>"
-
-		styled_html = html_sanitizer.sanitize_and_style(raw_html, lead_data.title)
+		# Body and metadata are only rehydrated (and sanitized) now that the dossier is open, then cached
+		dossier = self.dossier_cache.get(lead_uuid, lead_data.title)
+		details_dict = dossier.details
+		lead_text = details_dict.get("full_text") if details_dict else getattr(lead_data, 'text', None)
+		lead_metadata = details_dict.get("metadata") if details_dict else getattr(lead_data, 'metadata', None)
+		raw_html = dossier.raw_html
+		styled_html = dossier.styled_html
 
 		if styled_html:
 			html_viewer = tkinterweb.HtmlFrame(top_pane, messages_enabled=False,
@@ -535,7 +666,7 @@ class HunterApp(ctk.CTk):
 			text_box = ctk.CTkTextbox(top_pane, font=self.main_font, wrap="word", text_color=TEXT_COLOR,
 									  fg_color=DARK_GRAY)
 			text_box.pack(expand=True, fill="both")
-			text_box.insert("0.0", lead_data.text)
+			text_box.insert("0.0", lead_text or "")
 			text_box.configure(state="disabled")
 
 		bottom_pane = ctk.CTkFrame(self.detail_frame, fg_color=DARK_GRAY)
@@ -554,8 +685,8 @@ class HunterApp(ctk.CTk):
 			                        'url':       lead_data.url,
 			                        'type':      'url',
 			                        'lead_uuid': lead_data.lead_uuid})
-		if lead_data.metadata is not None:
-			metadata = lead_data.metadata
+		if lead_metadata is not None:
+			metadata = lead_metadata
 			if metadata.__contains__('article_url'):
 				metadata_link = metadata.get('article_url')
 				extracted_links.append({'text':      '🔗 Article URL',
@@ -897,4 +1028,6 @@ class HunterApp(ctk.CTk):
 		# TODO: add db_manager close connection.
 		#		if self.db_conn:
 		#			self.db_conn.close()
+		db_manager.close_training_writer()
+		self.dossier_cache.close()
 		self.destroy()
@@ -4,9 +4,7 @@
 #   File: image_viewer.py
 #   Purpose: Handles loading and viewing a single image
 #  ==========================================================
-import datetime
 import logging
-import os
 import sys
 import uuid
 
@@ -19,10 +17,13 @@ from screeninfo import get_monitors
 from hunter.models import Asset, ImageMetadata
 
 from .. import db_manager
+from ..utils.asset_store import AssetStore
 
 # Setup logger for this module
 logger = logging.getLogger("ImageViewer")
 
+_asset_store = AssetStore()
+
 # Import all filters (for the apply_filter sandbox)
 from .filters import CLAHE, edges, false_color, high_pass, bilateral, median, detail_enhance
 
@@ -208,12 +209,7 @@ class ImageViewer:
                     break
 
                 case 's':
-                    save_dir = "assets"
-                    # Ensure directory exists
-                    os.makedirs(save_dir, exist_ok=True)
-                    image_name = f"{save_dir}/saved_image_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                    self.save(image_name)
-                    logger.info(f"Image saved to {image_name}")
+                    self.save()
 
                 case 'e':
                     self.apply_filter("edges")
@@ -249,24 +245,33 @@ class ImageViewer:
             pass
         cv2.waitKey(1)
 
-    def save(self, output_path):
-        """Saves the image to a file."""
-        if self.image is not None:
-            cv2.imwrite(output_path, self.image)
-            file_size = os.path.getsize(output_path)
-            asset = Asset(
-                    source_uuid=self.source_uuid if self.source_uuid else None,
-                    file_path=output_path,
-                    file_type="image",
-                    mime_type="image/png",
-                    file_size=file_size,
-                    related_cases=[self.source_uuid] if self.source_uuid else [],
-                    metadata={
-                        "image_metadata": self.metadata.to_dict() if self.metadata else None
-                    }
-            )
-            logger.info(f"Image saved to {output_path}")
-            db_manager.save_asset(asset)
+    def save(self) -> str | None:
+        """Stores the current image (filters applied) in the asset store; returns its asset_id."""
+        if self.image is None:
+            return None
+        image = self.image.get() if isinstance(self.image, cv2.UMat) else self.image
+        ok, encoded = cv2.imencode(".png", image)
+        if not ok:
+            logger.error("Could not encode image as PNG.")
+            return None
+        stored = _asset_store.put_bytes(encoded.tobytes(), ".png")
+        asset = Asset(
+                source_uuid=self.source_uuid if self.source_uuid else None,
+                file_path=stored.file_path,
+                file_type="image",
+                mime_type="image/png",
+                file_size=stored.file_size,
+                content_hash=stored.content_hash,
+                related_cases=[self.source_uuid] if self.source_uuid else [],
+                metadata={
+                    "image_metadata": self.metadata.to_dict() if self.metadata else None
+                }
+        )
+        if stored.created:
+            logger.info(f"Image saved to {_asset_store.absolute_path(stored.file_path)}")
+        else:
+            logger.info(f"Identical image already stored at {stored.file_path}; linking it instead.")
+        return db_manager.save_asset(asset)
 
     def _mouse_handler(self, event, x, y, flags, param):
         if event == cv2.EVENT_LBUTTONDOWN:
@@ -6,9 +6,11 @@
 # data structures passed between different parts of the app.
 # ==========================================================
 import base64
+import dataclasses
 import uuid
+from collections.abc import Mapping
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, Any, Dict, List
 from logging import getLogger
 
@@ -22,7 +24,7 @@ logger = getLogger(__name__)
 # unique data points.
 # ==========================================================
 
-@dataclass
+@dataclass(slots=True)
 class RedditMedia:
 	"""A validated container for Reddit-specific media information."""
 	url: Optional[str] = None
@@ -30,7 +32,7 @@ class RedditMedia:
 	type: Optional[str] = None
 	duration: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class RedditMetadata:
 	"""A validated container for Reddit-specific metadata."""
 	score: Optional[int] = None
@@ -40,7 +42,7 @@ class RedditMetadata:
 	post_id: Optional[str] = None
 	is_self: Optional[bool] = None  # Indicates if a post is a text-only "self" post.
 
-@dataclass
+@dataclass(slots=True)
 class GNewsMetadata:
 	"""A validated container for GNews.io-specific metadata."""
 	# GNews.io provides a 'source' object with its own details.
@@ -105,6 +107,41 @@ class LeadData:
 			raise ValueError("LeadData must have either 'text' or 'html' content.")
 
 
+@dataclass
+class TriageHeader:
+	"""
+	The lightweight face of a staged lead, just enough to draw a row on the
+	triage desk. Body and metadata stay in the database until the dossier
+	is opened.
+	"""
+	lead_uuid: uuid.UUID
+	title: str
+	url: str
+	source_name: str
+	publication_date: Optional[datetime] = None
+
+
+@dataclass
+class StagedLeadHit(TriageHeader):
+	"""A TriageHeader returned by a staged-lead search, with its rank and a highlighted snippet."""
+	rank: float = 0.0
+	snippet: str = ""
+
+
+@dataclass
+class CaseSummary:
+	"""One row of a case search: enough to list the case, not its content."""
+	id: int
+	public_uuid: uuid.UUID
+	title: str
+	url: str
+	source_name: Optional[str]
+	publication_date: datetime
+	status: str
+	category: Optional[str] = None
+	rank: Optional[float] = None
+
+
 @dataclass
 class SourceConfig:
 	"""Configuration and state for a content source."""
@@ -130,6 +167,11 @@ class SourceConfig:
 	next_release_date: Optional[datetime] = None
 	has_standard_foreman: bool = True
 
+	# === Scheduling (migration 009) ===
+	poll_interval: Optional[timedelta] = None
+	next_due_at: Optional[datetime] = None
+	hit_rate: float = 0.0
+
 
 @dataclass
 class Asset:
@@ -139,6 +181,7 @@ class Asset:
 	file_type: Optional[str] = 'unknown'  # 'image', 'video', 'audio', 'document'
 	mime_type: Optional[str] = None
 	file_size: Optional[int] = None
+	content_hash: Optional[bytes] = None  # SHA-256 of the stored file (see utils/asset_store.py)
 	created_at: Optional[datetime] = None
 
 	source_type: Optional[str] = None  # 'lead', 'case', 'investigation', 'manual'
@@ -182,6 +225,19 @@ class Asset:
 				raise ValueError(f"Invalid source_type: {self.source_type}")
 
 
+@dataclass
+class AssetSummary:
+	"""An asset as listed for a case: the file and its type, without metadata or analysis JSON."""
+	asset_id: uuid.UUID
+	file_path: str
+	file_type: Optional[str]
+	mime_type: Optional[str]
+	file_size: Optional[int]
+	created_at: Optional[datetime]
+	original_url: Optional[str] = None
+	linked_at: Optional[datetime] = None
+
+
 @dataclass
 class ImageMetadata:
 	mime: Optional[str]
@@ -223,3 +279,115 @@ METADATA_EXTRA_FIELDS = {
 	'Reddit Paranormal': ['flair', 'media'],
 	# Other sources probably don't have extra fields
 }
+
+
+# ==========================================================
+# METADATA FIELD PLANS
+# The two maps above are compiled once per source into a plan:
+# the class's field names and defaults plus its extras. Applying a
+# plan is one dict build, with no dataclass construction per lead.
+# LazyMetadata defers even that until the metadata is first read.
+# ==========================================================
+
+_REQUIRED = object()
+
+
+class MetadataPlan:
+	"""How to rehydrate one source's raw JSONB metadata into its blueprint's shape."""
+
+	__slots__ = ("source_name", "fields", "extras", "allowed")
+
+	def __init__(self, source_name: str, metadata_class: type, extra_fields=()):
+		self.source_name = source_name
+		fields = []
+		for f in dataclasses.fields(metadata_class):
+			if f.default is not dataclasses.MISSING:
+				fields.append((f.name, f.default, False))
+			elif f.default_factory is not dataclasses.MISSING:
+				fields.append((f.name, f.default_factory, True))
+			else:
+				fields.append((f.name, _REQUIRED, False))
+		self.fields = tuple(fields)
+		self.extras = tuple(extra_fields)
+		self.allowed = frozenset(name for name, _, _ in fields) | frozenset(self.extras)
+
+	def rehydrate(self, raw: dict) -> dict:
+		"""
+		Blueprint fields first (missing ones take their defaults), then any extras
+		that are present. Raw metadata the blueprint can't hold is returned as-is.
+		"""
+		if not raw.keys() <= self.allowed:
+			unknown = ", ".join(sorted(raw.keys() - self.allowed))
+			logger.warning(f"Metadata rehydration failed for {self.source_name}: unexpected keys {unknown}")
+			return raw
+		merged = {}
+		for name, default, is_factory in self.fields:
+			if name in raw:
+				merged[name] = raw[name]
+			elif default is _REQUIRED:
+				logger.warning(f"Metadata rehydration failed for {self.source_name}: missing '{name}'")
+				return raw
+			else:
+				merged[name] = default() if is_factory else default
+		for name in self.extras:
+			if name in raw:
+				merged[name] = raw[name]
+		return merged
+
+
+_metadata_plans: Dict[str, Optional[MetadataPlan]] = {}
+
+
+def get_metadata_plan(source_name: str) -> Optional[MetadataPlan]:
+	"""The compiled plan for a source (None if it has no blueprint), built on first use."""
+	try:
+		return _metadata_plans[source_name]
+	except KeyError:
+		metadata_class = METADATA_CLASS_MAP.get(source_name)
+		plan = MetadataPlan(source_name, metadata_class, METADATA_EXTRA_FIELDS.get(source_name, ())) \
+			if metadata_class else None
+		_metadata_plans[source_name] = plan
+		return plan
+
+
+class LazyMetadata(Mapping):
+	"""
+	Read-only metadata mapping that applies its plan on first access. Lists of
+	thousands of leads carry these around without paying for rehydration until
+	a dossier actually reads one. Use to_dict() where a real dict is needed (JSON).
+	"""
+
+	__slots__ = ("_plan", "_raw", "_data")
+
+	def __init__(self, plan: MetadataPlan, raw: dict):
+		self._plan = plan
+		self._raw = raw
+		self._data = None
+
+	def _resolve(self) -> dict:
+		if self._data is None:
+			self._data = self._plan.rehydrate(self._raw)
+			self._raw = None
+		return self._data
+
+	def __getitem__(self, key):
+		return self._resolve()[key]
+
+	def __contains__(self, key) -> bool:
+		return key in self._resolve()
+
+	def __iter__(self):
+		return iter(self._resolve())
+
+	def __len__(self) -> int:
+		return len(self._resolve())
+
+	def get(self, key, default=None):
+		return self._resolve().get(key, default)
+
+	def to_dict(self) -> dict:
+		return dict(self._resolve())
+
+	def __repr__(self) -> str:
+		state = "pending" if self._data is None else repr(self._data)
+		return f"LazyMetadata({self._plan.source_name!r}, {state})"
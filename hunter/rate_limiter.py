@@ -0,0 +1,327 @@
+# ==========================================================
+# Hunter's Command Console - Rate Limiter
+# Token buckets shared by every agent thread that talks to the
+# same domain (plus an optional global one), configured from
+# source_domains (migration 010). Agents acquire() before each
+# request and hand the response's rate-limit headers back via
+# observe_headers(), so the limiter slows down before the API
+# starts answering 429:
+#   - short windows (Reddit's X-Ratelimit-*: ~600 per 10 min)
+#     are paced: what's left is spread over what's left of the
+#     window;
+#   - long windows (RapidAPI's x-ratelimit-requests-*, GNews'
+#     daily quota) are quotas: full speed until they run out,
+#     then RateLimitExceeded until they reset;
+#   - a 429/503 Retry-After pauses the whole domain.
+# daily_quota usage outlives the process: the dispatcher seeds
+# each limiter with what source_domains says was used today
+# and writes back what the hunt used (migration 012).
+# Clocks are injectable; tools/sim_rate_limiter.py drives these
+# classes on a simulated clock.
+# ==========================================================
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Hashable, Optional
+
+from hunter import config_manager
+
+logger = logging.getLogger("Rate Limiter")
+
+PACING_WINDOW = 3600  # header windows up to this many seconds are paced; longer ones are quotas
+MAX_WAIT = 300  # seconds acquire() will wait before giving up with RateLimitExceeded
+DEFAULT_RETRY_AFTER = 60  # pause after a 429 that doesn't say how long
+SECONDS_PER_DAY = 86400
+
+# (remaining, reset-in-seconds) header names, lower-cased, in the order they're tried
+RATE_LIMIT_HEADERS = (
+	('x-ratelimit-remaining', 'x-ratelimit-reset'),  # Reddit
+	('x-ratelimit-requests-remaining', 'x-ratelimit-requests-reset'),  # RapidAPI (see db_admin.log_api_call)
+)
+
+
+class RateLimitExceeded(Exception):
+	"""A request can't be made within the allowed wait (quota spent, or a long pause)."""
+
+	def __init__(self, key, retry_in: float):
+		super().__init__(f"Rate limit for '{key}' exhausted; retry in {retry_in:.0f}s")
+		self.key = key
+		self.retry_in = retry_in
+
+
+class TokenBucket:
+	"""
+	`rate` tokens per second up to `capacity`; rate None means unlimited.
+	reserve() is the non-blocking core: it takes the tokens and returns 0, or
+	returns how long to wait before asking again.
+	"""
+
+	def __init__(self, rate: Optional[float], capacity: float = 1.0, clock=time.monotonic):
+		self.clock = clock
+		self.rate = rate
+		self.capacity = max(capacity, 1.0)
+		self.tokens = self.capacity
+		self.paused_until = 0.0
+		self._updated = clock()
+		self._lock = threading.Lock()
+
+	def _refill(self, now: float):
+		if self.rate:
+			self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+		self._updated = now
+
+	def reserve(self, tokens: float = 1.0) -> float:
+		with self._lock:
+			now = self.clock()
+			self._refill(now)
+			if now < self.paused_until:
+				return self.paused_until - now
+			if self.rate is None:
+				return 0.0
+			# (with a little slack, so float drift can't leave a caller waiting on 1e-17 seconds)
+			if self.tokens >= tokens - 1e-9:
+				self.tokens = max(self.tokens - tokens, 0.0)
+				return 0.0
+			return (tokens - self.tokens) / self.rate if self.rate > 0 else math.inf
+
+	def pause(self, seconds: float):
+		"""No tokens for `seconds`, and none saved up for afterwards."""
+		with self._lock:
+			now = self.clock()
+			self._refill(now)
+			self.paused_until = max(self.paused_until, now + seconds)
+			self.tokens = 0.0
+
+	def refund(self, tokens: float = 1.0):
+		with self._lock:
+			self.tokens = min(self.capacity, self.tokens + tokens)
+
+	def set_rate(self, rate: Optional[float], capacity: Optional[float] = None, max_tokens: Optional[float] = None):
+		with self._lock:
+			self._refill(self.clock())
+			self.rate = rate
+			if capacity is not None:
+				self.capacity = max(capacity, 1.0)
+			self.tokens = min(self.tokens, self.capacity, math.inf if max_tokens is None else max_tokens)
+
+
+class DomainRateLimiter:
+	"""
+	The limiter for one domain: a pacing bucket (configured requests_per_minute,
+	tightened by short-window headers), an optional quota (daily_quota, or a
+	long-window header), and the process-wide global bucket, all consulted by
+	acquire().
+	"""
+
+	def __init__(self, key: Hashable, requests_per_minute: Optional[float] = None, burst: Optional[int] = None,
+	             daily_quota: Optional[int] = None, global_bucket: Optional[TokenBucket] = None,
+	             clock=time.monotonic, wall_clock=time.time, sleep=time.sleep):
+		self.key = key
+		self.clock = clock
+		self.wall_clock = wall_clock
+		self.sleep = sleep
+		self.global_bucket = global_bucket
+		self.bucket = TokenBucket(None, 1, clock)
+		self._lock = threading.Lock()
+		self.configure(requests_per_minute, burst, daily_quota)
+		self.quota_remaining = None  # from a long-window header, or counted down from daily_quota
+		self.quota_resets_at = 0.0  # wall-clock seconds
+		self.quota_unsaved = 0  # daily_quota requests made today and not yet handed to take_quota_usage()
+		self.stats = {'acquired': 0, 'waited': 0.0, 'throttled': 0, 'rejected': 0}
+
+	def configure(self, requests_per_minute: Optional[float], burst: Optional[int], daily_quota: Optional[int]):
+		"""Applies source_domains settings; adaptive state (pauses, quota counts) is kept."""
+		self.base_rate = requests_per_minute / 60 if requests_per_minute else None
+		self.daily_quota = daily_quota
+		self.bucket.set_rate(self.base_rate, burst or 1)
+
+	def seed_quota(self, used: int):
+		"""Counts `used` daily_quota requests made today elsewhere (earlier runs, other processes)."""
+		with self._lock:
+			self._quota_wait()
+			if not self.daily_quota:
+				return
+			remaining = max(self.daily_quota - used, 0)
+			self.quota_remaining = remaining if self.quota_remaining is None else min(self.quota_remaining, remaining)
+
+	def take_quota_usage(self) -> tuple[int, bool]:
+		"""(daily_quota requests made since the last call, whether today's quota is spent)."""
+		with self._lock:
+			used, self.quota_unsaved = self.quota_unsaved, 0
+			spent = bool(self.daily_quota) and self.quota_remaining is not None and self.quota_remaining < 1
+			return used, spent
+
+	# --- Acquiring ---
+
+	def acquire(self, max_wait: float = MAX_WAIT):
+		"""Blocks until a request may be made. Raises RateLimitExceeded if that's more than max_wait away."""
+		waited = 0.0
+		while (wait := self.reserve()) > 0:
+			if waited + wait > max_wait:
+				self._reject(wait)
+			self.sleep(wait)
+			waited += wait
+		self._acquired(waited)
+
+	async def acquire_async(self, max_wait: float = MAX_WAIT):
+		"""acquire() for hunt_async agents: waits on the event loop instead of blocking a thread."""
+		waited = 0.0
+		while (wait := self.reserve()) > 0:
+			if waited + wait > max_wait:
+				self._reject(wait)
+			await asyncio.sleep(wait)
+			waited += wait
+		self._acquired(waited)
+
+	def reserve(self) -> float:
+		"""Non-blocking acquire: takes a request slot and returns 0, or returns the seconds to wait."""
+		with self._lock:
+			quota_wait = self._quota_wait()
+			if quota_wait > 0:
+				return quota_wait
+			for bucket in (self.global_bucket, self.bucket):
+				if bucket is not None and (wait := bucket.reserve()) > 0:
+					if bucket is self.bucket and self.global_bucket is not None:
+						self.global_bucket.refund()  # give back the global token taken above
+					return wait
+			if self.quota_remaining is not None:
+				self.quota_remaining -= 1
+			if self.daily_quota:
+				self.quota_unsaved += 1
+			return 0.0
+
+	def _quota_wait(self) -> float:
+		now = self.wall_clock()
+		if now >= self.quota_resets_at:
+			# A new quota window (UTC day for daily_quota)
+			self.quota_remaining = self.daily_quota
+			self.quota_resets_at = (now // SECONDS_PER_DAY + 1) * SECONDS_PER_DAY if self.daily_quota else 0.0
+			self.quota_unsaved = 0  # yesterday's requests don't count against today's quota
+		if self.quota_remaining is not None and self.quota_remaining < 1:
+			return self.quota_resets_at - now
+		return 0.0
+
+	def _acquired(self, waited: float):
+		with self._lock:
+			self.stats['acquired'] += 1
+			self.stats['waited'] += waited
+
+	def _reject(self, wait: float):
+		with self._lock:
+			self.stats['rejected'] += 1
+		raise RateLimitExceeded(self.key, wait)
+
+	# --- Feedback ---
+
+	def observe(self, remaining: float, reset_in: float):
+		"""Adapts to a server's own accounting: `remaining` requests in the `reset_in` seconds left in its window."""
+		if reset_in is None or reset_in < 0 or remaining is None:
+			return
+		if reset_in > PACING_WINDOW:
+			with self._lock:
+				self.quota_remaining = remaining
+				self.quota_resets_at = self.wall_clock() + reset_in
+			return
+		if remaining < 1:
+			self.bucket.pause(reset_in)
+			with self._lock:
+				self.stats['throttled'] += 1
+			return
+		# Spread what's left over the rest of the window, never faster than configured
+		paced = remaining / max(reset_in, 1.0)
+		self.bucket.set_rate(min(paced, self.base_rate) if self.base_rate else paced, max_tokens=remaining)
+
+	def observe_headers(self, headers, status_code: Optional[int] = None):
+		"""Feeds a response's rate-limit headers (any mapping; names are matched case-insensitively)."""
+		lowered = {str(k).lower(): v for k, v in (headers or {}).items()}
+		for remaining_name, reset_name in RATE_LIMIT_HEADERS:
+			remaining = _as_float(lowered.get(remaining_name))
+			reset_in = _as_float(lowered.get(reset_name))
+			if remaining is not None and reset_in is not None:
+				self.observe(remaining, reset_in)
+				break
+		if status_code in (429, 503):
+			self.throttled(retry_after(lowered))
+
+	def throttled(self, retry_after: Optional[float] = None):
+		"""The server refused a request (429): pause the domain."""
+		retry_after = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER
+		logger.warning(f"'{self.key}' throttled by the server; pausing {retry_after:.0f}s.")
+		self.bucket.pause(retry_after)
+		with self._lock:
+			self.stats['throttled'] += 1
+
+
+def retry_after(headers) -> Optional[float]:
+	"""Seconds from a Retry-After header, if it has one in seconds form."""
+	lowered = {str(k).lower(): v for k, v in (headers or {}).items()}
+	return _as_float(lowered.get('retry-after'))
+
+
+def _as_float(value) -> Optional[float]:
+	try:
+		return float(value)
+	except (TypeError, ValueError):
+		return None
+
+
+# --- Process-Wide Registry ---
+# One limiter per domain (keyed by source_domains.id, or a name for tools),
+# shared by every agent thread and kept across hunts.
+_limiters = {}
+_registry_lock = threading.Lock()
+_global_bucket = None
+
+
+def _get_global_bucket() -> Optional[TokenBucket]:
+	"""[RateLimits] global_requests_per_second caps all agents together; unset = no global cap."""
+	global _global_bucket
+	if _global_bucket is None:
+		settings = config_manager.get_rate_limit_config()
+		if settings.get('global_requests_per_second'):
+			rate = float(settings['global_requests_per_second'])
+			_global_bucket = TokenBucket(rate, float(settings.get('global_burst', max(rate, 1))))
+	return _global_bucket
+
+
+def get_limiter(key: Hashable) -> DomainRateLimiter:
+	"""The limiter for a domain id (or tool name). Unknown keys get one bound only by the global cap."""
+	with _registry_lock:
+		if key not in _limiters:
+			_limiters[key] = DomainRateLimiter(key, global_bucket=_get_global_bucket())
+		return _limiters[key]
+
+
+def for_source(source) -> DomainRateLimiter:
+	return get_limiter(source.domain_id)
+
+
+def configure_domains(domains: dict):
+	"""Applies source_domains rate settings (and today's quota usage) from a get_domains_with_sources() result."""
+	for domain_info in domains.values():
+		if domain_info.get('domain_id') is None:
+			continue
+		limiter = get_limiter(domain_info['domain_id'])
+		limiter.configure(domain_info.get('requests_per_minute'), domain_info.get('burst'),
+		                  domain_info.get('daily_quota'))
+		limiter.seed_quota(domain_info.get('quota_used') or 0)
+
+
+def take_quota_usage() -> dict:
+	"""{key: (requests, spent)} for every limiter with daily_quota usage to persist since the last call."""
+	with _registry_lock:
+		limiters = list(_limiters.values())
+	usage = {}
+	for limiter in limiters:
+		used, spent = limiter.take_quota_usage()
+		if used or spent:
+			usage[limiter.key] = (used, spent)
+	return usage
+
+
+def get_limiter_stats() -> dict:
+	with _registry_lock:
+		return {key: dict(limiter.stats) for key, limiter in _limiters.items()}
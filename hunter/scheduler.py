@@ -0,0 +1,254 @@
+# ==========================================================
+# Hunter's Command Console - Hunt Scheduler
+# Keeps every active source in a priority queue keyed by when
+# it's next due and hunts only the due ones, on a background
+# thread, through an existing Dispatcher. Each source's next
+# interval grows from its base cadence (sources.poll_interval)
+# by its yield and its failures, plus jitter, so busy sources
+# are polled often and dead feeds rarely.
+# ==========================================================
+
+import heapq
+import logging
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+
+from hunter import db_manager
+
+logger = logging.getLogger("Scheduler")
+
+DEFAULT_INTERVAL = timedelta(hours=1)  # base cadence for sources without a poll_interval
+MIN_INTERVAL = timedelta(minutes=10)
+MAX_INTERVAL = timedelta(days=7)
+TARGET_YIELD = 5.0  # new leads per hunt at which a source keeps its base cadence
+MAX_YIELD_SPEEDUP = 4.0  # a high-yield source is polled at most this much more often...
+MAX_YIELD_SLOWDOWN = 8.0  # ...and a dry one at most this much less often
+HIT_RATE_ALPHA = 0.3  # weight of the latest hunt in the hit-rate moving average
+MAX_FAILURE_DOUBLINGS = 6  # consecutive failures double the interval up to 64x
+JITTER = 0.1  # +/- fraction, so sources added together drift apart
+RESYNC_SECONDS = 300  # longest the scheduler sleeps before re-reading sources
+
+
+def next_interval(base: timedelta, hit_rate: float, consecutive_failures: int) -> timedelta:
+	"""Base cadence scaled by yield (busier = sooner) and failure backoff, clamped, with jitter."""
+	yield_factor = TARGET_YIELD / max(hit_rate, TARGET_YIELD / MAX_YIELD_SLOWDOWN)
+	yield_factor = max(yield_factor, 1 / MAX_YIELD_SPEEDUP)
+	backoff = 2 ** min(consecutive_failures or 0, MAX_FAILURE_DOUBLINGS)
+	interval = min(max(base * yield_factor * backoff, MIN_INTERVAL), MAX_INTERVAL)
+	return interval * random.uniform(1 - JITTER, 1 + JITTER)
+
+
+def update_hit_rate(hit_rate: float, new_leads: int) -> float:
+	return (1 - HIT_RATE_ALPHA) * (hit_rate or 0.0) + HIT_RATE_ALPHA * new_leads
+
+
+def next_due(source, now: datetime, default_interval: timedelta = DEFAULT_INTERVAL) -> datetime:
+	"""
+	When to hunt a source again. A known upcoming release (podcasts and other
+	scheduled feeds) wins over the adaptive interval, unless the source is failing.
+	"""
+	if source.next_release_date and source.next_release_date > now and not source.consecutive_failures:
+		return source.next_release_date
+	return now + next_interval(source.poll_interval or default_interval, source.hit_rate,
+	                           source.consecutive_failures)
+
+
+class HuntScheduler:
+	"""
+	Runs forever (until stop()) on its own thread:
+	  1. re-reads active sources, adding new ones (due at their stored
+	     next_due_at, or now) and dropping deactivated ones;
+	  2. pops every source that is due and dispatches just those, grouped
+	     back into their domains, and waits for the hunt to finish;
+	  3. folds each source's new-lead count into its hit rate, picks its
+	     next due time and writes both back to `sources`;
+	  4. sleeps until the next source is due (at most RESYNC_SECONDS).
+
+	Works headless (tools/run_scheduler.py) or inside the app; hunt_now()
+	makes every source due at once, for the app's manual hunt button, and
+	run_due() does a single pass on the calling thread (cron).
+	"""
+
+	def __init__(self, dispatcher, purpose: str = 'lead_generation',
+	             default_interval: timedelta = DEFAULT_INTERVAL):
+		self.dispatcher = dispatcher
+		self.purpose = purpose
+		self.default_interval = default_interval
+		self._queue = []  # heap of (due_at, source_id); stale entries are skipped
+		self._due_at = {}  # source_id -> the due_at its live heap entry carries
+		self._lock = threading.Lock()
+		self._wake = threading.Event()
+		self._stop = threading.Event()
+		self._hunt_done = None  # set when a hunt_now() cycle finishes
+		self._thread = None
+
+	# --- Lifecycle ---
+
+	def start(self):
+		if self._thread and self._thread.is_alive():
+			return
+		self._stop.clear()
+		self._thread = threading.Thread(target=self._run, name="hunt-scheduler", daemon=True)
+		self._thread.start()
+		logger.info("Hunt scheduler started.")
+
+	def stop(self, timeout: float = None):
+		"""Stops after the current hunt (if any) finishes."""
+		self._stop.set()
+		self._wake.set()
+		if self._thread:
+			self._thread.join(timeout)
+		logger.info("Hunt scheduler stopped.")
+
+	def is_running(self) -> bool:
+		return bool(self._thread and self._thread.is_alive())
+
+	def hunt_now(self) -> threading.Event:
+		"""Makes every source due on the next cycle; the returned Event is set once that hunt has finished."""
+		with self._lock:
+			if self._hunt_done is None:
+				self._hunt_done = threading.Event()
+			done = self._hunt_done
+		self._wake.set()
+		return done
+
+	def cancel(self):
+		"""Drops a hunt_now() request that hasn't started yet and cancels the hunt in progress, if any."""
+		with self._lock:
+			requested, self._hunt_done = self._hunt_done, None
+		if requested:
+			self._wake.clear()
+			requested.set()
+		self.dispatcher.cancel()
+
+	def pending(self) -> list:
+		"""[(due_at, source_id)] soonest first, for status displays."""
+		with self._lock:
+			return sorted((due_at, source_id) for source_id, due_at in self._due_at.items())
+
+	# --- Queue ---
+
+	def _push(self, source_id: int, due_at: datetime):
+		self._due_at[source_id] = due_at
+		heapq.heappush(self._queue, (due_at, source_id))
+
+	def _pop_due(self, now: datetime) -> list:
+		due = []
+		with self._lock:
+			while self._queue and self._queue[0][0] <= now:
+				due_at, source_id = heapq.heappop(self._queue)
+				if self._due_at.get(source_id) == due_at:
+					del self._due_at[source_id]
+					due.append(source_id)
+		return due
+
+	def _seconds_until_next(self, now: datetime) -> float:
+		with self._lock:
+			while self._queue and self._due_at.get(self._queue[0][1]) != self._queue[0][0]:
+				heapq.heappop(self._queue)
+			if not self._queue:
+				return RESYNC_SECONDS
+			return min(max((self._queue[0][0] - now).total_seconds(), 1.0), RESYNC_SECONDS)
+
+	def _sync(self, domains: dict, now: datetime, in_flight=()):
+		"""Queues newly seen sources and forgets ones that are no longer active."""
+		active = {source.id: source for info in domains.values() for source in info['sources']}
+		with self._lock:
+			for source_id in set(self._due_at) - set(active):
+				del self._due_at[source_id]
+			for source_id, source in active.items():
+				if source_id not in self._due_at and source_id not in in_flight:
+					self._push(source_id, source.next_due_at or now)
+		return active
+
+	# --- Loop ---
+
+	def _run(self):
+		while not self._stop.is_set():
+			try:
+				hunted = self.run_due()
+			except Exception as e:
+				logger.error(f"Scheduler cycle failed: {e}", exc_info=True)
+				self._stop.wait(RESYNC_SECONDS)
+				continue
+			if self.dispatcher.hunt_token.cancelled:
+				# Skipped sources are due again right away; don't restart a hunt that was just stopped
+				self._wake.wait(RESYNC_SECONDS)
+				self._wake.clear()
+			elif not hunted:
+				self._wake.wait(self._seconds_until_next(datetime.now(timezone.utc)))
+				self._wake.clear()
+
+	def run_due(self) -> int:
+		"""One synchronous pass: hunts whatever is due now. Returns how many sources that was."""
+		# Made first, so a Cancel that arrives while sources are still being read already stops this hunt
+		hunt_token = self.dispatcher.new_hunt_token()
+		with self._lock:
+			requested, self._hunt_done = self._hunt_done, None
+		try:
+			now = datetime.now(timezone.utc)
+			domains = db_manager.get_domains_with_sources(self.purpose)
+			self._sync(domains, now)
+			if requested:
+				with self._lock:
+					for source_id in list(self._due_at):
+						self._push(source_id, now)
+
+			due_ids = self._pop_due(now)
+			if due_ids:
+				self._hunt(domains, due_ids, hunt_token)
+			return len(due_ids)
+		finally:
+			# Even if the cycle failed: whoever asked (the app's hunt button) must not wait forever
+			if requested:
+				requested.set()
+
+	def _hunt(self, domains: dict, due_ids: list, hunt_token=None):
+		"""Dispatches only the due sources (with their fresh bookmarks) and reschedules them."""
+		wanted = set(due_ids)
+		due_domains = {}
+		for domain_name, info in domains.items():
+			sources = [source for source in info['sources'] if source.id in wanted]
+			if sources:
+				due_domains[domain_name] = {**info, 'sources': sources}
+
+		started = datetime.now(timezone.utc)
+		logger.info(f"Hunting {len(due_ids)} due sources across {len(due_domains)} domains.")
+		self.dispatcher.dispatch(due_domains, hunt_token).wait()
+		self._reschedule(due_ids, started)
+
+	def _reschedule(self, source_ids: list, started: datetime):
+		# Re-read for the failure counts the hunt just wrote
+		fresh = self._sync(db_manager.get_domains_with_sources(self.purpose), started, in_flight=source_ids)
+		yields = db_manager.get_source_yields(started, source_ids)
+		skipped = self.dispatcher.skipped_sources  # cancelled before they ran
+		deferred = self.dispatcher.deferred_sources  # turned away by their domain's rate limit
+		now = datetime.now(timezone.utc)
+
+		schedules = {}
+		for source_id in source_ids:
+			source = fresh.get(source_id)
+			if source is None:
+				continue  # deactivated mid-hunt
+			if source_id in skipped:
+				# Never hunted, so still due; rate and interval are left as they were
+				schedules[source_id] = (now, source.hit_rate)
+				continue
+			if source_id in deferred:
+				# Not a failure and no yield to learn from; due again once the limit resets
+				schedules[source_id] = (now + timedelta(seconds=deferred[source_id]), source.hit_rate)
+				continue
+			failed = bool(source.last_failure_date and source.last_failure_date >= started)
+			# A failed hunt says nothing about yield; keep the old rate
+			source.hit_rate = source.hit_rate if failed else update_hit_rate(source.hit_rate,
+			                                                                 yields.get(source_id, 0))
+			due_at = next_due(source, now, self.default_interval)
+			schedules[source_id] = (due_at, source.hit_rate)
+			logger.debug(f"'{source.source_name}': {yields.get(source_id, 0)} new, hit rate {source.hit_rate:.2f}, "
+			             f"failures {source.consecutive_failures or 0}, next due {due_at:%Y-%m-%d %H:%M}")
+
+		with self._lock:
+			for source_id, (due_at, _) in schedules.items():
+				self._push(source_id, due_at)
+		db_manager.update_source_schedules_bulk(schedules)
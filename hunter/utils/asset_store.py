@@ -0,0 +1,95 @@
+# ==========================================================
+# Hunter's Command Console - Content-Addressed Asset Store
+# Files are stored under their SHA-256, sharded two levels deep:
+#
+#   assets/3f/a2/3fa2...e1.png
+#
+# so the same image or frame saved twice lands on the same path
+# and is only written once. assets.file_path holds the path
+# relative to the store root, and assets.content_hash the raw
+# 32-byte digest (migration 007).
+# ==========================================================
+
+import hashlib
+import os
+import tempfile
+from typing import NamedTuple, Optional
+
+from hunter.utils import path_utils
+
+ASSETS_DIR = os.path.join(path_utils.get_project_root(), "assets")
+
+_CHUNK = 1 << 20
+
+
+class StoredAsset(NamedTuple):
+	content_hash: bytes
+	file_path: str  # relative to the store root
+	file_size: int
+	created: bool  # False if identical content was already stored
+
+
+class AssetStore:
+	def __init__(self, root: str = ASSETS_DIR):
+		self.root = root
+
+	@staticmethod
+	def relative_path(content_hash: bytes, ext: str = "") -> str:
+		digest = content_hash.hex()
+		ext = ext if not ext or ext.startswith(".") else f".{ext}"
+		return "/".join((digest[:2], digest[2:4], digest + ext.lower()))
+
+	def absolute_path(self, file_path: str) -> str:
+		return os.path.join(self.root, *file_path.split("/"))
+
+	def exists(self, content_hash: bytes, ext: str = "") -> bool:
+		return os.path.exists(self.absolute_path(self.relative_path(content_hash, ext)))
+
+	def put_bytes(self, data: bytes, ext: str = "") -> StoredAsset:
+		"""Stores data under its hash; a no-op (created=False) when the content is already there."""
+		content_hash = hashlib.sha256(data).digest()
+		file_path = self.relative_path(content_hash, ext)
+		target = self.absolute_path(file_path)
+		if os.path.exists(target):
+			return StoredAsset(content_hash, file_path, len(data), False)
+		return StoredAsset(content_hash, file_path, len(data), self._write_atomic(target, data))
+
+	def put_file(self, source_path: str, ext: Optional[str] = None) -> StoredAsset:
+		"""Hashes a file in chunks, then copies it in unless the content is already stored."""
+		if ext is None:
+			ext = os.path.splitext(source_path)[1]
+		digest = hashlib.sha256()
+		with open(source_path, "rb") as f:
+			for chunk in iter(lambda: f.read(_CHUNK), b""):
+				digest.update(chunk)
+		content_hash = digest.digest()
+		file_path = self.relative_path(content_hash, ext)
+		target = self.absolute_path(file_path)
+		size = os.path.getsize(source_path)
+		if os.path.exists(target):
+			return StoredAsset(content_hash, file_path, size, False)
+		with open(source_path, "rb") as f:
+			data = f.read()
+		return StoredAsset(content_hash, file_path, size, self._write_atomic(target, data))
+
+	@staticmethod
+	def _write_atomic(target: str, data: bytes) -> bool:
+		"""Temp file + rename, so a crash never leaves a truncated file under a valid hash."""
+		directory = os.path.dirname(target)
+		os.makedirs(directory, exist_ok=True)
+		fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+		try:
+			with os.fdopen(fd, "wb") as f:
+				f.write(data)
+				f.flush()
+				os.fsync(f.fileno())
+			if os.path.exists(target):
+				# Another writer stored the same content meanwhile
+				os.remove(tmp_path)
+				return False
+			os.replace(tmp_path, target)
+			return True
+		except BaseException:
+			if os.path.exists(tmp_path):
+				os.remove(tmp_path)
+			raise
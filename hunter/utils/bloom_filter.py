@@ -0,0 +1,114 @@
+# ==========================================================
+# Hunter's Command Console - Bloom Filter
+# A small, thread-safe, disk-persistable Bloom filter. Answers
+# "definitely not seen" with no false negatives and a tunable
+# false-positive rate; "maybe seen" still needs a real lookup.
+# ==========================================================
+
+import hashlib
+import math
+import os
+import struct
+import threading
+
+_MAGIC = b"HBBF"
+_VERSION = 2
+# magic, version, num_bits, num_hashes, count, capacity, error_rate, watermark, key_format
+_HEADER = struct.Struct("<4sHQIQQddH")
+
+
+class BloomFilter:
+	"""
+	Classic Bloom filter over a bytearray, using Kirsch-Mitzenmacher double
+	hashing on a single blake2b digest to derive the k bit positions.
+	"""
+
+	def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+		if capacity <= 0 or not 0 < error_rate < 1:
+			raise ValueError("capacity must be > 0 and error_rate in (0, 1)")
+		self.capacity = capacity
+		self.error_rate = error_rate
+		self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+		self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+		self.count = 0
+		# Opaque caller-owned marker saved with the filter (e.g. "warmed up to" epoch seconds).
+		self.watermark = 0.0
+		# Caller-owned tag for how items are spelled; bump it when the key scheme changes.
+		self.key_format = 0
+		self._bits = bytearray((self.num_bits + 7) // 8)
+		self._lock = threading.Lock()
+
+	def _positions(self, item: str):
+		digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+		h1 = int.from_bytes(digest[:8], "little")
+		h2 = int.from_bytes(digest[8:], "little") | 1
+		return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+	def add(self, item: str) -> bool:
+		"""Adds an item. Returns True if it was (probably) new."""
+		positions = self._positions(item)
+		added = False
+		with self._lock:
+			for pos in positions:
+				byte, mask = pos >> 3, 1 << (pos & 7)
+				if not self._bits[byte] & mask:
+					self._bits[byte] |= mask
+					added = True
+			if added:
+				self.count += 1
+		return added
+
+	def update(self, items):
+		for item in items:
+			self.add(item)
+
+	def __contains__(self, item: str) -> bool:
+		bits = self._bits
+		return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+	def __len__(self):
+		return self.count
+
+	@property
+	def is_saturated(self) -> bool:
+		"""True once more items went in than the filter was sized for."""
+		return self.count > self.capacity
+
+	def estimated_fp_rate(self) -> float:
+		"""Theoretical false-positive rate at the current fill: (1 - e^(-kn/m))^k."""
+		return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+	# --- Persistence ---
+
+	def save(self, path: str):
+		"""Writes the filter atomically (temp file + rename)."""
+		os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+		tmp_path = f"{path}.tmp"
+		with self._lock:
+			header = _HEADER.pack(_MAGIC, _VERSION, self.num_bits, self.num_hashes, self.count,
+			                      self.capacity, self.error_rate, self.watermark, self.key_format)
+			with open(tmp_path, "wb") as f:
+				f.write(header)
+				f.write(self._bits)
+		os.replace(tmp_path, path)
+
+	@classmethod
+	def load(cls, path: str) -> "BloomFilter":
+		"""Reads a filter written by save(). Raises ValueError on a bad or mismatched file."""
+		with open(path, "rb") as f:
+			header = f.read(_HEADER.size)
+			if len(header) != _HEADER.size:
+				raise ValueError(f"Truncated bloom filter file: {path}")
+			magic, version, num_bits, num_hashes, count, capacity, error_rate, watermark, key_format = _HEADER.unpack(header)
+			if magic != _MAGIC or version != _VERSION:
+				raise ValueError(f"Not a bloom filter file (or wrong version): {path}")
+			bits = bytearray(f.read())
+
+		bloom = cls(capacity, error_rate)
+		if (bloom.num_bits, bloom.num_hashes) != (num_bits, num_hashes) or len(bits) != len(bloom._bits):
+			raise ValueError(f"Bloom filter geometry mismatch in {path}")
+		bloom._bits = bits
+		bloom.count = count
+		bloom.watermark = watermark
+		bloom.key_format = key_format
+		return bloom
@@ -0,0 +1,183 @@
+# ==========================================================
+# Hunter's Command Console - Buffered JSONL Writer
+# Appends JSON records to a .jsonl file from a background thread,
+# so callers (e.g. the triage transaction) never wait on disk I/O.
+#
+# Durability is at-least-once, with the caller holding the
+# write-ahead copy: records are submitted once they are durable
+# elsewhere (process_triage: committed to training_export_queue),
+# and on_written(keys) is only called after they have been
+# fsynced into the output, so the caller can then drop its copy.
+# Whatever is left after a crash is resubmitted on the next start.
+# ==========================================================
+
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime
+from typing import Callable
+
+logger = logging.getLogger("JSONL Writer")
+
+
+class BufferedJSONLWriter:
+	"""
+	Background JSONL appender.
+
+	  writer.submit(records, keys)   # after the records are durable elsewhere (e.g. committed)
+	  on_written(keys)               # called on the writer thread once they're fsynced
+
+	The writer thread coalesces queued batches (up to max_batch_records or
+	linger_seconds), serializes them, writes them through a large buffer and
+	fsyncs once per coalesced write. With rotate="daily" the output is split into
+	dated shards (<name>-YYYY-MM-DD.jsonl); compress=True gzips a shard once the
+	day rolls over.
+	"""
+
+	def __init__(self, path: str, queue_size: int = 256, max_batch_records: int = 5000,
+	             linger_seconds: float = 0.5, buffer_size: int = 1 << 20,
+	             rotate: str | None = None, compress: bool = False,
+	             on_written: Callable[[list], None] | None = None):
+		if rotate not in (None, "daily"):
+			raise ValueError(f"Unsupported rotate mode: {rotate!r}")
+		self.path = path
+		self.max_batch_records = max_batch_records
+		self.linger_seconds = linger_seconds
+		self.buffer_size = buffer_size
+		self.rotate = rotate
+		self.compress = compress
+		self.on_written = on_written
+
+		self._queue = queue.Queue(maxsize=queue_size)
+		self._current_shard = None
+		self._stats_lock = threading.Lock()
+		self._stats = {'batches': 0, 'records': 0, 'fsyncs': 0, 'errors': 0}
+
+		self._thread = threading.Thread(target=self._run, name="jsonl-writer", daemon=True)
+		self._thread.start()
+
+	# --- Producer API ---
+
+	def submit(self, records: list, keys=()) -> bool:
+		"""
+		Hands records to the writer thread; `keys` are passed back to on_written
+		once they're on disk. Never blocks for long: returns False if the queue
+		is full, leaving the records with the caller for the next start.
+		"""
+		if not records:
+			return True
+		try:
+			self._queue.put((records, list(keys)), timeout=1.0)
+			return True
+		except queue.Full:
+			logger.warning(f"JSONL writer queue full; {len(records)} records left for recovery.")
+			return False
+
+	def close(self, timeout: float | None = 10.0):
+		"""Flushes everything queued and stops the writer thread."""
+		if not self._thread.is_alive():
+			return
+		self._queue.put(None)
+		self._thread.join(timeout)
+
+	def stats(self) -> dict:
+		with self._stats_lock:
+			stats = dict(self._stats)
+		stats['queued'] = self._queue.qsize()
+		return stats
+
+	# --- Writer Thread ---
+
+	def _run(self):
+		stopping = False
+		while not stopping:
+			batch = self._queue.get()
+			if batch is None:
+				break
+			batches = [batch]
+			records = len(batch[0])
+			deadline = time.monotonic() + self.linger_seconds
+
+			# Coalesce whatever else arrives shortly, up to the record cap.
+			while records < self.max_batch_records:
+				remaining = deadline - time.monotonic()
+				if remaining <= 0:
+					break
+				try:
+					batch = self._queue.get(timeout=remaining)
+				except queue.Empty:
+					break
+				if batch is None:
+					stopping = True
+					break
+				batches.append(batch)
+				records += len(batch[0])
+
+			self._write(batches, records)
+
+		# Drain anything still queued at shutdown.
+		leftovers = []
+		while True:
+			try:
+				batch = self._queue.get_nowait()
+			except queue.Empty:
+				break
+			if batch is not None:
+				leftovers.append(batch)
+		if leftovers:
+			self._write(leftovers, sum(len(b[0]) for b in leftovers))
+
+	def _write(self, batches: list, records: int):
+		try:
+			shard = self._shard_path()
+			os.makedirs(os.path.dirname(shard) or ".", exist_ok=True)
+			with open(shard, "ab", buffering=self.buffer_size) as f:
+				for batch_records, _ in batches:
+					f.write("".join(json.dumps(record) + "\n" for record in batch_records).encode("utf-8"))
+				f.flush()
+				os.fsync(f.fileno())
+		except (OSError, TypeError, ValueError) as e:
+			# The caller still holds the records; they're retried on the next start.
+			with self._stats_lock:
+				self._stats['errors'] += 1
+			logger.error(f"Failed to write {records} JSONL records to {self.path}: {e}")
+			return
+
+		if self.on_written:
+			try:
+				self.on_written([key for _, keys in batches for key in keys])
+			except Exception as e:
+				# Not fatal: the records are exported again on the next start (at-least-once)
+				logger.warning(f"JSONL on_written callback failed: {e}")
+		with self._stats_lock:
+			self._stats['batches'] += len(batches)
+			self._stats['records'] += records
+			self._stats['fsyncs'] += 1
+
+	# --- Rotation ---
+
+	def _shard_path(self) -> str:
+		if self.rotate is None:
+			return self.path
+		base, ext = os.path.splitext(self.path)
+		shard = f"{base}-{datetime.now().strftime('%Y-%m-%d')}{ext or '.jsonl'}"
+		if self._current_shard and self._current_shard != shard and self.compress:
+			self._compress_shard(self._current_shard)
+		self._current_shard = shard
+		return shard
+
+	@staticmethod
+	def _compress_shard(shard: str):
+		if not os.path.exists(shard):
+			return
+		try:
+			with open(shard, "rb") as src, gzip.open(shard + ".gz", "ab") as dst:
+				shutil.copyfileobj(src, dst)
+			os.remove(shard)
+		except OSError as e:
+			logger.warning(f"Could not compress rotated shard {shard}: {e}")
@@ -0,0 +1,78 @@
+# ==========================================================
+# Hunter's Command Console - Byte-Bounded LRU Cache
+# A thread-safe LRU keyed by anything hashable whose capacity is
+# a byte budget rather than an entry count, so a handful of huge
+# pages can't crowd out memory the way a count limit would allow.
+# ==========================================================
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable
+
+
+class ByteLRUCache:
+	"""
+	LRU cache bounded by the total `sizeof(value)` of its entries.
+
+	Values larger than the whole budget are not cached at all. Hits, misses
+	and evictions are counted for stats().
+	"""
+
+	def __init__(self, max_bytes: int, sizeof: Callable[[Any], int]):
+		self.max_bytes = max_bytes
+		self._sizeof = sizeof
+		self._entries = OrderedDict()  # key -> (value, size)
+		self._bytes = 0
+		self._lock = threading.Lock()
+		self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+	def get(self, key: Hashable, default=None):
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				self._stats['misses'] += 1
+				return default
+			self._entries.move_to_end(key)
+			self._stats['hits'] += 1
+			return entry[0]
+
+	def __contains__(self, key: Hashable) -> bool:
+		with self._lock:
+			return key in self._entries
+
+	def put(self, key: Hashable, value) -> bool:
+		"""Stores value, evicting least-recently-used entries to fit. False if it is too big to cache."""
+		size = self._sizeof(value)
+		with self._lock:
+			old = self._entries.pop(key, None)
+			if old is not None:
+				self._bytes -= old[1]
+			if size > self.max_bytes:
+				return False
+			while self._entries and self._bytes + size > self.max_bytes:
+				_, (_, evicted_size) = self._entries.popitem(last=False)
+				self._bytes -= evicted_size
+				self._stats['evictions'] += 1
+			self._entries[key] = (value, size)
+			self._bytes += size
+			return True
+
+	def invalidate(self, keys: Iterable[Hashable]) -> int:
+		"""Drops the given keys; returns how many were cached."""
+		dropped = 0
+		with self._lock:
+			for key in keys:
+				entry = self._entries.pop(key, None)
+				if entry is not None:
+					self._bytes -= entry[1]
+					dropped += 1
+		return dropped
+
+	def clear(self):
+		with self._lock:
+			self._entries.clear()
+			self._bytes = 0
+
+	def stats(self) -> dict:
+		with self._lock:
+			return dict(self._stats, entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
@@ -0,0 +1,101 @@
+# ==========================================================
+# Hunter's Command Console - Streaming Pipeline
+# Two-stage producer/consumer for one source's hunt: a producer
+# thread pulls micro-batches from a (lazy) iterator and hands
+# them over a bounded queue to the calling thread, which files
+# them. When filing lags the queue fills and the producer - and
+# with it the agent's generator - simply waits (backpressure),
+# so only a few batches are ever in memory at once.
+# ==========================================================
+
+import itertools
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Optional
+
+_DONE = object()
+POLL_SECONDS = 0.5  # how often a waiting stage re-checks for cancellation
+
+
+class PipelineStopped(Exception):
+	"""run_pipeline's `stop` check fired before the producer was finished."""
+
+
+class ReturnValue:
+	"""Iterates a generator and keeps its `return` value (a streaming agent's bookmark)."""
+
+	def __init__(self, generator):
+		self.generator = generator
+		self.value = None
+
+	def __iter__(self):
+		self.value = yield from self.generator
+
+
+def iter_batches(items: Iterable, batch_size: int) -> Iterator[list]:
+	"""Lists of up to batch_size items, pulled from `items` only as each batch is needed."""
+	iterator = iter(items)
+	while batch := list(itertools.islice(iterator, batch_size)):
+		yield batch
+
+
+def run_pipeline(batches: Iterable[list], consume: Callable[[list], None], max_pending: int,
+                 stop: Optional[Callable[[], bool]] = None) -> int:
+	"""
+	Runs `batches` on a producer thread and `consume` on this one, with at most
+	max_pending batches queued in between. Returns the number of items consumed.
+	An exception on either side stops both and is re-raised here, after the
+	batches already handed over have been consumed (or abandoned, if `consume`
+	itself failed).
+
+	If `stop()` turns true, PipelineStopped is raised between batches: what was
+	consumed stays consumed, and a producer stuck inside `batches` is left behind
+	(it's a daemon thread) rather than waited for.
+	"""
+	handoff = queue.Queue(maxsize=max(max_pending, 1))
+	cancelled = threading.Event()
+	failure = []
+
+	def put(item) -> bool:
+		while not cancelled.is_set():
+			try:
+				handoff.put(item, timeout=POLL_SECONDS)
+				return True
+			except queue.Full:
+				continue
+		return False
+
+	def produce():
+		try:
+			for batch in batches:
+				if batch and not put(batch):
+					return
+		except BaseException as e:
+			failure.append(e)
+		finally:
+			put(_DONE)
+
+	producer = threading.Thread(target=produce, name=f"{threading.current_thread().name}-producer", daemon=True)
+	producer.start()
+	consumed = 0
+	stopped = False
+	try:
+		while True:
+			if stop is not None and stop():
+				stopped = True
+				raise PipelineStopped(f"Stopped after {consumed} items.")
+			try:
+				batch = handoff.get(timeout=POLL_SECONDS)
+			except queue.Empty:
+				continue
+			if batch is _DONE:
+				break
+			consume(batch)
+			consumed += len(batch)
+	finally:
+		cancelled.set()
+		if not stopped:
+			producer.join()
+	if failure:
+		raise failure[0]
+	return consumed
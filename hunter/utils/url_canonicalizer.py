@@ -0,0 +1,84 @@
+# ==========================================================
+# Hunter's Command Console - URL Canonicalizer
+# One spelling per lead URL, so dedup isn't fooled by tracking
+# params, http vs https, trailing slashes or #fragments.
+# Foremen store URLs as fetched (minus tracking params, via
+# strip_tracking_params()) so links keep working; the canonical
+# form is only ever a dedup key: url_hash() for the router and
+# the filing clerk's Bloom filter.
+# ==========================================================
+
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only identify a click, never the content.
+TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'mc_cid', 'mc_eid'}
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def _is_tracking_param(name: str) -> bool:
+	name = name.lower()
+	return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def strip_tracking_params(url: str) -> str:
+	"""The URL as fetched, minus utm_* / fbclid (and friends); everything else is kept byte for byte."""
+	if not url:
+		return url
+	url = url.strip()
+	try:
+		parts = urlsplit(url)
+	except ValueError:
+		return url
+	if not parts.query:
+		return url
+	kept = [param for param in parts.query.split('&') if param and not _is_tracking_param(param.split('=', 1)[0])]
+	return urlunsplit(parts._replace(query='&'.join(kept)))
+
+
+def canonicalize_url(url: str) -> str:
+	"""
+	Normalizes a URL for deduplication:
+	  - scheme and host lowercased, http upgraded to https, default ports dropped
+	  - utm_* / fbclid (and friends) removed, remaining params sorted
+	  - trailing slash stripped from the path, fragment dropped
+	Anything that doesn't parse as an http(s) URL is returned stripped but otherwise untouched.
+	"""
+	if not url:
+		return url
+	url = url.strip()
+	try:
+		parts = urlsplit(url)
+		port = parts.port
+	except ValueError:
+		return url
+
+	scheme = parts.scheme.lower()
+	if scheme not in DEFAULT_PORTS or not parts.hostname:
+		return url
+
+	host = parts.hostname.lower()
+	if port and port != DEFAULT_PORTS[scheme]:
+		host = f"{host}:{port}"
+	if parts.username:
+		userinfo = parts.username + (f":{parts.password}" if parts.password else "")
+		host = f"{userinfo}@{host}"
+
+	path = parts.path.rstrip('/')
+	query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+	                         if not _is_tracking_param(k)))
+
+	return urlunsplit(('https', host, path, query, ''))
+
+
+def url_hash(url: str) -> bytes:
+	"""Fixed-width (32-byte SHA-256) dedup key of the canonical URL, stored in acquisition_router.url_hash."""
+	return hashlib.sha256(canonicalize_url(url).encode('utf-8')).digest()
+
+
+def raw_url_hash(url: str) -> bytes:
+	"""SHA-256 of the URL exactly as given: what migration 004 seeded (and its trigger writes) for rows
+	tools/backfill_url_hash.py hasn't re-hashed yet."""
+	return hashlib.sha256(url.encode('utf-8')).digest()
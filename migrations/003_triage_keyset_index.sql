@@ -0,0 +1,26 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 003
+ * # Triage keyset pagination indexes.
+ * #
+ * # db_manager.get_triage_page() walks NEW leads newest-first by
+ * # (publication_date, lead_uuid). These partial indexes only cover
+ * # status = 'NEW', so they stay small no matter how many leads have
+ * # already been triaged. NULL publication dates sort last via
+ * # COALESCE(..., '-infinity') so the keyset never loses a row.
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+-- Whole-desk view: first screen is an index range scan + LIMIT.
+CREATE INDEX IF NOT EXISTS idx_router_triage_keyset
+    ON almanac.acquisition_router ((COALESCE(publication_date, '-infinity'::timestamptz)) DESC, lead_uuid DESC)
+    WHERE status = 'NEW';
+
+-- Per-source view (source_filter): same ordering, leading source_id.
+CREATE INDEX IF NOT EXISTS idx_router_triage_keyset_source
+    ON almanac.acquisition_router (source_id, (COALESCE(publication_date, '-infinity'::timestamptz)) DESC, lead_uuid DESC)
+    WHERE status = 'NEW';
+
+ANALYZE almanac.acquisition_router;
@@ -0,0 +1,66 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 004
+ * # Fixed-width URL dedup key for acquisition_router.
+ * #
+ * # url_hash is the 32-byte SHA-256 of the canonical URL
+ * # (hunter/utils/url_canonicalizer.py). The app always supplies it;
+ * # the trigger below is a safety net for other writers and hashes
+ * # item_url as-is. Existing rows are seeded the same way here, which
+ * # keeps the new unique index valid. tools/backfill_url_hash.py then
+ * # re-hashes them in batches using the canonical form.
+ * #
+ * # The wide text UNIQUE (item_url) constraint is dropped: dedup and
+ * # ON CONFLICT now go through ux_router_url_hash. Until the backfill
+ * # has reached a row it only carries its raw hash, so the app's
+ * # duplicate check (check_for_existing_leads_by_url) looks up the
+ * # raw-URL hash as well as the canonical one.
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+ALTER TABLE almanac.acquisition_router
+    ADD COLUMN IF NOT EXISTS url_hash bytea;
+
+UPDATE almanac.acquisition_router
+SET url_hash = sha256(convert_to(item_url, 'UTF8'))
+WHERE url_hash IS NULL
+  AND item_url IS NOT NULL;
+
+DO
+$$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'acquisition_router_url_hash_len') THEN
+            ALTER TABLE almanac.acquisition_router
+                ADD CONSTRAINT acquisition_router_url_hash_len CHECK (url_hash IS NULL OR octet_length(url_hash) = 32);
+        END IF;
+    END
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_router_url_hash ON almanac.acquisition_router (url_hash);
+
+CREATE OR REPLACE FUNCTION almanac.router_default_url_hash() RETURNS trigger
+    LANGUAGE plpgsql
+AS
+$$
+BEGIN
+    IF NEW.url_hash IS NULL AND NEW.item_url IS NOT NULL THEN
+        NEW.url_hash := sha256(convert_to(NEW.item_url, 'UTF8'));
+    END IF;
+    RETURN NEW;
+END
+$$;
+
+ALTER FUNCTION almanac.router_default_url_hash() OWNER TO hunter_admin;
+
+DROP TRIGGER IF EXISTS trg_router_default_url_hash ON almanac.acquisition_router;
+CREATE TRIGGER trg_router_default_url_hash
+    BEFORE INSERT ON almanac.acquisition_router
+    FOR EACH ROW
+EXECUTE FUNCTION almanac.router_default_url_hash();
+
+ALTER TABLE almanac.acquisition_router
+    DROP CONSTRAINT IF EXISTS acquisition_router_item_url_key;
+
+COMMENT ON COLUMN almanac.acquisition_router.url_hash IS 'Dedup key: SHA-256 of the canonical item_url, or of item_url as-is for rows tools/backfill_url_hash.py has not re-hashed.';
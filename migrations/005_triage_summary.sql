@@ -0,0 +1,132 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 005
+ * # Trigger-maintained lead counts per (source, status).
+ * #
+ * # The triage desk draws its source groups and "(N new leads)"
+ * # headers from triage_summary instead of scanning every staged
+ * # lead. Counters are kept by statement-level triggers on
+ * # acquisition_router using transition tables, so a bulk filing
+ * # statement touches each (source, status) counter once, not once
+ * # per row. Counter rows are upserted in key order so concurrent
+ * # filers and triage commits can't deadlock on them.
+ * #
+ * # refresh_triage_summary() rebuilds the table from scratch; it
+ * # takes a SHARE lock on the router so no filing commit can slip
+ * # between the recount and the swap.
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+CREATE TABLE IF NOT EXISTS almanac.triage_summary
+(
+    source_id  integer            NOT NULL,
+    status     almanac.lead_status NOT NULL,
+    lead_count bigint             NOT NULL DEFAULT 0,
+    updated_at timestamptz        NOT NULL DEFAULT NOW(),
+    CONSTRAINT triage_summary_pkey PRIMARY KEY (source_id, status)
+);
+
+ALTER TABLE almanac.triage_summary OWNER TO hunter_admin;
+-- The triggers run as whoever writes the router, i.e. the app user.
+GRANT SELECT, INSERT, UPDATE ON TABLE almanac.triage_summary TO hunter_app_user;
+
+CREATE OR REPLACE FUNCTION almanac.triage_summary_apply() RETURNS trigger
+    LANGUAGE plpgsql
+AS
+$$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO almanac.triage_summary AS ts (source_id, status, lead_count)
+        SELECT source_id, status, COUNT(*)
+        FROM new_rows
+        WHERE source_id IS NOT NULL
+        GROUP BY source_id, status
+        ORDER BY source_id, status
+        ON CONFLICT (source_id, status) DO UPDATE
+            SET lead_count = ts.lead_count + EXCLUDED.lead_count,
+                updated_at = NOW();
+
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- Most router updates are last_seen_at bumps; those net out to zero and write nothing.
+        INSERT INTO almanac.triage_summary AS ts (source_id, status, lead_count)
+        SELECT source_id, status, SUM(delta)
+        FROM (SELECT source_id, status, 1 AS delta FROM new_rows
+              UNION ALL
+              SELECT source_id, status, -1 FROM old_rows) AS d
+        WHERE source_id IS NOT NULL
+        GROUP BY source_id, status
+        HAVING SUM(delta) <> 0
+        ORDER BY source_id, status
+        ON CONFLICT (source_id, status) DO UPDATE
+            SET lead_count = ts.lead_count + EXCLUDED.lead_count,
+                updated_at = NOW();
+
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO almanac.triage_summary AS ts (source_id, status, lead_count)
+        SELECT source_id, status, -COUNT(*)
+        FROM old_rows
+        WHERE source_id IS NOT NULL
+        GROUP BY source_id, status
+        ORDER BY source_id, status
+        ON CONFLICT (source_id, status) DO UPDATE
+            SET lead_count = ts.lead_count + EXCLUDED.lead_count,
+                updated_at = NOW();
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+ALTER FUNCTION almanac.triage_summary_apply() OWNER TO hunter_admin;
+
+DROP TRIGGER IF EXISTS trg_triage_summary_insert ON almanac.acquisition_router;
+CREATE TRIGGER trg_triage_summary_insert
+    AFTER INSERT ON almanac.acquisition_router
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+EXECUTE FUNCTION almanac.triage_summary_apply();
+
+DROP TRIGGER IF EXISTS trg_triage_summary_update ON almanac.acquisition_router;
+CREATE TRIGGER trg_triage_summary_update
+    AFTER UPDATE ON almanac.acquisition_router
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+EXECUTE FUNCTION almanac.triage_summary_apply();
+
+DROP TRIGGER IF EXISTS trg_triage_summary_delete ON almanac.acquisition_router;
+CREATE TRIGGER trg_triage_summary_delete
+    AFTER DELETE ON almanac.acquisition_router
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+EXECUTE FUNCTION almanac.triage_summary_apply();
+
+CREATE OR REPLACE FUNCTION almanac.refresh_triage_summary() RETURNS bigint
+    LANGUAGE plpgsql
+    SECURITY DEFINER
+    SET search_path = almanac, public
+AS
+$$
+DECLARE
+    v_rows bigint;
+BEGIN
+    -- Blocks router writers (and waits for in-flight ones) until this transaction ends.
+    LOCK TABLE almanac.acquisition_router IN SHARE MODE;
+
+    DELETE FROM almanac.triage_summary;
+    INSERT INTO almanac.triage_summary (source_id, status, lead_count)
+    SELECT source_id, status, COUNT(*)
+    FROM almanac.acquisition_router
+    WHERE source_id IS NOT NULL
+    GROUP BY source_id, status;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END
+$$;
+
+ALTER FUNCTION almanac.refresh_triage_summary() OWNER TO hunter_admin;
+
+SELECT almanac.refresh_triage_summary();
+
+COMMENT ON TABLE almanac.triage_summary IS 'Lead counts per (source, status); maintained by triggers on acquisition_router.';
@@ -0,0 +1,35 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 006
+ * # Daily per-source rollup of acquisition_log.
+ * #
+ * # Raw acquisition_log rows are only kept for a retention window
+ * # (hunter/admin/partition_manager.apply_retention). Before an old
+ * # monthly partition is detached it is folded into
+ * # acquisition_log_daily: one row per (UTC day, source) with the
+ * # number of sightings and the first/last time one was seen.
+ * # Counts and min/max are additive, so a day that straddles two
+ * # partitions (bounds sit at 04:00 UTC) merges correctly.
+ * #
+ * # db_manager.get_source_activity() reads the rollup for retired
+ * # days and the (partition-pruned) raw log for the rest.
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+CREATE TABLE IF NOT EXISTS almanac.acquisition_log_daily
+(
+    day           date        NOT NULL,
+    source_id     bigint      NOT NULL DEFAULT 0,
+    lead_count    bigint      NOT NULL,
+    first_seen_at timestamptz NOT NULL,
+    last_seen_at  timestamptz NOT NULL,
+    CONSTRAINT acquisition_log_daily_pkey PRIMARY KEY (day, source_id)
+);
+
+ALTER TABLE almanac.acquisition_log_daily OWNER TO hunter_admin;
+GRANT SELECT ON TABLE almanac.acquisition_log_daily TO hunter_app_user;
+
+COMMENT ON TABLE almanac.acquisition_log_daily IS 'Rolled-up acquisition_log sightings per UTC day and source; filled when raw partitions are retired.';
+COMMENT ON COLUMN almanac.acquisition_log_daily.source_id IS '0 = log rows with no source_id.';
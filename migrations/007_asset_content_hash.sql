@@ -0,0 +1,34 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 007
+ * # Content-addressed assets.
+ * #
+ * # content_hash is the 32-byte SHA-256 of the stored file
+ * # (hunter/utils/asset_store.py). New assets are written to
+ * # assets/<aa>/<bb>/<sha256>.<ext> and deduplicated on this key:
+ * # saving the same image twice returns the existing row and just
+ * # merges related_cases. Rows from before this migration keep a
+ * # NULL hash until tools/backfill_asset_hash.py hashes their files.
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+ALTER TABLE almanac.assets
+    ADD COLUMN IF NOT EXISTS content_hash bytea;
+
+DO
+$$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'assets_content_hash_key') THEN
+            ALTER TABLE almanac.assets
+                ADD CONSTRAINT assets_content_hash_key UNIQUE (content_hash);
+        END IF;
+        IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'assets_content_hash_len') THEN
+            ALTER TABLE almanac.assets
+                ADD CONSTRAINT assets_content_hash_len CHECK (content_hash IS NULL OR octet_length(content_hash) = 32);
+        END IF;
+    END
+$$;
+
+COMMENT ON COLUMN almanac.assets.content_hash IS 'SHA-256 of the file contents; the dedup key for the content-addressed asset store.';
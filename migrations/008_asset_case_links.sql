@@ -0,0 +1,71 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 008
+ * # asset_case_links: one row per (case, asset).
+ * #
+ * # "Assets for this case" used to be `%s = ANY(related_cases)`,
+ * # which can't use the GIN index and so scanned every asset.
+ * # The join table gives btree lookups in both directions:
+ * # (case_uuid, asset_id) by case, asset_id for the reverse.
+ * #
+ * # assets.related_cases stays as the write-side field; the
+ * # trigger below mirrors it into the links table for every
+ * # writer, and the existing arrays are backfilled here.
+ * # case_uuid is a loose reference, like source_uuid (no FK).
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+CREATE TABLE IF NOT EXISTS almanac.asset_case_links
+(
+    case_uuid uuid        NOT NULL,
+    asset_id  uuid        NOT NULL REFERENCES almanac.assets (asset_id) ON DELETE CASCADE,
+    linked_at timestamptz NOT NULL DEFAULT NOW(),
+    CONSTRAINT asset_case_links_pkey PRIMARY KEY (case_uuid, asset_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_asset_case_links_asset ON almanac.asset_case_links (asset_id);
+
+ALTER TABLE almanac.asset_case_links OWNER TO hunter_admin;
+GRANT SELECT, INSERT, DELETE ON TABLE almanac.asset_case_links TO hunter_app_user;
+
+COMMENT ON TABLE almanac.asset_case_links IS 'Asset <-> case links, mirrored from assets.related_cases by trg_assets_sync_case_links.';
+
+CREATE OR REPLACE FUNCTION almanac.assets_sync_case_links() RETURNS trigger
+    LANGUAGE plpgsql
+AS
+$$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM almanac.asset_case_links l
+        WHERE l.asset_id = NEW.asset_id
+          AND l.case_uuid <> ALL (COALESCE(NEW.related_cases, '{}'));
+    END IF;
+
+    INSERT INTO almanac.asset_case_links (case_uuid, asset_id)
+    SELECT DISTINCT c, NEW.asset_id
+    FROM unnest(COALESCE(NEW.related_cases, '{}')) AS c
+    WHERE c IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    RETURN NULL;
+END
+$$;
+
+ALTER FUNCTION almanac.assets_sync_case_links() OWNER TO hunter_admin;
+
+DROP TRIGGER IF EXISTS trg_assets_sync_case_links ON almanac.assets;
+CREATE TRIGGER trg_assets_sync_case_links
+    AFTER INSERT OR UPDATE OF related_cases ON almanac.assets
+    FOR EACH ROW
+EXECUTE FUNCTION almanac.assets_sync_case_links();
+
+INSERT INTO almanac.asset_case_links (case_uuid, asset_id, linked_at)
+SELECT DISTINCT c, a.asset_id, COALESCE(a.created_at, NOW())
+FROM almanac.assets a
+         CROSS JOIN LATERAL unnest(a.related_cases) AS c
+WHERE c IS NOT NULL
+ON CONFLICT DO NOTHING;
+
+ANALYZE almanac.asset_case_links;
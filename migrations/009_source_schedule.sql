@@ -0,0 +1,34 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 009
+ * # Per-source hunt cadence (hunter/scheduler.py).
+ * #
+ * # poll_interval is a source's base cadence; NULL means the
+ * # scheduler default ([Scheduler] default_interval_minutes).
+ * # hit_rate is a moving average of new leads filed per hunt,
+ * # and next_due_at is when the scheduler will hunt the source
+ * # again. Both are written only by the scheduler; NULL
+ * # next_due_at means "due now".
+ * #
+ * # consecutive_failures is now counted up by failed hunts
+ * # (it was only ever reset), so it backs a source off too.
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+ALTER TABLE almanac.sources
+    ADD COLUMN IF NOT EXISTS poll_interval interval,
+    ADD COLUMN IF NOT EXISTS next_due_at   timestamptz,
+    ADD COLUMN IF NOT EXISTS hit_rate      real NOT NULL DEFAULT 0;
+
+UPDATE almanac.sources
+SET consecutive_failures = 0
+WHERE consecutive_failures IS NULL;
+
+ALTER TABLE almanac.sources
+    ALTER COLUMN consecutive_failures SET DEFAULT 0;
+
+COMMENT ON COLUMN almanac.sources.poll_interval IS 'Base hunt cadence before yield/failure backoff; NULL uses the scheduler default.';
+COMMENT ON COLUMN almanac.sources.next_due_at IS 'When the scheduler next hunts this source; NULL means due now.';
+COMMENT ON COLUMN almanac.sources.hit_rate IS 'Moving average of new leads filed per hunt.';
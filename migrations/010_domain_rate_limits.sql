@@ -0,0 +1,51 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 010
+ * # Per-domain request rates (hunter/rate_limiter.py).
+ * #
+ * # max_concurrent_requests caps threads, not requests per
+ * # second. These feed the shared per-domain token bucket that
+ * # agents acquire from before each request:
+ * #   requests_per_minute  steady rate (NULL = no local cap; the
+ * #                        API's own headers still pace it)
+ * #   burst                requests allowed back to back (NULL = 1)
+ * #   daily_quota          requests per UTC day (NULL = none);
+ * #                        e.g. 100 for the GNews.io free tier
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+ALTER TABLE almanac.source_domains
+    ADD COLUMN IF NOT EXISTS requests_per_minute real,
+    ADD COLUMN IF NOT EXISTS burst               integer,
+    ADD COLUMN IF NOT EXISTS daily_quota         integer;
+
+DO
+$$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'source_domains_rate_limits_positive') THEN
+            ALTER TABLE almanac.source_domains
+                ADD CONSTRAINT source_domains_rate_limits_positive
+                    CHECK ((requests_per_minute IS NULL OR requests_per_minute > 0)
+                        AND (burst IS NULL OR burst > 0)
+                        AND (daily_quota IS NULL OR daily_quota > 0));
+        END IF;
+    END
+$$;
+
+-- Reddit's OAuth limit is 100 requests/minute per client; GNews.io's free tier is 100 requests/day
+UPDATE almanac.source_domains
+SET requests_per_minute = 90,
+    burst               = 5
+WHERE agent_type = 'reddit'
+  AND requests_per_minute IS NULL;
+
+UPDATE almanac.source_domains
+SET daily_quota = 100
+WHERE agent_type = 'gnews_io'
+  AND daily_quota IS NULL;
+
+COMMENT ON COLUMN almanac.source_domains.requests_per_minute IS 'Steady request rate for the domain''s shared token bucket; NULL = header-paced only.';
+COMMENT ON COLUMN almanac.source_domains.burst IS 'Token bucket capacity (requests allowed back to back); NULL = 1.';
+COMMENT ON COLUMN almanac.source_domains.daily_quota IS 'Requests allowed per UTC day; NULL = no quota.';
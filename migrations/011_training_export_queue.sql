@@ -0,0 +1,27 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 011
+ * # Write-ahead queue for the not-a-case training export.
+ * #
+ * # process_triage deletes not-a-case leads from staging in the
+ * # same statement that labels them, so their text has to stay
+ * # somewhere durable until the JSONL writer has fsynced it.
+ * # The triage statement inserts each record here (in the same
+ * # transaction, so a rollback leaves nothing behind) and the
+ * # writer deletes the rows once the export is on disk. Rows
+ * # left by a crash are re-exported on the next start.
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+CREATE TABLE IF NOT EXISTS almanac.training_export_queue
+(
+    lead_uuid uuid PRIMARY KEY,
+    record    jsonb       NOT NULL,
+    queued_at timestamptz NOT NULL DEFAULT now()
+);
+
+GRANT SELECT, INSERT, DELETE ON TABLE almanac.training_export_queue TO hunter_app_user;
+
+COMMENT ON TABLE almanac.training_export_queue IS 'Not-a-case training records committed by triage but not yet fsynced to the JSONL export.';
@@ -0,0 +1,25 @@
+/*
+ * # ==========================================================
+ * # Hunter's Command Console - Migration 012
+ * # Persisted daily_quota usage (hunter/rate_limiter.py).
+ * #
+ * # The limiter counts quota requests in memory, so a restart
+ * # (or every run_scheduler --once) used to hand a domain its
+ * # whole daily_quota again. Each hunt now adds what it used
+ * # here, and the next one seeds the limiter from it:
+ * #   quota_day   UTC day quota_used belongs to
+ * #   quota_used  requests made that day (a stale quota_day
+ * #               means none yet today)
+ * # ==========================================================
+ */
+
+SET search_path = almanac, public;
+
+ALTER TABLE almanac.source_domains
+    ADD COLUMN IF NOT EXISTS quota_day  date,
+    ADD COLUMN IF NOT EXISTS quota_used integer NOT NULL DEFAULT 0;
+
+GRANT UPDATE (quota_day, quota_used) ON TABLE almanac.source_domains TO hunter_app_user;
+
+COMMENT ON COLUMN almanac.source_domains.quota_day IS 'UTC day that quota_used counts requests for.';
+COMMENT ON COLUMN almanac.source_domains.quota_used IS 'daily_quota requests made on quota_day, across all processes.';
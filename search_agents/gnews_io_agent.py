@@ -5,10 +5,30 @@
 
 import requests
 from datetime import datetime, timezone, timedelta
+from hunter import rate_limiter
 from hunter.models import SourceConfig
 import logging
 logger = logging.getLogger("GnewsIO Agent")
 
+# GNews answers 403 for more than a spent quota; only its quota message means "done for today"
+QUOTA_ERROR_MARKERS = ('request limit', 'quota')
+
+
+def _is_quota_error(response) -> bool:
+	if response.status_code != 403:
+		return False
+	try:
+		body = response.json()
+	except ValueError:
+		return False
+	errors = body.get('errors', []) if isinstance(body, dict) else body
+	if isinstance(errors, dict):
+		errors = list(errors.values())
+	if not isinstance(errors, list):
+		errors = [errors]
+	text = ' '.join(map(str, errors)).lower()
+	return any(marker in text for marker in QUOTA_ERROR_MARKERS)
+
 
 def hunt(source: SourceConfig, credentials):
 	"""
@@ -47,8 +67,20 @@ def hunt(source: SourceConfig, credentials):
 		logger.info(f"[{source_name}]: Searching for articles published after {params['from']}")
 
 	# --- Execute the Hunt ---
+	# Counts against the domain's daily_quota; a spent quota raises RateLimitExceeded,
+	# which the dispatcher treats as "try again after the reset", not as a failed hunt
+	limiter = rate_limiter.for_source(source)
+	limiter.acquire()
 	try:
 		response = requests.get(url, params=params)
+		limiter.observe_headers(response.headers, response.status_code)
+		if _is_quota_error(response):
+			# The day's requests are used up; they come back at 00:00 UTC
+			now = datetime.now(timezone.utc)
+			midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+			reset_in = (midnight - now).total_seconds()
+			limiter.observe(0, reset_in)
+			raise rate_limiter.RateLimitExceeded(limiter.key, reset_in)
 		# Will raise an HTTPError for bad responses (4xx or 5xx)
 		response.raise_for_status()
 		articles = response.json().get('articles', [])
@@ -58,6 +90,8 @@ def hunt(source: SourceConfig, credentials):
 		logger.info(f"[{source_name}]: Hunt successful. Returned {len(articles)} raw articles.")
 		return articles, None
 
+	except rate_limiter.RateLimitExceeded:
+		raise
 	except requests.exceptions.RequestException as e:
 		logger.error(f"[{source_name} ERROR]: A network error occurred during the hunt: {e}")
 		return [], None
@@ -5,42 +5,69 @@ import time
 
 import praw
 import logging
+from prawcore.exceptions import TooManyRequests
+from hunter import rate_limiter
 from hunter.models import SourceConfig
+from hunter.utils.stream_pipeline import ReturnValue
 
 logger = logging.getLogger("Reddit Agent")
 
 
 def hunt(source: SourceConfig, credentials: dict):
-	subreddit_name = source.target
 	last_checked_id = source.last_known_item_id
-
-	logger.debug(f"Searching subreddit '{subreddit_name}' at {time.time()}")
-
 	try:
-		reddit = praw.Reddit(
-				client_id=credentials['client_id'],
-				client_secret=credentials['client_secret'],
-				user_agent=credentials['user_agent']
-		)
-		subreddit = reddit.subreddit(subreddit_name)
-		params = {'before': last_checked_id} if last_checked_id else {}
-		new_posts = list(subreddit.new(limit=100, params=params))
-		logger.debug(f"Reddit limits {reddit.auth.limits}")
-
-		if not new_posts:
-			return [], last_checked_id
+		stream = ReturnValue(hunt_stream(source, credentials))
+		raw_leads = list(stream)
+		return raw_leads, stream.value
+	except Exception as e:
+		logger.error(f"Reddit Hunt failed: {e}")
+		return [], last_checked_id
 
-		raw_leads = [_extract_post_data(post) for post in new_posts]
 
-		# --- THE FIX: Return 'name' (t3_xyz) not 'id' (xyz) ---
-		# This ensures PRAW's 'before' parameter works correctly next time.
-		newest_fullname = new_posts[0].name
+def hunt_stream(source: SourceConfig, credentials: dict):
+	"""
+	Streaming hunt(): yields each post's raw data as PRAW pages it in and
+	returns the newest post's fullname as the bookmark. Errors propagate,
+	so the dispatcher counts them as a failed hunt.
+	"""
+	subreddit_name = source.target
+	last_checked_id = source.last_known_item_id
 
-		return raw_leads, newest_fullname
+	logger.debug(f"Searching subreddit '{subreddit_name}' at {time.time()}")
 
-	except Exception as e:
-		logger.error(f"Reddit Hunt failed: {e}")
-		return [], last_checked_id
+	reddit = praw.Reddit(
+			client_id=credentials['client_id'],
+			client_secret=credentials['client_secret'],
+			user_agent=credentials['user_agent']
+	)
+	subreddit = reddit.subreddit(subreddit_name)
+	params = {'before': last_checked_id} if last_checked_id else {}
+	limiter = rate_limiter.for_source(source)
+
+	# One listing request (limit <= 100); shared with every other Reddit source's thread
+	limiter.acquire()
+	newest_fullname = None
+	try:
+		for post in subreddit.new(limit=100, params=params):
+			# --- THE FIX: Return 'name' (t3_xyz) not 'id' (xyz) ---
+			# This ensures PRAW's 'before' parameter works correctly next time.
+			if newest_fullname is None:
+				newest_fullname = post.name
+			yield _extract_post_data(post)
+	except TooManyRequests as e:
+		limiter.throttled(rate_limiter.retry_after(e.response.headers))
+		raise
+	finally:
+		_observe_limits(limiter, reddit.auth.limits)
+
+	return newest_fullname or last_checked_id
+
+
+def _observe_limits(limiter, limits: dict):
+	"""PRAW's parsed X-Ratelimit-* headers: remaining requests until reset_timestamp (epoch seconds)."""
+	logger.debug(f"Reddit limits {limits}")
+	if limits.get('remaining') is not None and limits.get('reset_timestamp'):
+		limiter.observe(limits['remaining'], limits['reset_timestamp'] - time.time())
 
 
 def _extract_post_data(post) -> dict:
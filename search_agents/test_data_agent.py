@@ -1,40 +1,80 @@
 import json
 import os
 import logging
+import re
 from hunter.models import SourceConfig
+from hunter.utils.stream_pipeline import ReturnValue
 
 logger = logging.getLogger("TestDataAgent")
 
+READ_CHUNK = 1 << 16  # characters read at a time while streaming a JSON array
+_SEPARATORS = re.compile(r'[\s,]*')
+
 
 def hunt(source: SourceConfig, credentials: dict):
 	"""
 	Mock agent that reads leads from a local JSON file.
 	"""
+	if not os.path.exists(source.target):
+		logger.error(f"[{source.source_name}]: Test data file not found at: {source.target}")
+		return [], None
+
+	try:
+		stream = ReturnValue(hunt_stream(source, credentials))
+		data = list(stream)
+		logger.info(f"[{source.source_name}]: Loaded {len(data)} items from disk.")
+		return data, stream.value
+
+	except Exception as e:
+		logger.error(f"[{source.source_name}]: Failed to load test data: {e}")
+		return [], None
+
+
+def hunt_stream(source: SourceConfig, credentials: dict):
+	"""
+	Streaming hunt(): yields the file's leads one at a time. A top-level JSON
+	list is decoded element by element, so only one lead (plus a read chunk)
+	is held at once; a {'leads': [...]} file is loaded whole.
+	"""
 	# FIX: Access attribute directly from SourceConfig dataclass
 	# The dispatcher passes a SourceConfig object, not a dict.
 	target_file = source.target
 
 	logger.info(f"[{source.source_name}]: Mocking hunt from file: {target_file}")
 
-	if not os.path.exists(target_file):
-		logger.error(f"[{source.source_name}]: Test data file not found at: {target_file}")
-		return [], None
-
-	try:
-		with open(target_file, 'r', encoding='utf-8') as f:
-			data = json.load(f)
-
-		logger.info(f"[{source.source_name}]: Loaded {len(data)} items from disk.")
+	with open(target_file, 'r', encoding='utf-8') as f:
+		head = f.read(READ_CHUNK).lstrip()
+		if head.startswith('['):
+			yield from _iter_json_array(f, head[1:])
+			return None
 
-		# If the file contains a list, return it.
+		data = json.loads(head + f.read())
 		# If it has a 'leads' key, return that.
-		if isinstance(data, list):
-			return data, None
-		elif isinstance(data, dict) and 'leads' in data:
-			return data['leads'], None
+		if isinstance(data, dict) and 'leads' in data:
+			yield from data['leads']
+	return None
 
-		return [], None
 
-	except Exception as e:
-		logger.error(f"[{source.source_name}]: Failed to load test data: {e}")
-		return [], None
\ No newline at end of file
+def _iter_json_array(f, buffer: str):
+	"""Decodes the elements of a JSON array whose opening '[' has been consumed."""
+	decoder = json.JSONDecoder()
+	pos, at_eof = 0, False
+	while True:
+		pos = _SEPARATORS.match(buffer, pos).end()
+		if buffer.startswith(']', pos):
+			return
+		try:
+			item, end = decoder.raw_decode(buffer, pos)
+		except json.JSONDecodeError:
+			item, end = None, None
+		# A match running to the end of the buffer may be a truncated number; read on to be sure
+		if end is None or (end == len(buffer) and not at_eof):
+			chunk = f.read(READ_CHUNK)
+			if not chunk and (at_eof or end is None):
+				raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+			at_eof = not chunk
+			buffer = buffer[pos:] + chunk
+			pos = 0
+			continue
+		yield item
+		pos = end
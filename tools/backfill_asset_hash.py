@@ -0,0 +1,100 @@
+# ==========================================================
+# Hunter's Command Console - Asset Hash Backfill
+# Migration 007 adds assets.content_hash but leaves it NULL for
+# existing rows. This tool hashes each of those files (SHA-256)
+# and records the digest, one commit per batch. Files stay where
+# they are; only new saves use the sharded content-addressed
+# layout.
+#
+# A file whose content is already recorded for another row is a
+# duplicate; it keeps a NULL hash and is reported, not merged.
+# Rows whose file can't be found are reported too.
+#
+#   python tools/backfill_asset_hash.py --batch-size 500 [--dry-run]
+# ==========================================================
+
+import argparse
+import hashlib
+import os
+import sys
+
+# --- Pathing Magic ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+# --- End Magic ---
+
+import psycopg2
+
+from hunter import db_manager
+from hunter.utils.asset_store import ASSETS_DIR
+
+
+def _resolve(file_path: str) -> str | None:
+	"""Legacy rows hold paths relative to the assets folder, the project root, or absolute ones."""
+	for candidate in (os.path.join(ASSETS_DIR, file_path), os.path.join(project_root, file_path), file_path):
+		if os.path.isfile(candidate):
+			return candidate
+	return None
+
+
+def _sha256(path: str) -> bytes:
+	digest = hashlib.sha256()
+	with open(path, "rb") as f:
+		for chunk in iter(lambda: f.read(1 << 20), b""):
+			digest.update(chunk)
+	return digest.digest()
+
+
+def backfill(batch_size: int, dry_run: bool):
+	conn = db_manager.get_conn()
+	after_id, updated, duplicates, missing = 0, 0, [], []
+	try:
+		while True:
+			with conn.cursor() as cur:
+				cur.execute("""
+					SELECT id, file_path FROM almanac.assets
+					WHERE id > %s AND content_hash IS NULL
+					ORDER BY id
+					LIMIT %s
+				""", (after_id, batch_size))
+				rows = cur.fetchall()
+				if not rows:
+					break
+				after_id = rows[-1][0]
+
+				for row_id, file_path in rows:
+					path = _resolve(file_path)
+					if path is None:
+						missing.append(file_path)
+						continue
+					content_hash = _sha256(path)
+					cur.execute("SELECT 1 FROM almanac.assets WHERE content_hash = %s", (psycopg2.Binary(content_hash),))
+					if cur.fetchone():
+						duplicates.append(file_path)
+						continue
+					cur.execute("UPDATE almanac.assets SET content_hash = %s WHERE id = %s",
+					            (psycopg2.Binary(content_hash), row_id))
+					updated += 1
+			if dry_run:
+				conn.rollback()
+			else:
+				conn.commit()
+			print(f"  ...through id {after_id}: {updated} hashed, {len(duplicates)} duplicates, {len(missing)} missing")
+	finally:
+		conn.rollback()
+		db_manager.release_conn(conn)
+
+	for file_path in duplicates:
+		print(f"  [DUPLICATE] {file_path}")
+	for file_path in missing:
+		print(f"  [MISSING]   {file_path}")
+	print(f"\nDone: {updated} hashed{' (dry run, rolled back)' if dry_run else ''}, "
+	      f"{len(duplicates)} duplicates, {len(missing)} missing files.")
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Record SHA-256 content hashes for legacy assets.")
+	parser.add_argument("--batch-size", type=int, default=500)
+	parser.add_argument("--dry-run", action="store_true")
+	args = parser.parse_args()
+	backfill(args.batch_size, args.dry_run)
@@ -0,0 +1,122 @@
+# ==========================================================
+# Hunter's Command Console - URL Hash Backfill
+# Migration 004 seeds acquisition_router.url_hash from the raw
+# item_url. This tool re-hashes every row from its *canonical* URL
+# (hunter/utils/url_canonicalizer.py) in bounded batches, one
+# commit per batch, so it can be stopped and re-run at any time.
+#
+# Rows whose canonical URL already belongs to another row are
+# duplicates that slipped in before canonicalization. They keep
+# their raw hash and are reported, not merged; the app's duplicate
+# check matches raw hashes too, so they don't breed new duplicates.
+#
+#   python tools/backfill_url_hash.py --batch-size 5000 [--dry-run]
+# ==========================================================
+
+import argparse
+import os
+import sys
+import time
+
+# --- Pathing Magic ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+# --- End Magic ---
+
+import psycopg2
+import psycopg2.extras
+
+from hunter import db_manager
+from hunter.utils.url_canonicalizer import url_hash
+
+
+def _backfill_batch(conn, after_id: int, batch_size: int, dry_run: bool):
+	"""Processes one id-ordered batch. Returns (last_id, scanned, updated, duplicates)."""
+	with conn.cursor() as cur:
+		cur.execute("""
+			SELECT id, lead_uuid, item_url, url_hash
+			FROM acquisition_router
+			WHERE id > %s AND item_url IS NOT NULL
+			ORDER BY id
+			LIMIT %s
+		""", (after_id, batch_size))
+		rows = cur.fetchall()
+		if not rows:
+			return None, 0, 0, []
+
+		# Rows whose stored hash isn't the canonical one yet
+		pending = {}
+		for row_id, lead_uuid, item_url, stored in rows:
+			canonical = url_hash(item_url)
+			if stored is None or bytes(stored) != canonical:
+				pending[row_id] = (lead_uuid, canonical)
+
+		duplicates = []
+		if pending:
+			# A canonical hash already owned by some other row means this row is a duplicate.
+			cur.execute("SELECT url_hash FROM acquisition_router WHERE url_hash = ANY(%s::bytea[])",
+			            ([psycopg2.Binary(h) for _, h in pending.values()],))
+			taken = {bytes(r[0]) for r in cur.fetchall()}
+
+			updates = []
+			for row_id, (lead_uuid, canonical) in pending.items():
+				if canonical in taken:
+					duplicates.append(lead_uuid)
+					continue
+				taken.add(canonical)
+				updates.append((row_id, psycopg2.Binary(canonical)))
+
+			if updates and not dry_run:
+				psycopg2.extras.execute_values(cur, """
+					UPDATE acquisition_router AS ar
+					SET url_hash = v.url_hash
+					FROM (VALUES %s) AS v(id, url_hash)
+					WHERE ar.id = v.id
+				""", updates, template="(%s, %s::bytea)", page_size=len(updates))
+		else:
+			updates = []
+
+	if dry_run:
+		conn.rollback()
+	else:
+		conn.commit()
+	return rows[-1][0], len(rows), len(updates), duplicates
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Re-hash acquisition_router.url_hash from canonical URLs.")
+	parser.add_argument("--batch-size", type=int, default=5000)
+	parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches.")
+	parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing.")
+	args = parser.parse_args()
+
+	print("--- Hunter's Almanac URL Hash Backfill ---")
+	conn = db_manager.get_conn()
+	last_id, total_scanned, total_updated, all_duplicates = 0, 0, 0, []
+	try:
+		while True:
+			last_id, scanned, updated, duplicates = _backfill_batch(conn, last_id, args.batch_size, args.dry_run)
+			if last_id is None:
+				break
+			total_scanned += scanned
+			total_updated += updated
+			all_duplicates.extend(duplicates)
+			print(f"[BACKFILL]: up to id {last_id}: scanned {total_scanned}, re-hashed {total_updated}, "
+			      f"duplicates {len(all_duplicates)}")
+			if args.pause:
+				time.sleep(args.pause)
+	except Exception as e:
+		conn.rollback()
+		print(f"[BACKFILL ERROR]: {e}")
+	finally:
+		db_manager.release_conn(conn)
+
+	print(f"\n--- Backfill {'(dry run) ' if args.dry_run else ''}complete: {total_updated} of {total_scanned} rows re-hashed. ---")
+	if all_duplicates:
+		print(f"{len(all_duplicates)} leads duplicate an existing canonical URL and kept their raw hash:")
+		for lead_uuid in all_duplicates:
+			print(f"  -> {lead_uuid}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,109 @@
+# ==========================================================
+# Hunter's Command Console - Asset Lookup Benchmark
+# Seeds N synthetic assets (each linked to 1-3 of a pool of
+# cases, with ~1 KB of metadata), then times "assets for a case"
+# three ways: the old `= ANY(related_cases)` SELECT *, the
+# GIN-served `@>` SELECT *, and db_manager's asset_case_links
+# summary listing. Seeded rows are deleted afterwards.
+#
+#   python tools/bench_asset_links.py --assets 100000 --cases 2000
+# ==========================================================
+
+import argparse
+import random
+import time
+import uuid
+
+import psycopg2.extras
+
+import bench_support
+from hunter import db_manager
+
+LEGACY_SQL = "SELECT * FROM almanac.assets WHERE %s = ANY(related_cases) ORDER BY created_at DESC"
+CONTAINS_SQL = "SELECT * FROM almanac.assets WHERE related_cases @> ARRAY[%s]::uuid[] ORDER BY created_at DESC"
+
+
+def _path_prefix(run_id: str) -> str:
+	return f"bench/{run_id}/"
+
+
+def seed_assets(run_id: str, count: int, case_uuids: list, batch_size: int = 5000):
+	analysis = {'analysis': {'notes': "x" * 900, 'scores': list(range(20))}}
+	conn = db_manager.get_conn()
+	try:
+		with conn.cursor() as cur:
+			for start in range(0, count, batch_size):
+				rows = [(f"{_path_prefix(run_id)}{i}.png", 'image', 'image/png', 1024,
+				         random.sample(case_uuids, random.randint(1, 3)), psycopg2.extras.Json(analysis))
+				        for i in range(start, min(start + batch_size, count))]
+				psycopg2.extras.execute_values(cur, """
+					INSERT INTO almanac.assets (file_path, file_type, mime_type, file_size, related_cases, metadata)
+					VALUES %s
+				""", rows, template="(%s, %s, %s, %s, %s::uuid[], %s)", page_size=batch_size)
+				conn.commit()
+				print(f"  seeded {min(start + batch_size, count)}/{count} assets")
+			cur.execute("ANALYZE almanac.assets")
+			cur.execute("ANALYZE almanac.asset_case_links")
+		conn.commit()
+	finally:
+		db_manager.release_conn(conn)
+
+
+def cleanup(run_id: str):
+	# asset_case_links rows go with their asset via ON DELETE CASCADE
+	with db_manager.connection() as conn:
+		with conn.cursor() as cur:
+			cur.execute("DELETE FROM almanac.assets WHERE file_path LIKE %s", (_path_prefix(run_id) + "%",))
+		conn.commit()
+
+
+def _time_sql(sql: str, samples: list) -> tuple:
+	"""(mean seconds, mean rows) running sql once per sampled case on one connection."""
+	rows = 0
+	with db_manager.connection() as conn:
+		with conn.cursor() as cur:
+			start = time.perf_counter()
+			for case_uuid in samples:
+				cur.execute(sql, (case_uuid,))
+				rows += len(cur.fetchall())
+			elapsed = time.perf_counter() - start
+		conn.rollback()
+	return elapsed / len(samples), rows / len(samples)
+
+
+def _time_call(fn, samples: list) -> tuple:
+	rows = 0
+	start = time.perf_counter()
+	for case_uuid in samples:
+		rows += len(fn(case_uuid))
+	return (time.perf_counter() - start) / len(samples), rows / len(samples)
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark assets-for-case lookups.")
+	parser.add_argument("--assets", type=int, default=100000)
+	parser.add_argument("--cases", type=int, default=2000)
+	parser.add_argument("--samples", type=int, default=200, help="Cases looked up per method.")
+	args = parser.parse_args()
+
+	run_id = bench_support.new_run_id()
+	case_uuids = [uuid.uuid4() for _ in range(args.cases)]
+	samples = random.sample(case_uuids, min(args.samples, len(case_uuids)))
+	print(f"--- {args.assets} assets over {args.cases} cases (run {run_id}) ---")
+	try:
+		seed_assets(run_id, args.assets, case_uuids)
+		results = [
+			("= ANY(related_cases), SELECT *", _time_sql(LEGACY_SQL, samples)),
+			("@> (GIN), SELECT *", _time_sql(CONTAINS_SQL, samples)),
+			("links join, full assets", _time_call(db_manager.get_assets_for_case, samples)),
+			("links join, summaries", _time_call(db_manager.get_asset_summaries_for_case, samples)),
+		]
+		print(f"\n{'method':<32} {'per case':>10} {'rows':>6}")
+		for label, (seconds, rows) in results:
+			print(f"{label:<32} {seconds * 1000:8.2f}ms {rows:6.1f}")
+	finally:
+		cleanup(run_id)
+
+
+if __name__ == "__main__":
+	main()
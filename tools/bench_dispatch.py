@@ -0,0 +1,184 @@
+# ==========================================================
+# Hunter's Command Console - Dispatcher Engine Benchmark
+# Hunts N mock sources against a local HTTP server (run in its
+# own process, with a fixed per-request latency) using:
+#   - the thread-per-domain Dispatcher
+#   - AsyncDispatcher with a blocking agent (shared executor)
+#   - AsyncDispatcher with a native hunt_async agent
+# and reports sources/sec and the peak thread count. Filing and
+# source state are stubbed out; only the engines are compared.
+#
+#   python tools/bench_dispatch.py --sources 300 --domains 6 --latency-ms 50
+# ==========================================================
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+import urllib.request
+from types import SimpleNamespace
+
+import bench_support  # noqa: F401  (pathing)
+from hunter.dispatcher import Dispatcher, AsyncDispatcher, ASYNC_EXECUTOR_WORKERS
+
+
+# --- Mock HTTP server (separate process, so its threads aren't counted) ---
+
+def _serve(port_pipe, latency: float, leads: int):
+	body = json.dumps([{'title': f"Mock lead {i}", 'url': f"https://mock.invalid/{i}"} for i in range(leads)]).encode()
+	header = (f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+	          f"Connection: close\r\n\r\n").encode()
+
+	async def handle(reader, writer):
+		await reader.readuntil(b"\r\n\r\n")
+		await asyncio.sleep(latency)
+		writer.write(header + body)
+		await writer.drain()
+		writer.close()
+
+	async def main():
+		server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+		port_pipe.send(server.sockets[0].getsockname()[1])
+		async with server:
+			await server.serve_forever()
+
+	asyncio.run(main())
+
+
+def _split_response(raw: bytes) -> list:
+	return json.loads(raw.split(b"\r\n\r\n", 1)[1])
+
+
+def make_agents(port: int):
+	def hunt(source, credentials):
+		with urllib.request.urlopen(f"http://127.0.0.1:{port}/source/{source.id}") as response:
+			return json.loads(response.read()), None
+
+	async def hunt_async(source, credentials):
+		reader, writer = await asyncio.open_connection("127.0.0.1", port)
+		writer.write(f"GET /source/{source.id} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n".encode())
+		await writer.drain()
+		raw = await reader.read()
+		writer.close()
+		return _split_response(raw), None
+
+	return SimpleNamespace(hunt=hunt), SimpleNamespace(hunt=hunt, hunt_async=hunt_async)
+
+
+# --- Engines with the database stubbed out ---
+
+class _NullStates:
+	def record_success(self, source_id, bookmark=None, token=None):
+		return True
+
+	def record_failure(self, source_id):
+		pass
+
+	def record_abandoned(self, source_id, token):
+		token.abandon()
+
+	def flush(self, source_ids=None):
+		pass
+
+
+class _BenchMixin:
+	def _setup(self, agent):
+		self.config = None
+		self.all_threads_done = None
+		self.active_threads = {}
+		self.source_states = _NullStates()
+		self.foreman_map = {'mock_foreman': None}
+		self.agent = agent
+		self.filed = 0
+		self.filed_lock = threading.Lock()
+		self._init_hunt_control(None)
+
+	def _before_hunt(self, concurrent_connections):
+		pass
+
+	def _after_hunt(self):
+		pass
+
+	def _load_agent(self, agent_type):
+		return self.agent
+
+	def _file_hunt_result(self, source, raw_leads, bookmark, foreman_handler, token=None):
+		with self.filed_lock:
+			self.filed += len(raw_leads)
+
+
+class BenchDispatcher(_BenchMixin, Dispatcher):
+	def __init__(self, agent):
+		self._setup(agent)
+
+
+class BenchAsyncDispatcher(_BenchMixin, AsyncDispatcher):
+	def __init__(self, agent, executor_workers):
+		self._setup(agent)
+		self.executor_workers = executor_workers
+
+
+def make_domains(sources: int, domains: int, max_concurrent: int) -> dict:
+	result = {f"domain-{d}": {'agent_type': 'mock', 'max_concurrent': max_concurrent, 'sources': []}
+	          for d in range(domains)}
+	for i in range(sources):
+		result[f"domain-{i % domains}"]['sources'].append(SimpleNamespace(id=i, source_name=f"mock-{i}"))
+	return result
+
+
+def run(engine, domains: dict) -> tuple:
+	"""(seconds, peak threads besides the sampler) for one full dispatch."""
+	peak = threading.active_count()
+	done = threading.Event()
+
+	def sample():
+		nonlocal peak
+		while not done.is_set():
+			peak = max(peak, threading.active_count() - 1)
+			time.sleep(0.002)
+
+	sampler = threading.Thread(target=sample, daemon=True)
+	sampler.start()
+	start = time.perf_counter()
+	engine.dispatch(domains).wait()
+	elapsed = time.perf_counter() - start
+	done.set()
+	sampler.join()
+	return elapsed, peak
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Compare threaded vs. asyncio dispatch against a mock HTTP API.")
+	parser.add_argument("--sources", type=int, default=300)
+	parser.add_argument("--domains", type=int, default=6)
+	parser.add_argument("--max-concurrent", type=int, default=10, help="Per-domain max_concurrent_requests.")
+	parser.add_argument("--latency-ms", type=float, default=50.0)
+	parser.add_argument("--leads", type=int, default=10, help="Leads returned per source.")
+	parser.add_argument("--workers", type=int, default=ASYNC_EXECUTOR_WORKERS, help="AsyncDispatcher executor size.")
+	args = parser.parse_args()
+
+	parent_end, child_end = multiprocessing.Pipe()
+	server = multiprocessing.Process(target=_serve, args=(child_end, args.latency_ms / 1000, args.leads), daemon=True)
+	server.start()
+	port = parent_end.recv()
+	blocking_agent, async_agent = make_agents(port)
+
+	try:
+		print(f"--- {args.sources} sources / {args.domains} domains, max_concurrent={args.max_concurrent}, "
+		      f"{args.latency_ms:.0f}ms latency ---")
+		print(f"{'engine':<28} {'seconds':>8} {'sources/s':>10} {'peak threads':>13} {'leads':>7}")
+		for label, engine in (
+				("threaded Dispatcher", BenchDispatcher(blocking_agent)),
+				(f"async, blocking agent ({args.workers}w)", BenchAsyncDispatcher(blocking_agent, args.workers)),
+				("async, native agent", BenchAsyncDispatcher(async_agent, args.workers)),
+		):
+			elapsed, peak = run(engine, make_domains(args.sources, args.domains, args.max_concurrent))
+			print(f"{label:<28} {elapsed:8.2f} {args.sources / elapsed:10.1f} {peak:13d} {engine.filed:7d}")
+	finally:
+		server.terminate()
+
+
+if __name__ == "__main__":
+	main()
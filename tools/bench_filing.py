@@ -0,0 +1,58 @@
+# ==========================================================
+# Hunter's Command Console - Filing Benchmark
+# Compares per-lead filing (file_new_lead) against the batched
+# file_leads_bulk path on a local PostgreSQL. Synthetic leads are
+# filed under a throwaway URL prefix and removed afterwards.
+#
+#   python tools/bench_filing.py --count 1000 --source "Reddit Ghosts"
+# ==========================================================
+
+import argparse
+import time
+
+import bench_support
+from hunter import db_manager
+from hunter.models import LeadData
+
+
+def bench_sequential(leads: list[LeadData]) -> float:
+	start = time.perf_counter()
+	for lead in leads:
+		db_manager.file_new_lead(lead, db_manager.get_source_id(lead.source_name))
+	return time.perf_counter() - start
+
+
+def bench_bulk(leads: list[LeadData], batch_size: int) -> float:
+	start = time.perf_counter()
+	for i in range(0, len(leads), batch_size):
+		db_manager.file_leads_bulk(leads[i:i + batch_size])
+	return time.perf_counter() - start
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark lead filing throughput.")
+	parser.add_argument("--count", type=int, default=1000, help="Leads filed per mode.")
+	parser.add_argument("--batch-size", type=int, default=100, help="Leads per file_leads_bulk call.")
+	parser.add_argument("--source", default=None, help="Existing source_name to file under.")
+	args = parser.parse_args()
+
+	source_name = args.source or bench_support.default_source_name()
+	if not source_name:
+		print("[BENCH FATAL]: No active sources found. Pass --source.")
+		return
+
+	run_id = bench_support.new_run_id()
+	print(f"--- Filing benchmark: {args.count} leads, source '{source_name}', run {run_id} ---")
+	try:
+		seq = bench_sequential(bench_support.make_leads(run_id, "seq", args.count, source_name))
+		bulk = bench_bulk(bench_support.make_leads(run_id, "bulk", args.count, source_name), args.batch_size)
+	finally:
+		bench_support.cleanup(run_id)
+
+	print(f"Sequential file_new_lead : {seq:8.3f}s  {args.count / seq:10.1f} leads/sec")
+	print(f"file_leads_bulk (x{args.batch_size:<4}): {bulk:8.3f}s  {args.count / bulk:10.1f} leads/sec")
+	print(f"Speedup: {seq / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,93 @@
+# ==========================================================
+# Hunter's Command Console - Prepared Statement Benchmark
+# Times each statement in db_manager.PREPARED_STATEMENTS as plain
+# SQL text vs. EXECUTE of the prepared form, on one connection.
+# Writes happen inside a transaction that is rolled back.
+#
+#   python tools/bench_prepared.py --iterations 2000
+# ==========================================================
+
+import argparse
+import time
+from datetime import datetime, timezone
+
+import psycopg2.extras
+
+import bench_support
+from hunter import db_manager
+from hunter.utils.url_canonicalizer import url_hash
+
+
+def _param_factories(run_id: str, lead_uuid, source_id: int) -> dict:
+	"""Per-iteration parameter builders for every registered statement."""
+	now = datetime.now(timezone.utc)
+
+	def router(i):
+		url = f"{bench_support.BENCH_URL_PREFIX}/{run_id}/prepared/{i}"
+		return source_id, url, url_hash(url), now
+
+	return {
+		'router_upsert':        router,
+		'log_insert':           lambda i: (lead_uuid, source_id),
+		'staging_upsert':       lambda i: (lead_uuid, f"Prepared #{i}", "text", "<p>text</p>",
+		                                   psycopg2.extras.Json({'score': i})),
+		'source_state_success': lambda i: (now, now, None, source_id),
+		'source_state_failure': lambda i: (source_id,),
+		'lead_by_uuid':         lambda i: (lead_uuid,),
+	}
+
+
+def _time_statement(conn, name: str, make_params, iterations: int, prepared: bool) -> float:
+	"""Mean seconds per call. Everything is rolled back afterwards."""
+	_, sql = db_manager.PREPARED_STATEMENTS[name]
+	try:
+		with conn.cursor() as cur:
+			start = time.perf_counter()
+			for i in range(iterations):
+				if prepared:
+					db_manager.execute_prepared(cur, name, make_params(i))
+				else:
+					cur.execute(sql, make_params(i))
+				if cur.description:
+					cur.fetchall()
+			return (time.perf_counter() - start) / iterations
+	finally:
+		conn.rollback()
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark prepared vs. plain hot statements.")
+	parser.add_argument("--iterations", type=int, default=2000)
+	parser.add_argument("--source", default=None, help="Existing source_name to seed under.")
+	args = parser.parse_args()
+
+	source_name = args.source or bench_support.default_source_name()
+	if not source_name:
+		print("[BENCH FATAL]: No active sources found. Pass --source.")
+		return
+
+	run_id = bench_support.new_run_id()
+	bench_support.seed_leads(run_id, "prepared-seed", 1, source_name)
+	source_id = db_manager.get_source_id(source_name)
+	conn = db_manager.get_conn()
+	try:
+		with conn.cursor() as cur:
+			cur.execute("SELECT lead_uuid FROM acquisition_router WHERE item_url LIKE %s",
+			            (f"{bench_support.BENCH_URL_PREFIX}/{run_id}/%",))
+			lead_uuid = cur.fetchone()[0]
+		conn.rollback()
+		factories = _param_factories(run_id, lead_uuid, source_id)
+
+		print(f"--- {args.iterations} calls per statement (run {run_id}) ---")
+		print(f"{'statement':<22} {'plain':>10} {'prepared':>10} {'speedup':>8}")
+		for name, make_params in factories.items():
+			plain = _time_statement(conn, name, make_params, args.iterations, prepared=False)
+			prepared = _time_statement(conn, name, make_params, args.iterations, prepared=True)
+			print(f"{name:<22} {plain * 1e6:8.1f}us {prepared * 1e6:8.1f}us {plain / prepared:7.2f}x")
+	finally:
+		db_manager.release_conn(conn)
+		bench_support.cleanup(run_id)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,112 @@
+# ==========================================================
+# Hunter's Command Console - Metadata Rehydration Benchmark
+# Rehydrates N synthetic Reddit metadata rows (no database) with
+# the old per-row split + dataclass + merge, with the compiled
+# field plan, and with LazyMetadata both untouched (a triage list)
+# and read (a dossier).
+#
+#   python tools/bench_rehydrate.py --rows 50000
+# ==========================================================
+
+import argparse
+import dataclasses
+import random
+import time
+
+import bench_support
+from hunter.models import (METADATA_CLASS_MAP, METADATA_EXTRA_FIELDS, LazyMetadata,
+                           get_metadata_plan)
+
+SOURCE_NAME = "Reddit Ghosts"
+
+# The pre-plan blueprint had a __dict__; rebuild an equivalent plain dataclass to time the old path.
+_LegacyMetadata = dataclasses.make_dataclass(
+		"LegacyRedditMetadata",
+		[(f.name, f.type, dataclasses.field(default=f.default)) for f in
+		 dataclasses.fields(METADATA_CLASS_MAP[SOURCE_NAME])])
+
+
+def legacy_rehydrate(source_name: str, raw_metadata: dict) -> dict:
+	"""The pre-plan db_manager._rehydrate_metadata, verbatim apart from the class lookup."""
+	if not raw_metadata:
+		return {}
+	extra_fields = METADATA_EXTRA_FIELDS.get(source_name, [])
+	class_data = {k: v for k, v in raw_metadata.items() if k not in extra_fields}
+	extra_data = {k: v for k, v in raw_metadata.items() if k in extra_fields}
+	try:
+		obj = _LegacyMetadata(**class_data)
+		merged = obj.__dict__
+		merged.update(extra_data)
+		return merged
+	except Exception:
+		return raw_metadata
+
+
+def make_rows(count: int) -> list:
+	rows = []
+	for i in range(count):
+		raw = {'score': random.randint(0, 5000), 'author': f"user{i}", 'subreddit': "Ghosts",
+		       'num_comments': random.randint(0, 300), 'post_id': f"t3_{i:x}", 'is_self': i % 3 == 0}
+		if i % 4 == 0:
+			raw['flair'] = "Personal Experience"
+		if i % 5 == 0:
+			raw['media'] = {'url': f"https://v.redd.it/{i}", 'type': 'video', 'duration': 30}
+		rows.append(raw)
+	return rows
+
+
+def run_legacy(rows):
+	return [legacy_rehydrate(SOURCE_NAME, raw) for raw in rows]
+
+
+def run_plan(rows):
+	plan = get_metadata_plan(SOURCE_NAME)
+	return [plan.rehydrate(raw) for raw in rows]
+
+
+def run_lazy_untouched(rows):
+	plan = get_metadata_plan(SOURCE_NAME)
+	return [LazyMetadata(plan, raw) for raw in rows]
+
+
+def run_lazy_read(rows):
+	plan = get_metadata_plan(SOURCE_NAME)
+	wrapped = [LazyMetadata(plan, raw) for raw in rows]
+	for metadata in wrapped:
+		metadata.get('media')
+	return wrapped
+
+
+def _best_of(fn, rows, repeat: int) -> float:
+	best = float("inf")
+	for _ in range(repeat):
+		start = time.perf_counter()
+		fn(rows)
+		best = min(best, time.perf_counter() - start)
+	return best
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark metadata rehydration strategies.")
+	parser.add_argument("--rows", type=int, default=50000)
+	parser.add_argument("--repeat", type=int, default=5, help="Best-of runs per strategy.")
+	args = parser.parse_args()
+
+	rows = make_rows(args.rows)
+	# Same output, so the speedup isn't bought with a behaviour change
+	assert run_legacy(rows[:1000]) == run_plan(rows[:1000])
+
+	print(f"--- {args.rows} {SOURCE_NAME} metadata rows, best of {args.repeat} ---")
+	print(f"{'strategy':<22} {'total':>10} {'per row':>10} {'peak mem':>10}")
+	baseline = None
+	for label, fn in (("legacy (dataclass)", run_legacy), ("compiled plan", run_plan),
+	                  ("lazy, untouched", run_lazy_untouched), ("lazy, read", run_lazy_read)):
+		best = _best_of(fn, rows, args.repeat)
+		_, _, peak = bench_support.measure(fn, rows)
+		baseline = baseline or best
+		print(f"{label:<22} {best * 1000:8.1f}ms {best / args.rows * 1e6:8.2f}us "
+		      f"{peak / 1024 / 1024:8.1f}MB  ({baseline / best:.1f}x)")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,117 @@
+# ==========================================================
+# Hunter's Command Console - Streaming Pipeline Benchmark
+# Writes a synthetic test_data JSON file of N Reddit-shaped
+# posts, then runs one source through Dispatcher._process_source
+# twice with the Reddit foreman: batch (hunt() → translate all →
+# file all) and streaming (hunt_stream() → translate_iter →
+# micro-batch filing). Filing is stubbed with a fixed per-batch
+# latency; reports time to the first filed lead, total time and
+# peak traced memory.
+#
+#   python tools/bench_stream.py --posts 50000 --batch-size 100 --file-latency-ms 20
+# ==========================================================
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+import bench_support
+from hunter.dispatcher import Dispatcher, FILING_BATCH_SIZE, STREAM_PENDING_BATCHES
+from hunter.foremen.reddit_foreman import RedditForeman
+from search_agents import test_data_agent
+
+
+def write_posts(path: str, count: int, body_size: int):
+	body = ("Something knocked three times on the cellar door. " * (body_size // 50 + 1))[:body_size]
+	with open(path, 'w', encoding='utf-8') as f:
+		f.write('[')
+		for i in range(count):
+			post = {'title': f"Streamed post #{i}", 'url': f"https://www.reddit.com/r/bench/comments/{i:x}/",
+			        'id': f"{i:x}", 'subreddit': "bench", 'author': f"user{i}", 'created_utc': 1.7e9 + i,
+			        'score': i % 500, 'num_comments': i % 40, 'is_self': True, 'selftext': body,
+			        'selftext_html': f"<p>{body}</p>", 'flair': None}
+			f.write((',' if i else '') + json.dumps(post))
+		f.write(']')
+
+
+class _StubClerk:
+	"""Counts leads and sleeps per batch in place of FilingClerk/db_manager."""
+
+	def __init__(self, latency: float, per_lead: float):
+		self.latency = latency
+		self.per_lead = per_lead
+		self.filed = 0
+		self.first_filed_at = None
+		self._lock = threading.Lock()
+
+	def file_leads(self, leads):
+		time.sleep(self.latency + self.per_lead * len(leads))
+		with self._lock:
+			self.filed += len(leads)
+			if self.first_filed_at is None:
+				self.first_filed_at = time.perf_counter()
+		return True
+
+
+class _NullStates:
+	def record_success(self, source_id, bookmark=None, token=None):
+		return True
+
+	def record_failure(self, source_id):
+		pass
+
+	def record_abandoned(self, source_id, token):
+		token.abandon()
+
+
+class BenchDispatcher(Dispatcher):
+	def __init__(self, clerk, batch_size: int, pending: int):
+		self.config = None
+		self.filing_clerk = clerk
+		self.source_states = _NullStates()
+		self.filing_batch_size = batch_size
+		self.stream_pending_batches = pending
+
+
+def run(streaming: bool, source, args) -> tuple:
+	clerk = _StubClerk(args.file_latency_ms / 1000, args.per_lead_us / 1e6)
+	engine = BenchDispatcher(clerk, args.batch_size, args.pending)
+	# Without hunt_stream the dispatcher takes the whole-list path
+	agent = test_data_agent if streaming else SimpleNamespace(hunt=test_data_agent.hunt)
+
+	start = time.perf_counter()
+	_, elapsed, peak = bench_support.measure(engine._process_source, source, agent, RedditForeman, None)
+	return clerk.first_filed_at - start, elapsed, peak, clerk.filed
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Compare batch vs. streaming agent → foreman → filing.")
+	parser.add_argument("--posts", type=int, default=50000)
+	parser.add_argument("--body-size", type=int, default=1000, help="selftext characters per post.")
+	parser.add_argument("--batch-size", type=int, default=FILING_BATCH_SIZE)
+	parser.add_argument("--pending", type=int, default=STREAM_PENDING_BATCHES, help="Queued batches per source.")
+	parser.add_argument("--file-latency-ms", type=float, default=20.0, help="Simulated cost per filing call.")
+	parser.add_argument("--per-lead-us", type=float, default=200.0, help="Simulated filing cost per lead.")
+	args = parser.parse_args()
+
+	fd, path = tempfile.mkstemp(suffix=".json", prefix="bench_stream_")
+	os.close(fd)
+	try:
+		write_posts(path, args.posts, args.body_size)
+		source = SimpleNamespace(id=0, source_name="Bench Stream", target=path, last_known_item_id=None)
+		print(f"--- {args.posts} posts ({os.path.getsize(path) / 1024 / 1024:.1f}MB file), "
+		      f"batch size {args.batch_size}, {args.file_latency_ms:.0f}ms + {args.per_lead_us:.0f}us/lead filing ---")
+		print(f"{'pipeline':<12} {'first lead':>11} {'total':>9} {'peak mem':>10} {'filed':>7}")
+		for label, streaming in (("batch", False), ("streaming", True)):
+			first, elapsed, peak, filed = run(streaming, source, args)
+			print(f"{label:<12} {first * 1000:9.0f}ms {elapsed:8.2f}s {peak / 1024 / 1024:8.1f}MB {filed:7d}")
+	finally:
+		os.remove(path)
+
+
+if __name__ == "__main__":
+	main()
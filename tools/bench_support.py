@@ -0,0 +1,93 @@
+# ==========================================================
+# Hunter's Command Console - Benchmark Support
+# Shared helpers for the tools/bench_*.py scripts: synthetic
+# leads filed under a throwaway URL prefix, and their cleanup.
+# ==========================================================
+
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone, timedelta
+
+# --- Pathing Magic ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+# --- End Magic ---
+
+from hunter import db_manager
+from hunter.models import LeadData
+
+BENCH_URL_PREFIX = "https://bench.invalid"
+
+
+def new_run_id() -> str:
+	return uuid.uuid4().hex[:8]
+
+
+def default_source_name() -> str | None:
+	"""Picks the first active source so benchmarks can run without arguments."""
+	domains = db_manager.get_domains_with_sources()
+	if not domains:
+		return None
+	return next(iter(domains.values()))['sources'][0].source_name
+
+
+def make_leads(run_id: str, label: str, count: int, source_name: str, body_size: int = 1000) -> list[LeadData]:
+	now = datetime.now(timezone.utc)
+	body = ("Something knocked three times on the cellar door. " * (body_size // 50 + 1))[:body_size]
+	return [
+		LeadData(
+				title=f"Benchmark lead {label} #{i}",
+				url=f"{BENCH_URL_PREFIX}/{run_id}/{label}/{i}",
+				source_name=source_name,
+				publication_date=now - timedelta(seconds=i),
+				text=body,
+				html=f"<p>{body}</p>",
+				metadata={'score': i, 'author': 'bench'}
+		)
+		for i in range(count)
+	]
+
+
+def seed_leads(run_id: str, label: str, count: int, source_name: str, batch_size: int = 1000):
+	"""Files `count` synthetic leads in batches. Returns the number filed."""
+	filed = 0
+	for start in range(0, count, batch_size):
+		leads = make_leads(run_id, f"{label}-{start}", min(batch_size, count - start), source_name)
+		filed += sum(1 for v in db_manager.file_leads_bulk(leads).values() if v)
+	return filed
+
+
+def cleanup(run_id: str):
+	"""Removes every case/router/log/staging row a benchmark run created."""
+	pattern = f"{BENCH_URL_PREFIX}/{run_id}/%"
+	conn = db_manager.get_conn()
+	try:
+		with conn.cursor() as cur:
+			# case_content rows go with their case via ON DELETE CASCADE
+			cur.execute("DELETE FROM cases WHERE url LIKE %s", (pattern,))
+			cur.execute("""
+				DELETE FROM acquisition_log al
+				USING acquisition_router ar
+				WHERE al.lead_uuid = ar.lead_uuid AND ar.item_url LIKE %s
+			""", (pattern,))
+			# case_data_staging rows go with the router via ON DELETE CASCADE
+			cur.execute("DELETE FROM acquisition_router WHERE item_url LIKE %s", (pattern,))
+		conn.commit()
+	finally:
+		db_manager.release_conn(conn)
+
+
+def measure(fn, *args, **kwargs):
+	"""Runs fn once, returning (result, seconds, peak_bytes) from tracemalloc."""
+	tracemalloc.start()
+	start = time.perf_counter()
+	try:
+		result = fn(*args, **kwargs)
+		elapsed = time.perf_counter() - start
+		_, peak = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+	return result, elapsed, peak
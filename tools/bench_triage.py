@@ -0,0 +1,74 @@
+# ==========================================================
+# Hunter's Command Console - Triage Commit Benchmark
+# Seeds N synthetic staged leads, splits them into CASE /
+# NOT_CASE / SKIP decisions and times db_manager.process_triage()
+# for the whole batch. The training export goes to a temp dir.
+#
+#   python tools/bench_triage.py --sizes 500 1000 2000
+# ==========================================================
+
+import argparse
+import os
+import tempfile
+
+import bench_support
+from hunter import db_manager
+
+
+def _staged_uuids(run_id: str) -> list:
+	conn = db_manager.get_conn()
+	try:
+		with conn.cursor() as cur:
+			cur.execute("SELECT lead_uuid FROM acquisition_router WHERE item_url LIKE %s ORDER BY id",
+			            (f"{bench_support.BENCH_URL_PREFIX}/{run_id}/%",))
+			return [row[0] for row in cur.fetchall()]
+	finally:
+		db_manager.release_conn(conn)
+
+
+def _split_decisions(uuids: list) -> dict:
+	"""Roughly a triage session's mix: 20% cases, 60% not-a-case, 20% skipped."""
+	case_cut, skip_cut = len(uuids) // 5, len(uuids) - len(uuids) // 5
+	return {
+		'CASE':     uuids[:case_cut],
+		'NOT_CASE': uuids[case_cut:skip_cut],
+		'SKIP':     uuids[skip_cut:],
+	}
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark committing a triage batch.")
+	parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000], help="Triage batch sizes to test.")
+	parser.add_argument("--source", default=None, help="Existing source_name to seed under.")
+	args = parser.parse_args()
+
+	source_name = args.source or bench_support.default_source_name()
+	if not source_name:
+		print("[BENCH FATAL]: No active sources found. Pass --source.")
+		return
+
+	export_dir = tempfile.mkdtemp(prefix="bench_triage_")
+	db_manager.TRAINING_EXPORT_PATH = os.path.join(export_dir, "not_a_case.jsonl")
+
+	for size in args.sizes:
+		run_id = bench_support.new_run_id()
+		print(f"--- Seeding {size} staged leads (run {run_id}) ---")
+		try:
+			bench_support.seed_leads(run_id, "triage", size, source_name)
+			decisions = _split_decisions([str(u) for u in _staged_uuids(run_id)])
+
+			_, seconds, _ = bench_support.measure(db_manager.process_triage, decisions)
+
+			total = sum(len(v) for v in decisions.values())
+			print(f"process_triage : {total:>6} leads ({len(decisions['CASE'])} case / "
+			      f"{len(decisions['NOT_CASE'])} not / {len(decisions['SKIP'])} skip)  "
+			      f"{seconds * 1000:9.1f} ms  {seconds * 1e6 / max(total, 1):7.1f} us/lead")
+		finally:
+			bench_support.cleanup(run_id)
+
+	db_manager.close_training_writer()
+	print(f"\nTraining export written to {db_manager.TRAINING_EXPORT_PATH}")
+
+
+if __name__ == "__main__":
+	main()
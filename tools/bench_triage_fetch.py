@@ -0,0 +1,60 @@
+# ==========================================================
+# Hunter's Command Console - Triage Fetch Benchmark
+# Seeds N synthetic staged leads, then compares the old eager
+# get_unprocessed_leads() against streaming iter_triage_headers():
+# wall time, time to first page, and peak Python memory.
+#
+#   python tools/bench_triage_fetch.py --sizes 10000 100000
+# ==========================================================
+
+import argparse
+import time
+
+import bench_support
+from hunter import db_manager
+
+
+def _stream_all(page_size: int):
+	"""Drains the header stream, returning (row count, seconds to first page)."""
+	start = time.perf_counter()
+	first_page = None
+	count = 0
+	for page in db_manager.iter_triage_headers(page_size=page_size):
+		if first_page is None:
+			first_page = time.perf_counter() - start
+		count += len(page)
+	return count, first_page or 0.0
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark triage list loading.")
+	parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="Staged lead counts to test.")
+	parser.add_argument("--page-size", type=int, default=500)
+	parser.add_argument("--source", default=None, help="Existing source_name to seed under.")
+	args = parser.parse_args()
+
+	source_name = args.source or bench_support.default_source_name()
+	if not source_name:
+		print("[BENCH FATAL]: No active sources found. Pass --source.")
+		return
+
+	for size in args.sizes:
+		run_id = bench_support.new_run_id()
+		print(f"--- Seeding {size} staged leads (run {run_id}) ---")
+		try:
+			bench_support.seed_leads(run_id, "triage", size, source_name)
+
+			leads, eager_s, eager_peak = bench_support.measure(db_manager.get_unprocessed_leads)
+			(count, first_page_s), stream_s, stream_peak = bench_support.measure(_stream_all, args.page_size)
+
+			print(f"get_unprocessed_leads : {len(leads):>7} rows  {eager_s:8.3f}s  "
+			      f"peak {eager_peak / 1048576:8.1f} MiB")
+			print(f"iter_triage_headers   : {count:>7} rows  {stream_s:8.3f}s  "
+			      f"peak {stream_peak / 1048576:8.1f} MiB  first page {first_page_s * 1000:.1f} ms")
+			del leads
+		finally:
+			bench_support.cleanup(run_id)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,115 @@
+# ==========================================================
+# Hunter's Command Console - Case Search Pruning Check
+# EXPLAINs db_manager.search_cases() for a date range and fails
+# (exit 1) if the plan touches any cases / case_content partition
+# whose bounds don't overlap that range. Run it after changing the
+# search SQL or the partition layout.
+#
+#   python tools/check_case_pruning.py [--from 2025-09-01 --to 2025-10-01] [--query "missing hiker"]
+# ==========================================================
+
+import argparse
+import os
+import re
+import sys
+from datetime import datetime, timezone
+
+# --- Pathing Magic ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+# --- End Magic ---
+
+from hunter import db_manager
+
+PARTITIONED_TABLES = ("cases", "case_content")
+_BOUND_RE = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+def _partition_bounds(table: str) -> dict:
+	"""{partition name: (lower, upper)}; the DEFAULT partition maps to None."""
+	sql = """
+		SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+		FROM pg_inherits i
+				 JOIN pg_class c ON c.oid = i.inhrelid
+		WHERE i.inhparent = ('almanac.' || %s)::regclass;
+	"""
+	with db_manager.connection() as conn:
+		with conn.cursor() as cur:
+			cur.execute(sql, (table,))
+			rows = cur.fetchall()
+	bounds = {}
+	for name, expr in rows:
+		match = _BOUND_RE.search(expr or "")
+		bounds[name] = (datetime.fromisoformat(match.group(1)), datetime.fromisoformat(match.group(2))) if match else None
+	return bounds
+
+
+def _scanned_relations(plan: dict) -> set:
+	found = set()
+	if 'Relation Name' in plan:
+		found.add(plan['Relation Name'])
+	for child in plan.get('Plans', []):
+		found |= _scanned_relations(child)
+	return found
+
+
+def _default_range(bounds: dict):
+	"""The newest bounded partition's range, so the check runs without arguments."""
+	ranges = [b for b in bounds.values() if b]
+	if not ranges:
+		return None, None
+	return max(ranges)
+
+
+def _parse_date(value: str) -> datetime:
+	parsed = datetime.fromisoformat(value)
+	return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def check(date_from: datetime, date_to: datetime, query: str | None) -> bool:
+	plan = db_manager.explain_search_cases(query=query, date_from=date_from, date_to=date_to)
+	scanned = _scanned_relations(plan)
+	ok = True
+	for table in PARTITIONED_TABLES:
+		bounds = _partition_bounds(table)
+		allowed = {name for name, b in bounds.items()
+		           if b is None or (b[0] < date_to and b[1] > date_from)}
+		hit = {name for name in scanned if name in bounds}
+		if table == "case_content" and not query:
+			# An unfiltered listing never joins content
+			allowed = set()
+		stray = hit - allowed
+		print(f"  {table:<13} scanned {len(hit)}/{len(bounds)} partitions: {', '.join(sorted(hit)) or '-'}")
+		if stray:
+			ok = False
+			print(f"  [FAIL] not pruned: {', '.join(sorted(stray))}")
+	return ok
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Assert search_cases() prunes partitions by publication_date.")
+	parser.add_argument("--from", dest="date_from", help="Range start (ISO date). Default: newest partition.")
+	parser.add_argument("--to", dest="date_to", help="Range end, exclusive (ISO date).")
+	parser.add_argument("--query", default=None, help="Also check the ranked FTS form with this query.")
+	args = parser.parse_args()
+
+	if args.date_from and args.date_to:
+		date_from, date_to = _parse_date(args.date_from), _parse_date(args.date_to)
+	else:
+		date_from, date_to = _default_range(_partition_bounds("cases"))
+		if date_from is None:
+			print("[CHECK FATAL]: cases has no bounded partitions. Pass --from/--to.")
+			sys.exit(2)
+
+	print(f"--- search_cases pruning check: {date_from} -> {date_to} ---")
+	print("Listing (no query):")
+	ok = check(date_from, date_to, None)
+	print(f"Ranked FTS ({args.query or 'pruning'!r}):")
+	ok = check(date_from, date_to, args.query or "pruning") and ok
+
+	print("\nPASS: only overlapping partitions are scanned." if ok else "\nFAIL: partition pruning is not happening.")
+	sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,68 @@
+# ==========================================================
+# Hunter's Command Console - Partition Maintenance
+# Pre-creates monthly partitions for cases, case_content and
+# acquisition_log, drains rows that landed in the DEFAULT
+# partitions, and prints a size report. With --retain-months it
+# also retires old acquisition_log partitions into the daily
+# rollup and archives (or drops) them. Run it monthly (cron /
+# Task Scheduler) as the admin user.
+#
+#   python tools/partition_maintenance.py [--months-ahead 3] [--dry-run]
+#   python tools/partition_maintenance.py --retain-months 3 [--drop | --archive-dir D:/log_archives]
+#   python tools/partition_maintenance.py --report-only
+# ==========================================================
+
+import argparse
+import os
+import sys
+
+# --- Pathing Magic ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+# --- End Magic ---
+
+from hunter.admin import partition_manager
+
+
+def _human_size(num_bytes: int) -> str:
+	for unit in ("B", "KB", "MB", "GB"):
+		if num_bytes < 1024:
+			return f"{num_bytes:.0f} {unit}"
+		num_bytes /= 1024
+	return f"{num_bytes:.1f} TB"
+
+
+def print_report():
+	report = partition_manager.partition_report()
+	if not report:
+		print("[PARTITIONS]: No report (could not connect?).")
+		return
+	print(f"\n{'partition':<28} {'from':<12} {'to':<12} {'~rows':>10} {'size':>10}")
+	for parent, name, lower, upper, rows, size in report:
+		lower_s = f"{lower:%Y-%m-%d}" if lower else "DEFAULT"
+		upper_s = f"{upper:%Y-%m-%d}" if upper else ""
+		print(f"{name:<28} {lower_s:<12} {upper_s:<12} {rows:>10} {_human_size(size):>10}")
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Create upcoming monthly partitions and drain DEFAULT partitions.")
+	parser.add_argument("--months-ahead", type=int, default=partition_manager.DEFAULT_MONTHS_AHEAD)
+	parser.add_argument("--batch-size", type=int, default=partition_manager.DEFAULT_BATCH_SIZE,
+	                    help="Rows per committed batch when draining acquisition_log_default.")
+	parser.add_argument("--dry-run", action="store_true", help="Show what would be created or moved.")
+	parser.add_argument("--report-only", action="store_true", help="Only print the partition size report.")
+	parser.add_argument("--retain-months", type=int, default=None,
+	                    help="Retire acquisition_log partitions older than this many months.")
+	parser.add_argument("--drop", action="store_true", help="Drop retired partitions instead of archiving them.")
+	parser.add_argument("--archive-dir", default=partition_manager.ARCHIVE_DIR)
+	args = parser.parse_args()
+
+	print("--- Hunter's Almanac Partition Maintenance ---")
+	ok = True
+	if not args.report_only:
+		ok = partition_manager.run_maintenance(args.months_ahead, args.batch_size, args.dry_run)
+		if args.retain_months is not None:
+			mode = "drop" if args.drop else "archive"
+			ok = partition_manager.apply_retention(args.retain_months, mode, args.archive_dir, args.dry_run) and ok
+	print_report()
+	sys.exit(0 if ok else 1)
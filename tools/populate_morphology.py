@@ -14,7 +14,7 @@ from hunter.utils.path_utils import setup_project_path
 setup_project_path()
 # --- End Pathing ---
 
-from hunter import config_manager, db_admin, db_manager
+from hunter import config_manager, db_admin, db_manager, rate_limiter
 
 # Track state
 processed_words = set()
@@ -31,11 +31,14 @@ def fetch_word_from_api(word, api_key, api_host):
 		"x-rapidapi-host": api_host
 	}
 
+	limiter = rate_limiter.get_limiter('wordsapi')
 	try:
+		limiter.acquire()
 		response = requests.get(url, headers=headers, timeout=10)
 
-		# Log the API call with rate limit info
+		# Log the API call with rate limit info, and let the limiter track the plan quota
 		db_admin.log_api_call('wordsapi', f'/words/{word}', word, response.status_code, response.headers)
+		limiter.observe_headers(response.headers, response.status_code)
 
 		if response.status_code == 200:
 			return response.json()
@@ -45,6 +48,9 @@ def fetch_word_from_api(word, api_key, api_host):
 		else:
 			print(f"  ⚠️  API error for '{word}': {response.status_code}")
 			return None
+	except rate_limiter.RateLimitExceeded as e:
+		print(f"  ⚠️  {e}")
+		return None
 	except requests.exceptions.RequestException as e:
 		print(f"  ❌ Network error fetching '{word}': {e}")
 		return None
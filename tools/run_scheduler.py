@@ -0,0 +1,86 @@
+# ==========================================================
+# Hunter's Command Console - Headless Hunt Scheduler
+# Runs the per-source hunt scheduler without the GUI: each
+# source is hunted when it's due (sources.next_due_at), and
+# its next slot is picked from its cadence, hit rate and
+# failure count. Runs until Ctrl+C, or with --once hunts
+# whatever is due and exits (for cron / Task Scheduler).
+#
+#   python tools/run_scheduler.py [--mode async] [--interval-minutes 60]
+#   python tools/run_scheduler.py --once
+#   python tools/run_scheduler.py --show
+# ==========================================================
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+# --- Pathing Magic ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+# --- End Magic ---
+
+from hunter import config_manager, db_manager
+from hunter.dispatcher import Dispatcher, AsyncDispatcher, ASYNC_EXECUTOR_WORKERS
+from hunter.scheduler import HuntScheduler, DEFAULT_INTERVAL
+from hunter.utils import logger_setup
+
+
+def show_schedule(purpose: str):
+	now = datetime.now(timezone.utc)
+	sources = [source for info in db_manager.get_domains_with_sources(purpose).values() for source in info['sources']]
+	sources.sort(key=lambda source: source.next_due_at or now)
+	print(f"\n{'source':<32} {'due in':>10} {'interval':>10} {'hit rate':>9} {'failures':>9}")
+	for source in sources:
+		due_in = max((source.next_due_at or now) - now, timedelta(0))
+		interval = f"{source.poll_interval.total_seconds() / 60:.0f}m" if source.poll_interval else "default"
+		print(f"{source.source_name[:32]:<32} {due_in.total_seconds() / 60:9.0f}m {interval:>10} "
+		      f"{source.hit_rate:9.2f} {source.consecutive_failures or 0:9d}")
+
+
+def main():
+	scheduler_config = config_manager.get_scheduler_config()
+	dispatcher_config = config_manager.get_dispatcher_config()
+
+	parser = argparse.ArgumentParser(description="Run the per-source hunt scheduler without the GUI.")
+	parser.add_argument("--mode", choices=("threaded", "async"),
+	                    default=dispatcher_config.get('mode', 'threaded').lower())
+	parser.add_argument("--interval-minutes", type=float,
+	                    default=float(scheduler_config.get('default_interval_minutes',
+	                                                       DEFAULT_INTERVAL.total_seconds() / 60)),
+	                    help="Base cadence for sources without their own poll_interval.")
+	parser.add_argument("--purpose", default='lead_generation')
+	parser.add_argument("--once", action="store_true", help="Hunt whatever is due now, then exit.")
+	parser.add_argument("--show", action="store_true", help="Print the current schedule and exit.")
+	args = parser.parse_args()
+
+	if args.show:
+		show_schedule(args.purpose)
+		return
+
+	logger_setup.setup_logging()
+	if args.mode == 'async':
+		workers = int(dispatcher_config.get('async_workers', ASYNC_EXECUTOR_WORKERS))
+		dispatcher = AsyncDispatcher(config_manager, executor_workers=workers)
+	else:
+		dispatcher = Dispatcher(config_manager)
+	scheduler = HuntScheduler(dispatcher, purpose=args.purpose,
+	                          default_interval=timedelta(minutes=args.interval_minutes))
+
+	if args.once:
+		print(f"[SCHEDULER]: Hunted {scheduler.run_due()} due sources.")
+		return
+
+	scheduler.start()
+	print("[SCHEDULER]: Running. Ctrl+C to stop (after the current hunt).")
+	try:
+		while scheduler.is_running():
+			time.sleep(1)
+	except KeyboardInterrupt:
+		scheduler.stop()
+
+
+if __name__ == "__main__":
+	main()
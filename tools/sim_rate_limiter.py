@@ -0,0 +1,231 @@
+# ==========================================================
+# Hunter's Command Console - Rate Limiter Simulation
+# Drives hunter/rate_limiter.py on a simulated clock (no
+# network, no sleeping) against mock APIs that enforce their
+# own limits and answer with rate-limit headers, 429s and
+# Retry-After. Concurrent agent workers are simulated as
+# events: each asks the limiter for a slot, waits if told to,
+# and sees its response (and headers) after a fixed latency.
+#
+# Scenarios:
+#   reddit   - 100 requests/60s window, X-Ratelimit-* headers;
+#              no limiter vs. configured bucket vs. headers only
+#   quota    - GNews-style daily quota across a UTC midnight
+#   global   - two uncapped domains under one global cap
+#   retry    - a 429 with Retry-After pauses the whole domain
+#
+# Each scenario checks its expectations and the script exits
+# non-zero if any fail.
+#
+#   python tools/sim_rate_limiter.py [--workers 16] [--requests 1000] [--latency-ms 300]
+# ==========================================================
+
+import argparse
+import heapq
+import itertools
+import os
+import sys
+
+# --- Pathing Magic ---
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+# --- End Magic ---
+
+from hunter.rate_limiter import DomainRateLimiter, RateLimitExceeded, TokenBucket
+
+
+class SimClock:
+	def __init__(self, start: float = 0.0):
+		self.now = start
+
+	def __call__(self) -> float:
+		return self.now
+
+	def sleep(self, seconds: float):
+		self.now += seconds
+
+
+class WindowedAPI:
+	"""Allows `limit` requests per fixed `window` seconds; beyond that answers 429 + Retry-After."""
+
+	def __init__(self, clock: SimClock, limit: int, window: float, header_style: str = 'reddit'):
+		self.clock = clock
+		self.limit = limit
+		self.window = window
+		self.header_style = header_style
+		self.ok = 0
+		self.rejected = 0
+		self.outage_until = 0.0
+
+	def request(self) -> tuple:
+		now = self.clock()
+		window_start = now // self.window * self.window
+		if getattr(self, '_window_start', None) != window_start:
+			self._window_start, self._used = window_start, 0
+		reset_in = window_start + self.window - now
+		if now < self.outage_until:
+			self.rejected += 1
+			return 429, {'Retry-After': str(round(self.outage_until - now))}
+		if self._used >= self.limit:
+			self.rejected += 1
+			return 429, {'Retry-After': str(round(reset_in)), **self._headers(0, reset_in)}
+		self._used += 1
+		self.ok += 1
+		return 200, self._headers(self.limit - self._used, reset_in)
+
+	def _headers(self, remaining: int, reset_in: float) -> dict:
+		if self.header_style == 'reddit':
+			return {'X-Ratelimit-Remaining': str(remaining), 'X-Ratelimit-Reset': str(round(reset_in)),
+			        'X-Ratelimit-Used': str(self.limit - remaining)}
+		if self.header_style == 'rapidapi':
+			return {'x-ratelimit-requests-remaining': str(remaining),
+			        'x-ratelimit-requests-reset': str(round(reset_in)),
+			        'x-ratelimit-requests-limit': str(self.limit)}
+		return {}
+
+
+def simulate(clock: SimClock, jobs: list, workers: int, latency: float, use_headers: bool = True) -> dict:
+	"""
+	Event-driven run of `workers` concurrent workers over `jobs` [(limiter or None, api)].
+	Each job is retried after a 429 until it succeeds. Returns counts and simulated seconds.
+	"""
+	start = clock()
+	seq = itertools.count()
+	pending = list(reversed(jobs))
+	events = [(start, next(seq), 'ready', None) for _ in range(min(workers, len(jobs)))]
+	heapq.heapify(events)
+	result = {'ok': 0, '429': 0}
+	while events:
+		at, _, kind, job = heapq.heappop(events)
+		clock.now = at
+		if kind == 'ready':
+			if job is None:
+				if not pending:
+					continue
+				job = pending.pop()
+			limiter, api = job
+			wait = limiter.reserve() if limiter else 0.0
+			if wait > 0:
+				heapq.heappush(events, (at + wait, next(seq), 'ready', job))
+				continue
+			status, headers = api.request()
+			heapq.heappush(events, (at + latency, next(seq), 'response', (job, status, headers)))
+		else:
+			(limiter, api), status, headers = job
+			if limiter and use_headers:
+				limiter.observe_headers(headers, status)
+			if status == 429:
+				result['429'] += 1
+				heapq.heappush(events, (at, next(seq), 'ready', (limiter, api)))
+			else:
+				result['ok'] += 1
+				heapq.heappush(events, (at, next(seq), 'ready', None))
+	result['seconds'] = clock() - start
+	return result
+
+
+def _line(label: str, r: dict):
+	rate = r['ok'] / r['seconds'] * 60 if r['seconds'] else 0.0
+	print(f"  {label:<30} ok {r['ok']:6d}  429s {r['429']:5d}  {r['seconds']:8.0f}s  {rate:7.1f} req/min")
+
+
+def scenario_reddit(args) -> list:
+	print("\n[reddit] 100 requests per 60s window, X-Ratelimit-* headers")
+	failures = []
+	runs = {}
+	for label, make in (
+			("no limiter", lambda c: None),
+			("bucket 90/min, headers ignored", lambda c: DomainRateLimiter('reddit', 90, 5, clock=c, wall_clock=c)),
+			("headers only (uncapped)", lambda c: DomainRateLimiter('reddit', clock=c, wall_clock=c)),
+			("bucket 90/min + headers", lambda c: DomainRateLimiter('reddit', 90, 5, clock=c, wall_clock=c)),
+	):
+		clock = SimClock()
+		api = WindowedAPI(clock, 100, 60)
+		limiter = make(clock)
+		runs[label] = simulate(clock, [(limiter, api)] * args.requests, args.workers, args.latency_ms / 1000,
+		                       use_headers=label != "bucket 90/min, headers ignored")
+		_line(label, runs[label])
+
+	if runs["no limiter"]['429'] < args.requests // 2:
+		failures.append("reddit: expected a 429 storm without a limiter")
+	if runs["bucket 90/min + headers"]['429'] > 0:
+		failures.append("reddit: configured bucket + headers still drew 429s")
+	if runs["headers only (uncapped)"]['429'] > args.workers:
+		failures.append("reddit: header pacing alone drew more than one 429 per worker")
+	if runs["headers only (uncapped)"]['seconds'] > runs["no limiter"]['seconds'] * 1.15:
+		failures.append("reddit: header pacing finished much later than hammering through 429s")
+	return failures
+
+
+def scenario_quota(args) -> list:
+	print("\n[quota] daily_quota=100, one request every 5 minutes from 20:00 UTC for 30 hours")
+	clock = SimClock(start=20 * 3600)
+	limiter = DomainRateLimiter('gnews', daily_quota=100, clock=clock, wall_clock=clock, sleep=clock.sleep)
+	granted = {}
+	for _ in range(30 * 12):
+		day = int(clock() // 86400)
+		try:
+			limiter.acquire(max_wait=60)
+			granted[day] = granted.get(day, 0) + 1
+		except RateLimitExceeded:
+			pass
+		clock.now += 300
+	print(f"  granted per UTC day: {granted}, rejected {limiter.stats['rejected']}")
+	failures = []
+	if any(count > 100 for count in granted.values()):
+		failures.append("quota: more than daily_quota requests in one day")
+	if granted.get(1, 0) != 100:
+		failures.append("quota: the quota didn't come back at midnight")
+	return failures
+
+
+def scenario_global(args) -> list:
+	print("\n[global] two uncapped domains sharing a 5 req/s global cap")
+	clock = SimClock()
+	global_bucket = TokenBucket(5.0, 5, clock)
+	jobs = []
+	for name in ('alpha', 'beta'):
+		limiter = DomainRateLimiter(name, global_bucket=global_bucket, clock=clock, wall_clock=clock)
+		jobs += [(limiter, WindowedAPI(clock, 10 ** 9, 60, header_style=None))] * (args.requests // 2)
+	r = simulate(clock, jobs, args.workers, args.latency_ms / 1000)
+	_line("global 5/s", r)
+	rate = r['ok'] / r['seconds']
+	return [] if rate <= 5.0 * 1.05 + 5 / r['seconds'] else [f"global: {rate:.2f} req/s exceeds the 5/s cap"]
+
+
+def scenario_retry(args) -> list:
+	print("\n[retry] 429 + Retry-After: 30 at t=10s")
+	clock = SimClock()
+	api = WindowedAPI(clock, 10 ** 9, 60, header_style=None)
+	limiter = DomainRateLimiter('flaky', 600, 10, clock=clock, wall_clock=clock)
+	api.outage_until = 40.0
+	clock.now = 10.0
+	r = simulate(clock, [(limiter, api)] * 100, args.workers, args.latency_ms / 1000)
+	_line("600/min, outage 10-40s", r)
+	# The first wave in flight can hit the outage; after that the pause holds everyone back
+	return [] if r['429'] <= args.workers else [f"retry: {r['429']} 429s; the domain didn't pause"]
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Simulated-clock checks for the agent rate limiter.")
+	parser.add_argument("--workers", type=int, default=16, help="Concurrent agent workers per domain.")
+	parser.add_argument("--requests", type=int, default=1000)
+	parser.add_argument("--latency-ms", type=float, default=300.0)
+	parser.add_argument("--scenario", choices=("reddit", "quota", "global", "retry"), action="append")
+	args = parser.parse_args()
+
+	scenarios = {'reddit': scenario_reddit, 'quota': scenario_quota, 'global': scenario_global,
+	             'retry': scenario_retry}
+	failures = []
+	for name in args.scenario or scenarios:
+		failures += scenarios[name](args)
+
+	print()
+	for failure in failures:
+		print(f"[FAIL] {failure}")
+	print("[SIM]: All scenarios passed." if not failures else f"[SIM]: {len(failures)} check(s) failed.")
+	sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+	main()